@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""Benchmark every build script: wall time, peak memory and output size.
+
+Runs the same tasks ``build_all.py`` discovers (diagrams, carousels, decks
+under ``examples/*``, ``output/*`` and ``scripts/``), one at a time, each in
+a fresh subprocess:
+
+    cold   empty build cache (a new ELECTRUM_CACHE_DIR), --force
+    warm   the cache the cold run left behind, --force
+    noop   the same, without --force: start-up plus the up-to-date check
+
+Each carousel also gets a ``[both]`` task (PDF and PPTX in one run) next
+to its ``[pdf]`` and ``[pptx]`` ones, to show what building a single
+format saves.
+
+Each task is run ``--repeat`` times per mode and the fastest time kept; peak
+RSS is the largest seen. Output bytes are the sizes of the files the task
+recorded in its manifest. Results are written as JSON (``-o``); with
+``--compare OLD.json`` every metric that grew by more than ``--threshold``
+percent is flagged and the exit status is 1.
+
+Builds write their usual outputs into the product folders, so run this on a
+clean checkout and discard the regenerated files afterwards.
+
+Usage:
+    python scripts/benchmark.py -o before.json
+    python scripts/benchmark.py -o after.json --compare before.json --threshold 10
+    python scripts/benchmark.py examples/shusher --repeat 5
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from build_all import CAROUSEL_SCRIPT, DEFAULT_ROOTS, Task, discover, product_dirs
+from toolkit.cache import REPO_ROOT, cache_dir
+
+BENCH_ROOTS = DEFAULT_ROOTS + ("scripts",)
+METRICS = ("cold_s", "warm_s", "noop_s", "peak_rss_mb", "output_bytes")
+NOISE_S = 0.05  # time differences below this are never regressions
+
+
+class BenchmarkError(RuntimeError):
+    """Raised when a benchmarked build fails."""
+
+
+def _run(task, cache, force=True):
+    """Run ``task`` once against ``cache``; returns (seconds, peak RSS in MB)."""
+    cmd = [sys.executable, task.script, *task.args] + (["--force"] if force else [])
+    env = {k: v for k, v in os.environ.items()
+           if k not in ("ELECTRUM_PROFILE", "ELECTRUM_FORCE")}
+    env.update(MPLBACKEND="Agg", ELECTRUM_CACHE_DIR=cache)
+    with tempfile.TemporaryFile("w+") as log:
+        start = time.perf_counter()
+        proc = subprocess.Popen(cmd, cwd=task.folder or os.path.dirname(task.script), env=env,
+                                stdout=log, stderr=subprocess.STDOUT, text=True)
+        _, status, usage = os.wait4(proc.pid, 0)
+        seconds = time.perf_counter() - start
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        if proc.returncode:
+            log.seek(0)
+            raise BenchmarkError(f"{task.name} failed:\n{log.read()}")
+    # On Linux a reaped child's ru_maxrss also covers the workers it reaped
+    # (its process pools), so this is the largest process of the build.
+    return seconds, usage.ru_maxrss / 1024
+
+
+def _output_bytes(task, cache):
+    """Total size of the outputs ``task`` recorded in the manifest under ``cache``."""
+    with open(os.path.join(cache, "manifest.json")) as f:
+        artifacts = json.load(f)["artifacts"].values()
+    script = os.path.relpath(task.script, REPO_ROOT).replace(os.sep, "/")
+    prefix = os.path.relpath(task.folder, REPO_ROOT).replace(os.sep, "/") + "/" \
+        if task.folder else ""
+    total = 0
+    for entry in artifacts:
+        if entry["script"] != script:
+            continue
+        for out in entry["outputs"]:
+            if out.endswith(task.suffix) and out.startswith(prefix):
+                total += os.path.getsize(os.path.join(REPO_ROOT, out))
+    return total
+
+
+def with_combined_formats(tasks):
+    """``tasks`` plus a ``[both]`` carousel task after each folder's format tasks."""
+    out, seen = [], set()
+    for t in tasks:
+        out.append(t)
+        if t.script == CAROUSEL_SCRIPT and t.folder not in seen and t.suffix == ".pptx":
+            seen.add(t.folder)
+            name = t.name.rsplit(" [", 1)[0] + " [both]"
+            out.append(Task(name, t.script, [t.folder, "--format", "both"], list(t.deps), "",
+                            t.folder))
+    return out
+
+
+def bench(task, repeat):
+    cold, warm, noop, rss = [], [], [], 0.0
+    for _ in range(repeat):
+        cache = tempfile.mkdtemp(prefix="electrum-bench-")
+        try:
+            seconds, mb = _run(task, cache)
+            cold.append(seconds)
+            rss = max(rss, mb)
+            seconds, mb = _run(task, cache)
+            warm.append(seconds)
+            rss = max(rss, mb)
+            noop.append(_run(task, cache, force=False)[0])
+            size = _output_bytes(task, cache)
+        finally:
+            shutil.rmtree(cache, ignore_errors=True)
+    return {"cold_s": round(min(cold), 4), "warm_s": round(min(warm), 4),
+            "noop_s": round(min(noop), 4), "peak_rss_mb": round(rss, 1), "output_bytes": size}
+
+
+def _git_rev():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(old, new, threshold):
+    """Print each task's change against ``old``; returns the regressed (task, metric)s."""
+    regressions = []
+    width = max(len(n) for n in new["tasks"])
+    print(f"\n{'Task':<{width}}  " + "  ".join(f"{m:>20}" for m in METRICS))
+    for name, result in new["tasks"].items():
+        before = old["tasks"].get(name)
+        if before is None:
+            print(f"{name:<{width}}  (new)")
+            continue
+        cells = []
+        for m in METRICS:
+            a, b = before.get(m), result[m]
+            if not a:
+                cells.append(f"{b:>20}")
+                continue
+            pct = 100.0 * (b - a) / a
+            slower = pct > threshold and not (m.endswith("_s") and b - a < NOISE_S)
+            if slower:
+                regressions.append((name, m))
+            cells.append(f"{b:>11} {pct:>+6.1f}%{' !' if slower else '  '}")
+        print(f"{name:<{width}}  " + "  ".join(cells))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("dirs", nargs="*", help="product folders or parents of product folders "
+                        f"(default: {' '.join(BENCH_ROOTS)})")
+    parser.add_argument("-o", "--output", help="results JSON "
+                        "(default: .electrum-cache/benchmarks/<time>.json)")
+    parser.add_argument("-n", "--repeat", type=int, default=3,
+                        help="runs per task and mode; the fastest counts (default: 3)")
+    parser.add_argument("--compare", metavar="OLD.json", help="earlier results to compare with")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="percent growth reported as a regression (default: 10)")
+    parser.add_argument("-k", "--match", help="only tasks whose name contains this")
+    args = parser.parse_args()
+
+    tasks = with_combined_formats(discover(product_dirs(args.dirs or BENCH_ROOTS)))
+    if args.match:
+        tasks = [t for t in tasks if args.match in t.name]
+    if not tasks:
+        print("No build scripts found.")
+        return 0
+
+    results = {
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_rev(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "repeat": args.repeat,
+        "tasks": {},
+    }
+    width = max(len(t.name) for t in tasks)
+    print(f"{'Task':<{width}}  {'Cold':>7}  {'Warm':>7}  {'No-op':>7}  {'RSS':>8}  {'Output':>10}")
+    for t in tasks:
+        try:
+            r = results["tasks"][t.name] = bench(t, max(1, args.repeat))
+        except BenchmarkError as e:
+            print(e)
+            return 1
+        print(f"{t.name:<{width}}  {r['cold_s']:>6.2f}s  {r['warm_s']:>6.2f}s  "
+              f"{r['noop_s']:>6.2f}s  {r['peak_rss_mb']:>5.0f} MB  "
+              f"{r['output_bytes'] / 1024:>7.0f} KB")
+
+    path = args.output or os.path.join(
+        cache_dir("benchmarks"), time.strftime("%Y%m%d-%H%M%S") + ".json")
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {path}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)
+        regressions = compare(old, results, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:g}%: "
+                  + ", ".join(f"{n} {m}" for n, m in regressions))
+            return 1
+        print(f"\nNo regressions above {args.threshold:g}%.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
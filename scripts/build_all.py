@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""Rebuild the diagrams, carousels and decks of every product folder.
+
+Discovers the per-product build scripts and carousel content under
+``examples/*`` and ``output/*`` (or the folders given on the command line)
+and runs them as a dependency graph on ``-j N`` worker processes:
+
+    block_diagram.yaml, arrangement_viz.py, visualize.py (diagram PNGs)
+        -> scripts/build_carousel.py <dir> --format pdf  (independent leaves)
+        -> scripts/build_carousel.py <dir> --format pptx
+        -> build_*deck*.py
+
+A folder gets carousel tasks when it has a ``carousel.yaml`` (or a
+``high_level_design.md`` with YAML front matter); see ``toolkit.content``.
+A ``block_diagram.yaml`` spec is rendered by ``scripts/render_diagram.py``
+(see ``toolkit.diagram``).
+
+Tasks whose recorded build is still current (see ``toolkit.manifest``) are
+skipped without starting a process. The first failure stops the run: no new
+tasks are started, the ones in flight finish, and the failing output is
+printed. A per-task timing summary closes every run.
+
+With ``--watch`` the run is followed by a loop that waits for files under
+the product folders or ``scripts/`` to change (``toolkit.watch``: inotify,
+or polling with ``--poll``), collects a burst of saves into one change set
+and reruns only the tasks that read one of the changed files, according to
+the manifest, plus the tasks downstream of them. A file no recorded build
+has read yet (a new Markdown file) reruns its folder's tasks. Within a
+carousel only the pages whose content changed are drawn again (the page
+caches of ``toolkit.pdf_backend`` and ``toolkit.raster_backend``). Each
+rebuild prints its latency from the save to the finished outputs.
+
+Usage:
+    python scripts/build_all.py
+    python scripts/build_all.py -j 4 examples/shusher examples/metronome
+    python scripts/build_all.py --force
+    python scripts/build_all.py --watch examples/shusher
+"""
+
+import argparse
+import glob
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import List
+
+from toolkit import content, manifest, watch
+from toolkit.cache import REPO_ROOT
+
+DEFAULT_ROOTS = ("examples", "output")
+DIAGRAM_SCRIPTS = ("arrangement_viz.py", "visualize.py")
+DIAGRAM_SPEC = "block_diagram.yaml"
+RENDER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "render_diagram.py")
+CAROUSEL_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "build_carousel.py")
+CAROUSEL_FORMATS = ("pdf", "pptx")
+DECK_PATTERN = "build_*deck*.py"
+
+
+@dataclass
+class Task:
+    name: str
+    script: str
+    args: List[str] = field(default_factory=list)
+    deps: List[str] = field(default_factory=list)
+    suffix: str = ""  # output extension, for the manifest shortcut
+    folder: str = ""  # product folder, for scripts shared between products
+
+
+@dataclass
+class Result:
+    status: str  # "built", "up to date", "failed", "skipped"
+    seconds: float = 0.0
+    output: str = ""
+
+
+def _rel(path):
+    return os.path.relpath(path, REPO_ROOT)
+
+
+def has_carousel(d):
+    if os.path.exists(os.path.join(d, content.CONTENT_FILE)):
+        return True
+    design = os.path.join(d, content.DESIGN_FILE)
+    if not os.path.exists(design):
+        return False
+    with open(design, encoding="utf-8") as f:
+        return f.readline().strip() == "---"
+
+
+def product_dirs(roots):
+    dirs = []
+    for root in roots:
+        root = os.path.join(REPO_ROOT, root) if not os.path.isabs(root) else root
+        if any(os.path.exists(os.path.join(root, s)) for s in DIAGRAM_SCRIPTS + (DIAGRAM_SPEC,)) \
+                or glob.glob(os.path.join(root, DECK_PATTERN)) or has_carousel(root):
+            dirs.append(root)
+        else:
+            dirs.extend(sorted(d for d in glob.glob(os.path.join(root, "*")) if os.path.isdir(d)))
+    return dirs
+
+
+def discover(dirs):
+    """Build the task graph for the given product folders."""
+    tasks = []
+    for d in dirs:
+        diagrams = []
+        spec = os.path.join(d, DIAGRAM_SPEC)
+        if os.path.exists(spec):
+            tasks.append(Task(_rel(spec), RENDER_SCRIPT, [spec], folder=d))
+            diagrams.append(_rel(spec))
+        for name in DIAGRAM_SCRIPTS:
+            script = os.path.join(d, name)
+            if os.path.exists(script):
+                tasks.append(Task(_rel(script), script, suffix=".png"))
+                diagrams.append(_rel(script))
+
+        if has_carousel(d):
+            for fmt in CAROUSEL_FORMATS:
+                tasks.append(Task(f"{_rel(d)} carousel [{fmt}]", CAROUSEL_SCRIPT,
+                                  [d, "--format", fmt], list(diagrams), "." + fmt, d))
+        for deck in sorted(glob.glob(os.path.join(d, DECK_PATTERN))):
+            tasks.append(Task(_rel(deck), deck, deps=list(diagrams), suffix=".pptx"))
+    return tasks
+
+
+def _execute(task, force):
+    cmd = [sys.executable, task.script, *task.args] + (["--force"] if force else [])
+    env = dict(os.environ, MPLBACKEND="Agg")
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=task.folder or os.path.dirname(task.script), env=env,
+                          stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    seconds = time.perf_counter() - start
+    if proc.returncode:
+        return Result("failed", seconds, proc.stdout)
+    up_to_date = proc.stdout.startswith("Up to date:")
+    return Result("up to date" if up_to_date else "built", seconds, proc.stdout)
+
+
+def run(tasks, jobs, force=False, verbose=False, shortcut=True):
+    """Run ``tasks`` respecting their deps; stop scheduling at the first failure.
+
+    With ``shortcut``, tasks the manifest shows as current are not started;
+    without, each script makes that check itself, which also sees inputs
+    no build has recorded yet.
+    """
+    results = {}
+    pending = {t.name: t for t in tasks}
+    running = {}
+    failed = False
+    names = set(pending)  # deps outside ``tasks`` (a watch rebuild) count as built
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            progressed = True
+            while not failed and progressed and len(running) < jobs:
+                progressed = False
+                for name, task in list(pending.items()):
+                    if len(running) >= jobs:
+                        break
+                    if any(dep in names and results.get(dep, Result("")).status
+                           not in ("built", "up to date") for dep in task.deps):
+                        continue
+                    del pending[name]
+                    progressed = True
+                    if shortcut and not force and manifest.script_is_fresh(
+                            task.script, task.suffix, task.folder or None):
+                        results[name] = Result("up to date")
+                        continue
+                    running[pool.submit(_execute, task, force)] = task
+
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                task = running.pop(future)
+                result = results[task.name] = future.result()
+                if verbose and result.output:
+                    print(result.output, end="")
+                if result.status == "failed":
+                    failed = True
+
+    for name in pending:
+        results[name] = Result("skipped")
+    return results
+
+
+def print_summary(tasks, results, wall, jobs):
+    width = max(len(t.name) for t in tasks)
+    print(f"\n{'Task':<{width}}  {'Status':<10}  {'Time':>7}")
+    for t in tasks:
+        r = results[t.name]
+        print(f"{t.name:<{width}}  {r.status:<10}  {r.seconds:>6.2f}s")
+    counts = {}
+    for r in results.values():
+        counts[r.status] = counts.get(r.status, 0) + 1
+    work = sum(r.seconds for r in results.values())
+    tally = ", ".join(f"{n} {s}" for s, n in sorted(counts.items()))
+    print(f"\n{len(tasks)} tasks: {tally} in {wall:.2f}s wall ({work:.2f}s of work, -j {jobs})")
+
+
+def _folder(task):
+    return os.path.abspath(task.folder or os.path.dirname(task.script))
+
+
+def _produces(task, script, outputs):
+    """True if a recorded build of ``script`` writing ``outputs`` is ``task``'s."""
+    if os.path.abspath(task.script) != script:
+        return False
+    prefix = _folder(task) + os.sep
+    return any(o.endswith(task.suffix) and o.startswith(prefix) for o in outputs)
+
+
+def affected(tasks, changed):
+    """The tasks to rerun for the files in ``changed``, in ``tasks`` order.
+
+    A task is affected when its recorded build read a changed file, when
+    it is the changed script, or, for files no build has read yet, when
+    the file is in its folder; then every task depending on an affected
+    one is too.
+    """
+    changed = {os.path.abspath(p) for p in changed}
+    recorded, _ = manifest.recorded_files()
+    hit = {t.name for t in tasks if os.path.abspath(t.script) in changed}
+    for script, outputs in manifest.builds_using(changed):
+        hit.update(t.name for t in tasks if _produces(t, script, outputs))
+    unknown = changed - recorded
+    hit.update(t.name for t in tasks
+               if any(p.startswith(_folder(t) + os.sep) for p in unknown))
+    grew = True
+    while grew:
+        before = len(hit)
+        hit.update(t.name for t in tasks if hit.intersection(t.deps))
+        grew = len(hit) > before
+    return [t for t in tasks if t.name in hit]
+
+
+def _is_output(path, outputs):
+    return any(path == o or path.startswith(o + os.sep) for o in outputs)
+
+
+def watch_loop(tasks, dirs, jobs, verbose=False, poll=False):
+    """Rebuild the tasks affected by each burst of file changes, until interrupted."""
+    roots = sorted(set(dirs) | {os.path.dirname(CAROUSEL_SCRIPT)})
+    watcher = watch.watcher(roots, poll)
+    print(f"\nWatching {len(roots)} folders ({type(watcher).__name__}); Ctrl-C to stop.")
+    try:
+        while True:
+            changed = watcher.changes()
+            manifest.reload()
+            _, outputs = manifest.recorded_files()
+            changed = {p for p in changed if not _is_output(p, outputs)}
+            todo = affected(tasks, changed)
+            if not todo:
+                continue
+            saved = max((os.path.getmtime(p) for p in changed if os.path.exists(p)),
+                        default=time.time())
+            start = time.perf_counter()
+            results = run(todo, jobs, verbose=verbose, shortcut=False)
+            wall = time.perf_counter() - start
+            names = ", ".join(_rel(p) for p in sorted(changed)[:3])
+            more = f" and {len(changed) - 3} more" if len(changed) > 3 else ""
+            print(f"\nChanged: {names}{more}")
+            for t in todo:
+                r = results[t.name]
+                print(f"  {t.name}: {r.status} ({r.seconds:.2f}s)")
+                if r.status == "failed":
+                    print(r.output, end="")
+            print(f"Rebuilt in {wall:.2f}s, {time.time() - saved:.2f}s after the save")
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        watcher.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("dirs", nargs="*", help="product folders or parents of product folders "
+                        f"(default: {' '.join(DEFAULT_ROOTS)})")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="rebuild everything")
+    parser.add_argument("-v", "--verbose", action="store_true", help="show each script's output")
+    parser.add_argument("--watch", action="store_true",
+                        help="after building, rebuild what depends on each file that changes")
+    parser.add_argument("--poll", action="store_true",
+                        help="with --watch, poll for changes instead of using inotify")
+    args = parser.parse_args()
+
+    dirs = product_dirs(args.dirs or DEFAULT_ROOTS)
+    tasks = discover(dirs)
+    if not tasks:
+        print("No build scripts found.")
+        return 0
+
+    start = time.perf_counter()
+    results = run(tasks, max(1, args.jobs), args.force, args.verbose)
+    print_summary(tasks, results, time.perf_counter() - start, args.jobs)
+
+    failures = [t for t in tasks if results[t.name].status == "failed"]
+    for t in failures:
+        print(f"\n--- {t.name} failed ---\n{results[t.name].output}", end="")
+    if args.watch:
+        return watch_loop(tasks, dirs, max(1, args.jobs), args.verbose, args.poll)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
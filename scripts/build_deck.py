@@ -2,14 +2,23 @@
 """Build Chair Balancing Act product overview deck."""
 
 import os
-from pptx import Presentation
+import sys
+
+from toolkit import manifest, profiling, pptx_theme, reproducible
+
+_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT = os.path.join(_DIR, "Chair_Balancing_Act_Deck.pptx")
+
+INPUTS = [__file__, pptx_theme.__file__, reproducible.__file__]
+
+if manifest.up_to_date([OUTPUT], INPUTS):
+    sys.exit(0)
+
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
 from pptx.enum.shapes import MSO_SHAPE
 
-_DIR = os.path.dirname(os.path.abspath(__file__))
-
 # -- Theme colors --
 DARK_BG = RGBColor(0x1A, 0x1A, 0x2E)
 ACCENT_ORANGE = RGBColor(0xFF, 0x8C, 0x00)
@@ -22,14 +31,16 @@ SOFT_WHITE = RGBColor(0xF0, 0xF0, 0xF5)
 CARD_BG = RGBColor(0x22, 0x22, 0x3A)
 CARD_BG_ALT = RGBColor(0x1E, 0x1E, 0x34)
 
-prs = Presentation()
-prs.slide_width = Inches(13.333)
-prs.slide_height = Inches(7.5)
+# Dark background, Calibri, white text and borderless shapes come from the
+# theme's master (toolkit.pptx_theme), not from each shape.
+prs, LAYOUT = pptx_theme.presentation("deck")
 W = prs.slide_width
 H = prs.slide_height
 
 
 def add_bg(slide, color=DARK_BG):
+    if color == DARK_BG:
+        return  # the master paints it
     fill = slide.background.fill
     fill.solid()
     fill.fore_color.rgb = color
@@ -39,7 +50,6 @@ def add_shape(slide, left, top, width, height, color):
     shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, left, top, width, height)
     shape.fill.solid()
     shape.fill.fore_color.rgb = color
-    shape.line.fill.background()
     return shape
 
 
@@ -55,7 +65,6 @@ def set_text(tf, text, size=18, color=WHITE, bold=False, align=PP_ALIGN.LEFT):
     p.font.size = Pt(size)
     p.font.color.rgb = color
     p.font.bold = bold
-    p.font.name = "Calibri"
     p.alignment = align
     return p
 
@@ -66,7 +75,6 @@ def add_p(tf, text, size=18, color=WHITE, bold=False, before=Pt(6), after=Pt(2),
     p.font.size = Pt(size)
     p.font.color.rgb = color
     p.font.bold = bold
-    p.font.name = "Calibri"
     p.alignment = align
     p.space_before = before
     p.space_after = after
@@ -79,7 +87,6 @@ def add_bullet(tf, text, size=16, color=WHITE, bold=False):
     p.font.size = Pt(size)
     p.font.color.rgb = color
     p.font.bold = bold
-    p.font.name = "Calibri"
     p.level = 0
     p.space_before = Pt(4)
     p.space_after = Pt(2)
@@ -90,7 +97,6 @@ def accent_bar(slide, left, top, height=Inches(0.8), color=ACCENT_ORANGE):
     bar = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, left, top, Inches(0.08), height)
     bar.fill.solid()
     bar.fill.fore_color.rgb = color
-    bar.line.fill.background()
     return bar
 
 
@@ -98,17 +104,21 @@ def circle_num(slide, x, y, num, color):
     c = slide.shapes.add_shape(MSO_SHAPE.OVAL, x, y, Inches(0.4), Inches(0.4))
     c.fill.solid()
     c.fill.fore_color.rgb = color
-    c.line.fill.background()
     ctf = c.text_frame
     ctf.word_wrap = False
     set_text(ctf, str(num), size=16, color=WHITE, bold=True, align=PP_ALIGN.CENTER)
     ctf.paragraphs[0].alignment = PP_ALIGN.CENTER
 
 
+profiling.instrument_pptx()
+profiling.instrument(globals(), "add_bg", "add_shape", "tb", "set_text", "add_p", "add_bullet",
+                     "accent_bar", "circle_num")
+
+
 # ============================================================
 # SLIDE 1: Title
 # ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
+slide = prs.slides.add_slide(LAYOUT)
 add_bg(slide)
 add_shape(slide, Inches(0), Inches(0), W, Inches(0.06), ACCENT_ORANGE)
 
@@ -130,7 +140,7 @@ set_text(t3.text_frame, "Product Overview  \u2022  Concept Stage  \u2022  2026",
 # ============================================================
 # SLIDE 2: Product Overview (rendered image)
 # ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
+slide = prs.slides.add_slide(LAYOUT)
 add_bg(slide, color=WHITE)
 add_shape(slide, Inches(0), Inches(0), W, Inches(0.06), ACCENT_ORANGE)
 
@@ -148,7 +158,7 @@ if os.path.exists(img_path):
 # ============================================================
 # SLIDE 3: How It Works + Device
 # ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
+slide = prs.slides.add_slide(LAYOUT)
 add_bg(slide)
 add_shape(slide, Inches(0), Inches(0), W, Inches(0.06), ACCENT_GREEN)
 
@@ -194,7 +204,7 @@ add_p(tf, "~32 mm round \u00d7 10 mm  \u2022  ~15g  \u2022  CR2450 coin cell (mo
 # ============================================================
 # SLIDE 3: Architecture + Constraints
 # ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
+slide = prs.slides.add_slide(LAYOUT)
 add_bg(slide)
 add_shape(slide, Inches(0), Inches(0), W, Inches(0.06), ACCENT_BLUE)
 
@@ -264,7 +274,7 @@ set_text(t.text_frame,
 # ============================================================
 # SLIDE 4: Hardest Problems + Component Tradeoffs
 # ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
+slide = prs.slides.add_slide(LAYOUT)
 add_bg(slide)
 add_shape(slide, Inches(0), Inches(0), W, Inches(0.06), ACCENT_RED)
 
@@ -338,7 +348,7 @@ set_text(t.text_frame,
 # ============================================================
 # SLIDE 5: PRD Summary — Requirements at a Glance
 # ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
+slide = prs.slides.add_slide(LAYOUT)
 add_bg(slide)
 add_shape(slide, Inches(0), Inches(0), W, Inches(0.06), ACCENT_BLUE)
 
@@ -427,7 +437,7 @@ for i, (req_id, desc) in enumerate(key_reqs):
 # ============================================================
 # SLIDE 6: Open Items & V2 Horizon
 # ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
+slide = prs.slides.add_slide(LAYOUT)
 add_bg(slide)
 add_shape(slide, Inches(0), Inches(0), W, Inches(0.06), ACCENT_ORANGE)
 
@@ -493,6 +503,7 @@ set_text(t.text_frame,
 # ============================================================
 # Save
 # ============================================================
-output_path = os.path.join(_DIR, "Chair_Balancing_Act_Deck.pptx")
-prs.save(output_path)
+output_path = OUTPUT
+reproducible.save_presentation(prs, output_path)
+manifest.record([output_path], [*INPUTS, img_path])
 print(f"Saved to {output_path}")
@@ -2,14 +2,23 @@
 """Build AirSense Indoor Environment Monitor product overview deck."""
 
 import os
-from pptx import Presentation
+import sys
+
+from toolkit import manifest, profiling, pptx_theme, reproducible
+
+_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT = os.path.join(_DIR, "AirSense_Deck.pptx")
+
+INPUTS = [__file__, pptx_theme.__file__, reproducible.__file__]
+
+if manifest.up_to_date([OUTPUT], INPUTS):
+    sys.exit(0)
+
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
 from pptx.enum.shapes import MSO_SHAPE
 
-_DIR = os.path.dirname(os.path.abspath(__file__))
-
 # -- Theme colors --
 DARK_BG = RGBColor(0x0F, 0x17, 0x2A)
 ACCENT_TEAL = RGBColor(0x00, 0xBF, 0xA5)
@@ -23,14 +32,16 @@ SOFT_WHITE = RGBColor(0xF0, 0xF0, 0xF5)
 CARD_BG = RGBColor(0x18, 0x22, 0x3A)
 CARD_BG_ALT = RGBColor(0x14, 0x1E, 0x34)
 
-prs = Presentation()
-prs.slide_width = Inches(13.333)
-prs.slide_height = Inches(7.5)
+# Dark background, Calibri, white text and borderless shapes come from the
+# theme's master (toolkit.pptx_theme), not from each shape.
+prs, LAYOUT = pptx_theme.presentation("high_level")
 W = prs.slide_width
 H = prs.slide_height
 
 
 def add_bg(slide, color=DARK_BG):
+    if color == DARK_BG:
+        return  # the master paints it
     fill = slide.background.fill
     fill.solid()
     fill.fore_color.rgb = color
@@ -40,7 +51,6 @@ def add_shape(slide, left, top, width, height, color):
     shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, left, top, width, height)
     shape.fill.solid()
     shape.fill.fore_color.rgb = color
-    shape.line.fill.background()
     return shape
 
 
@@ -56,7 +66,6 @@ def set_text(tf, text, size=18, color=WHITE, bold=False, align=PP_ALIGN.LEFT):
     p.font.size = Pt(size)
     p.font.color.rgb = color
     p.font.bold = bold
-    p.font.name = "Calibri"
     p.alignment = align
     return p
 
@@ -67,7 +76,6 @@ def add_p(tf, text, size=18, color=WHITE, bold=False, before=Pt(6), after=Pt(2),
     p.font.size = Pt(size)
     p.font.color.rgb = color
     p.font.bold = bold
-    p.font.name = "Calibri"
     p.alignment = align
     p.space_before = before
     p.space_after = after
@@ -78,7 +86,6 @@ def accent_bar(slide, left, top, height=Inches(0.8), color=ACCENT_TEAL):
     bar = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, left, top, Inches(0.08), height)
     bar.fill.solid()
     bar.fill.fore_color.rgb = color
-    bar.line.fill.background()
     return bar
 
 
@@ -86,17 +93,21 @@ def circle_num(slide, x, y, num, color):
     c = slide.shapes.add_shape(MSO_SHAPE.OVAL, x, y, Inches(0.4), Inches(0.4))
     c.fill.solid()
     c.fill.fore_color.rgb = color
-    c.line.fill.background()
     ctf = c.text_frame
     ctf.word_wrap = False
     set_text(ctf, str(num), size=16, color=WHITE, bold=True, align=PP_ALIGN.CENTER)
     ctf.paragraphs[0].alignment = PP_ALIGN.CENTER
 
 
+profiling.instrument_pptx()
+profiling.instrument(globals(), "add_bg", "add_shape", "tb", "set_text", "add_p", "accent_bar",
+                     "circle_num")
+
+
 # ============================================================
 # SLIDE 1: Title
 # ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
+slide = prs.slides.add_slide(LAYOUT)
 add_bg(slide)
 add_shape(slide, Inches(0), Inches(0), W, Inches(0.06), ACCENT_TEAL)
 
@@ -123,7 +134,7 @@ set_text(t3.text_frame, "Product Overview  |  Concept Stage  |  2026", size=14,
 # ============================================================
 # SLIDE 2: Architecture — Three-Tier System
 # ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
+slide = prs.slides.add_slide(LAYOUT)
 add_bg(slide)
 add_shape(slide, Inches(0), Inches(0), W, Inches(0.06), ACCENT_BLUE)
 
@@ -181,7 +192,7 @@ set_text(t.text_frame,
 # ============================================================
 # SLIDE 3: Hardware Cross-Sections
 # ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
+slide = prs.slides.add_slide(LAYOUT)
 add_bg(slide)
 add_shape(slide, Inches(0), Inches(0), W, Inches(0.06), ACCENT_TEAL)
 
@@ -228,7 +239,7 @@ for i, (label, value) in enumerate(gw_specs):
 # ============================================================
 # SLIDE 4: Sensor Node Deep Dive
 # ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
+slide = prs.slides.add_slide(LAYOUT)
 add_bg(slide)
 add_shape(slide, Inches(0), Inches(0), W, Inches(0.06), ACCENT_TEAL)
 
@@ -311,7 +322,7 @@ for i, (name, desc) in enumerate(fw_modules):
 # ============================================================
 # SLIDE 4: Constraints & BOM
 # ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
+slide = prs.slides.add_slide(LAYOUT)
 add_bg(slide)
 add_shape(slide, Inches(0), Inches(0), W, Inches(0.06), ACCENT_ORANGE)
 
@@ -398,7 +409,7 @@ set_text(t.text_frame, "Cloud hosting: <$0.50/node/month", size=10, color=LIGHT_
 # ============================================================
 # SLIDE 5: Hardest Problems & Component Tradeoffs
 # ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
+slide = prs.slides.add_slide(LAYOUT)
 add_bg(slide)
 add_shape(slide, Inches(0), Inches(0), W, Inches(0.06), ACCENT_RED)
 
@@ -478,7 +489,7 @@ set_text(t.text_frame,
 # ============================================================
 # SLIDE 6: Key Decisions
 # ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
+slide = prs.slides.add_slide(LAYOUT)
 add_bg(slide)
 add_shape(slide, Inches(0), Inches(0), W, Inches(0.06), ACCENT_PURPLE)
 
@@ -531,7 +542,7 @@ for i, (title, choice, rationale, consequences, color) in enumerate(decisions):
 # ============================================================
 # SLIDE 7: Open Questions & Risks
 # ============================================================
-slide = prs.slides.add_slide(prs.slide_layouts[6])
+slide = prs.slides.add_slide(LAYOUT)
 add_bg(slide)
 add_shape(slide, Inches(0), Inches(0), W, Inches(0.06), ACCENT_ORANGE)
 
@@ -589,6 +600,7 @@ set_text(t.text_frame,
 # ============================================================
 # Save
 # ============================================================
-output_path = os.path.join(_DIR, "AirSense_Deck.pptx")
-prs.save(output_path)
+output_path = OUTPUT
+reproducible.save_presentation(prs, output_path)
+manifest.record([output_path], [*INPUTS, overview_img, node_img, gw_img])
 print(f"Saved to {output_path}")
@@ -10,14 +10,23 @@
 """
 
 import os
-from pptx import Presentation
+import sys
+
+from toolkit import manifest, profiling, pptx_theme, reproducible
+
+_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT = os.path.join(_DIR, "AirSense_High_Level_Deck.pptx")
+
+INPUTS = [__file__, pptx_theme.__file__, reproducible.__file__]
+
+if manifest.up_to_date([OUTPUT], INPUTS):
+    sys.exit(0)
+
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
 from pptx.enum.shapes import MSO_SHAPE
 
-_DIR = os.path.dirname(os.path.abspath(__file__))
-
 # -- Theme --
 DARK_BG = RGBColor(0x0F, 0x17, 0x2A)
 TEAL = RGBColor(0x00, 0xBF, 0xA5)
@@ -31,19 +40,16 @@ SOFT = RGBColor(0xF0, 0xF0, 0xF5)
 CARD = RGBColor(0x18, 0x22, 0x3A)
 CARD2 = RGBColor(0x14, 0x1E, 0x34)
 
-prs = Presentation()
-prs.slide_width = Inches(13.333)
-prs.slide_height = Inches(7.5)
+# Dark background, Calibri, white text and borderless shapes come from the
+# theme's master (toolkit.pptx_theme), not from each shape.
+prs, LAYOUT = pptx_theme.presentation("high_level")
 W = prs.slide_width
 H = prs.slide_height
 
 
-def bg(slide):
-    f = slide.background.fill; f.solid(); f.fore_color.rgb = DARK_BG
-
 def box(slide, l, t, w, h, c):
     s = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, l, t, w, h)
-    s.fill.solid(); s.fill.fore_color.rgb = c; s.line.fill.background()
+    s.fill.solid(); s.fill.fore_color.rgb = c
     return s
 
 def tb(slide, l, t, w, h):
@@ -54,13 +60,13 @@ def txt(slide, l, t, w, h, text, sz=14, c=WHITE, b=False, a=PP_ALIGN.LEFT):
     tf.word_wrap = True
     p = tf.paragraphs[0]
     p.text = text; p.font.size = Pt(sz); p.font.color.rgb = c
-    p.font.bold = b; p.font.name = "Calibri"; p.alignment = a
+    p.font.bold = b; p.alignment = a
     return tf
 
 def add_p(tf, text, sz=14, c=WHITE, b=False, before=Pt(4), after=Pt(2)):
     p = tf.add_paragraph()
     p.text = text; p.font.size = Pt(sz); p.font.color.rgb = c
-    p.font.bold = b; p.font.name = "Calibri"
+    p.font.bold = b
     p.space_before = before; p.space_after = after
     return p
 
@@ -69,10 +75,10 @@ def accent(slide, l, t, h, c):
 
 def num_circle(slide, x, y, n, c):
     s = slide.shapes.add_shape(MSO_SHAPE.OVAL, x, y, Inches(0.36), Inches(0.36))
-    s.fill.solid(); s.fill.fore_color.rgb = c; s.line.fill.background()
+    s.fill.solid(); s.fill.fore_color.rgb = c
     tf = s.text_frame; tf.word_wrap = False
     p = tf.paragraphs[0]; p.text = str(n); p.font.size = Pt(14)
-    p.font.color.rgb = WHITE; p.font.bold = True; p.font.name = "Calibri"
+    p.font.color.rgb = WHITE; p.font.bold = True
     p.alignment = PP_ALIGN.CENTER
 
 def strip(slide, l, t, w, c):
@@ -84,10 +90,15 @@ def section_hdr(slide, l, t, w, label, c):
         label, 12, WHITE, True)
 
 
+profiling.instrument_pptx()
+profiling.instrument(globals(), "box", "tb", "txt", "add_p", "accent", "num_circle", "strip",
+                     "section_hdr")
+
+
 # ================================================================
 # SLIDE 1 — System Overview (concept art + description)
 # ================================================================
-sl = prs.slides.add_slide(prs.slide_layouts[6]); bg(sl)
+sl = prs.slides.add_slide(LAYOUT)
 strip(sl, 0, 0, W, TEAL)
 
 # Title
@@ -145,7 +156,7 @@ txt(sl, Inches(0.8), Inches(7.1), Inches(11), Inches(0.3),
 # ================================================================
 # SLIDE 2 — Block Diagram + Cross-Section
 # ================================================================
-sl = prs.slides.add_slide(prs.slide_layouts[6]); bg(sl)
+sl = prs.slides.add_slide(LAYOUT)
 strip(sl, 0, 0, W, BLUE)
 
 txt(sl, Inches(0.8), Inches(0.35), Inches(11), Inches(0.6),
@@ -193,7 +204,7 @@ add_p(tf, "Data flows one direction: sensor -> gateway -> cloud -> dashboard. "
 # ================================================================
 # SLIDE 2 — Subsystems + Interfaces + Constraints
 # ================================================================
-sl = prs.slides.add_slide(prs.slide_layouts[6]); bg(sl)
+sl = prs.slides.add_slide(LAYOUT)
 strip(sl, 0, 0, W, BLUE)
 
 txt(sl, Inches(0.8), Inches(0.35), Inches(11), Inches(0.6),
@@ -286,7 +297,7 @@ txt(sl, Inches(0.8), Inches(7.1), Inches(11), Inches(0.3),
 # ================================================================
 # SLIDE 3 — Fundamental HW Problems + Component Choice Architecture
 # ================================================================
-sl = prs.slides.add_slide(prs.slide_layouts[6]); bg(sl)
+sl = prs.slides.add_slide(LAYOUT)
 strip(sl, 0, 0, W, RED)
 
 txt(sl, Inches(0.8), Inches(0.35), Inches(11), Inches(0.6),
@@ -362,7 +373,7 @@ txt(sl, Inches(1.0), Inches(6.75), Inches(11.5), Inches(0.35),
 # ================================================================
 # SLIDE 4 — Three Hardest Problems + Open Calls
 # ================================================================
-sl = prs.slides.add_slide(prs.slide_layouts[6]); bg(sl)
+sl = prs.slides.add_slide(LAYOUT)
 strip(sl, 0, 0, W, PURPLE)
 
 txt(sl, Inches(0.8), Inches(0.35), Inches(11), Inches(0.6),
@@ -438,6 +449,7 @@ txt(sl, Inches(1.0), Inches(6.75), Inches(11.5), Inches(0.35),
 
 
 # ================================================================
-output = os.path.join(_DIR, "AirSense_High_Level_Deck.pptx")
-prs.save(output)
+output = OUTPUT
+reproducible.save_presentation(prs, output)
+manifest.record([output], [*INPUTS, overview_img, img_path, node_img, gw_img])
 print(f"Saved to {output}")
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Render block diagram specs (YAML or JSON) to PNG, SVG or PDF.
+
+Each spec lists the diagram's groups, blocks, edges and legend; see
+toolkit.diagram for the format. The output goes where the spec's
+``output`` says (next to the spec by default), or to ``-o``; a PNG gets
+a PDF twin beside it, which the PDF carousel embeds as vector art. Renders
+are cached by spec hash, so an unchanged spec costs a file copy.
+
+Usage:
+    python scripts/render_diagram.py examples/bubbler-automated-soap-bubble-maker/block_diagram.yaml
+    python scripts/render_diagram.py scripts/block_diagram.yaml --format svg
+"""
+
+import argparse
+import os
+import sys
+
+from toolkit import diagram, images, manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("specs", nargs="+", help="diagram spec files (.yaml, .yml or .json)")
+    parser.add_argument("-o", "--output", help="output file (one spec only)")
+    parser.add_argument("--format", choices=("png", "svg", "pdf"),
+                        help="output format (default: from the output file name)")
+    parser.add_argument("--force", action="store_true", help="render even if up to date")
+    args = parser.parse_args()
+    if args.output and len(args.specs) > 1:
+        parser.error("-o takes a single spec")
+
+    for path in args.specs:
+        path = os.path.abspath(path)
+        try:
+            spec = diagram.load(path)
+        except (OSError, diagram.DiagramError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        out = os.path.abspath(args.output) if args.output else spec["output"]
+        if args.format:
+            out = os.path.splitext(out)[0] + "." + args.format
+        inputs = [os.path.abspath(__file__), path, *diagram.SOURCES]
+        outs = [out, images.vector_name(out)] if out.lower().endswith(".png") else [out]
+        if manifest.up_to_date(outs, inputs):
+            continue
+        try:
+            diagram.render(spec, out)
+            if len(outs) > 1:
+                diagram.render(spec, outs[1], raster=out)
+        except diagram.DiagramError as e:
+            print(f"Error: {path}: {e}", file=sys.stderr)
+            return 1
+        manifest.record(outs, inputs)
+        print(f"Saved: {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Render the Mermaid blocks of Markdown files to PNG, SVG or PDF, without Node.
+
+Each ```` ```mermaid ```` block of a Markdown file (flowchart, state or
+sequence diagram; see toolkit.mermaid for the subset) is drawn with
+matplotlib and saved next to the file as ``<name>_mermaid_<n>.png``,
+numbered in document order (``_light`` is added for the light theme), or
+in the ``-o`` folder with the product folder's name in front. A ``.mmd``
+file holds one diagram and is saved as ``<name>.png``. Folders
+are searched for Markdown files. Renders are cached by the hash of the
+diagram, so an unchanged block costs a file copy, and a file whose blocks
+are all up to date is skipped.
+
+Usage:
+    python scripts/render_mermaid.py examples/shusher
+    python scripts/render_mermaid.py examples --theme light --format svg
+    python scripts/render_mermaid.py examples/metronome/system_description.md -o /tmp/diagrams
+"""
+
+import argparse
+import glob
+import os
+import sys
+
+from toolkit import diagram, manifest, mermaid
+
+
+def sources(paths):
+    """The Markdown and ``.mmd`` files named by ``paths`` (folders searched recursively)."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files += sorted(glob.glob(os.path.join(path, "**", "*.md"), recursive=True))
+            files += sorted(glob.glob(os.path.join(path, "**", "*.mmd"), recursive=True))
+        else:
+            files.append(path)
+    return [os.path.abspath(f) for f in files]
+
+
+def outputs(path, blocks, folder, suffix):
+    """Where each of the ``blocks`` read from ``path`` is saved."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    if folder:  # one folder for many products: name the product too
+        stem = f"{os.path.basename(os.path.dirname(path))}_{stem}"
+    folder = folder or os.path.dirname(path)
+    if path.endswith(".mmd"):
+        return [os.path.join(folder, stem + suffix)]
+    return [os.path.join(folder, f"{stem}_mermaid_{i}{suffix}")
+            for i in range(1, len(blocks) + 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", help="Markdown or .mmd files, or folders of them")
+    parser.add_argument("-o", "--output-dir", help="folder for the images (default: next to "
+                                                   "each file)")
+    parser.add_argument("--theme", choices=tuple(diagram.THEMES), default="dark",
+                        help="colour theme (default: dark)")
+    parser.add_argument("--format", choices=("png", "svg", "pdf"), default="png",
+                        help="image format (default: png)")
+    parser.add_argument("--force", action="store_true", help="render even if up to date")
+    args = parser.parse_args()
+    folder = os.path.abspath(args.output_dir) if args.output_dir else None
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    suffix = ("_light" if args.theme == "light" else "") + "." + args.format
+
+    failed = 0
+    for path in sources(args.paths):
+        try:
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        blocks = [text] if path.endswith(".mmd") else mermaid.blocks(text)
+        if not blocks:
+            continue
+        outs = outputs(path, blocks, folder, suffix)
+        inputs = [os.path.abspath(__file__), path, mermaid.__file__, *diagram.SOURCES]
+        if manifest.up_to_date(outs, inputs):
+            continue
+        ok = True
+        for i, (source, out) in enumerate(zip(blocks, outs), 1):
+            try:
+                diagram.render(mermaid.to_spec(source, args.theme), out)
+            except diagram.DiagramError as e:
+                print(f"Error: {path}: diagram {i}: {e}", file=sys.stderr)
+                ok = False
+                continue
+            print(f"Saved: {out}")
+        if ok:
+            manifest.record(outs, inputs)
+        failed += not ok
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
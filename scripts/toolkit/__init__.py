@@ -0,0 +1,5 @@
+"""Shared rendering toolkit for the Electrum carousel, deck and diagram scripts.
+
+Pages are described once as a backend-neutral scene (see ``toolkit.scene``)
+and then handed to the reportlab and python-pptx backends.
+"""
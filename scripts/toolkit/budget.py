@@ -0,0 +1,116 @@
+"""Fit a carousel PDF under a size limit (``--max-bytes``).
+
+LinkedIn document posts and mail gateways cap attachment size. When the
+PDF a build wrote is over the limit, ``fit_pdf`` rebuilds it with the
+settings in ``STEPS``, each stronger than the last, and keeps the first
+that fits:
+
+1. lower JPEG quality for photographic images;
+2. lower image resolution;
+3. palette quantization of flat, opaque images (diagrams);
+4. the strongest zlib level for every Flate stream.
+
+Later steps push the same knobs further. Every step reuses the image and
+page caches, so a retry costs the re-encoded images and the pages that
+show them, not the whole carousel.
+
+The image steps only touch rasters. A diagram embedded as vectors (a
+PDF twin, see ``images.vector_of``) is copied as it is, so a scene with
+no raster images tries only the stream steps (``steps``), and the report
+says how many images the settings left alone.
+"""
+
+import os
+import sys
+from collections import namedtuple
+
+from .images import JPEG_QUALITY, target_dpi
+from .profiling import span
+from .scene import Image
+
+Step = namedtuple("Step", "quality dpi colors level")
+Step.__doc__ = """Image and stream settings of one attempt; ``quality`` None leaves the
+images as built, ``dpi`` None is the build's own (``images.target_dpi``),
+``colors`` 0 keeps full colour and ``level`` None keeps reportlab's streams."""
+
+STEPS = (
+    Step(70, None, 0, None),
+    Step(70, 150, 0, None),
+    Step(70, 150, 64, None),
+    Step(70, 150, 64, 9),
+    Step(55, 110, 32, 9),
+    Step(40, 80, 16, 9),
+)
+
+
+def steps(scene):
+    """The ``STEPS`` that can change the PDF of ``scene``.
+
+    Without raster images only the stream settings do, once each.
+    """
+    if any(isinstance(n, Image) and not n.vector for page in scene.pages for n in page):
+        return STEPS
+    return tuple(dict.fromkeys(Step(None, None, 0, s.level) for s in STEPS
+                               if s.level is not None))
+
+
+def describe(step):
+    """``step`` as the settings a user would pass by hand."""
+    parts = []
+    if step.quality is not None:
+        parts += [f"JPEG quality {step.quality}", f"{step.dpi or target_dpi()} dpi"]
+    if step.colors:
+        parts.append(f"{step.colors}-colour diagrams")
+    if step.level is not None:
+        parts.append(f"zlib level {step.level}")
+    return ", ".join(parts)
+
+
+def size_label(n):
+    return f"{n / (1 << 20):.2f} MB" if n >= 1 << 20 else f"{n / 1024:.0f} KB"
+
+
+def fit_pdf(scene, path, max_bytes):
+    """Rebuild the PDF at ``path`` from ``scene`` until it is at most ``max_bytes``.
+
+    ``scene`` is the one the PDF was rendered from, with its original
+    images. Returns the ``Step`` that fits, None if the PDF already did;
+    raises ``SystemExit`` if no step fits (the last attempt is left at
+    ``path``).
+    """
+    from . import pdf_backend
+    from .images import preprocess_scenes
+
+    size = os.path.getsize(path)
+    if size <= max_bytes:
+        return None
+    tries = steps(scene)
+    start = f" (from JPEG quality {JPEG_QUALITY}, {target_dpi()} dpi)" if tries is STEPS else ""
+    print(f"PDF is {size_label(size)}, over the {size_label(max_bytes)} limit; shrinking{start}")
+    vectors = sum(isinstance(n, Image) and bool(n.vector) for page in scene.pages for n in page)
+    if vectors:
+        print(f"  {vectors} vector diagram{'s' if vectors != 1 else ''} embedded as is; "
+              f"image quality, resolution and colours do not change them")
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        for step in tries:
+            with span("budget step", settings=describe(step)):
+                shrunk = scene
+                if step.quality is not None:
+                    shrunk = preprocess_scenes([scene], step.dpi, step.quality,
+                                               step.colors)[0]
+                pdf_backend.render(shrunk, tmp, level=step.level)
+            size = os.path.getsize(tmp)
+            print(f"  {describe(step)}: {size_label(size)}")
+            if size <= max_bytes:
+                break
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    if size <= max_bytes:
+        print(f"Fits at {describe(step)}: {size_label(size)}")
+        return step
+    print(f"Error: no setting brings {path} under {size_label(max_bytes)}; kept the "
+          f"strongest ({describe(step)}: {size_label(size)})", file=sys.stderr)
+    raise SystemExit(1)
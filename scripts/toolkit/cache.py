@@ -0,0 +1,24 @@
+"""Shared build-cache location and file hashing."""
+
+import hashlib
+import os
+
+_SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_ROOT = os.path.dirname(_SCRIPTS_DIR)
+
+
+def cache_dir(*parts):
+    """Build cache directory (``ELECTRUM_CACHE_DIR`` or ``<repo>/.electrum-cache``)."""
+    root = os.environ.get("ELECTRUM_CACHE_DIR") or os.path.join(REPO_ROOT, ".electrum-cache")
+    path = os.path.join(root, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def file_hash(path):
+    """sha256 of a file's contents, hex."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
@@ -0,0 +1,170 @@
+"""LinkedIn carousel theme and drawing helpers.
+
+Format: 1080x1350 px (4:5 portrait), dark theme. The helpers keep the call
+signatures the carousel scripts have always used (``txt(c, x, y, ...)``,
+``card(c, ...)``), but ``c`` is now a ``toolkit.scene.Scene`` and each call
+records nodes instead of drawing. y is from TOP of page throughout.
+
+``txt_fit`` is ``txt_wrap`` for text that has to stay inside a box: it
+shrinks the text until it fits (``textlayout.fit``) and prints a warning
+naming the page (``warn``) when even the smallest size overflows. The fitted size is
+in the scene, so the PDF and the PPTX get the same one.
+"""
+
+import sys
+
+from .images import vector_of
+from .profiling import traced
+from .scene import Background, Circle, Image, Rect, Text, TextBlock, mm
+from .textlayout import fit, wrap
+
+# -- Page size: 4:5 ratio --
+PW = 190 * mm
+PH = 237.5 * mm
+
+# -- Other frames the layouts reflow to (``toolkit.carousel_pages``) --
+# Portrait ones keep the 190 mm width; 16:9 turns it into the height.
+ASPECTS = {
+    "4:5": (PW, PH),  # LinkedIn carousel
+    "1:1": (PW, PW),  # square feed post
+    "9:16": (PW, PW * 16 / 9),  # stories
+    "16:9": (PW * 16 / 9, PW),  # presentation slide
+}
+DEFAULT_ASPECT = "4:5"
+
+# -- Colors --
+DARK_BG = "#1A1A2E"
+CARD_BG = "#22223A"
+CARD_BG_ALT = "#1E1E34"
+ACCENT_ORANGE = "#FF8C00"
+ACCENT_GREEN = "#4EC978"
+ACCENT_RED = "#FF4545"
+ACCENT_BLUE = "#009BF5"
+ACCENT_PURPLE = "#A855F7"
+ACCENT_YELLOW = "#FFD700"
+WHITE_HEX = "#FFFFFF"
+LIGHT_GRAY = "#BBBBCC"
+SOFT_WHITE = "#F0F0F5"
+
+# Names the content files (carousel.yaml) may use for colors.
+COLORS = {
+    "orange": ACCENT_ORANGE,
+    "green": ACCENT_GREEN,
+    "red": ACCENT_RED,
+    "blue": ACCENT_BLUE,
+    "purple": ACCENT_PURPLE,
+    "yellow": ACCENT_YELLOW,
+    "white": WHITE_HEX,
+    "gray": LIGHT_GRAY,
+    "soft_white": SOFT_WHITE,
+}
+
+M = 10 * mm  # standard margin
+MIN_TEXT_SIZE = 7  # pt; txt_fit shrinks text no further
+
+
+def color(name, default=WHITE_HEX):
+    """A theme color by name (see ``COLORS``) or ``#RRGGBB``; ``default`` if unset."""
+    if not name:
+        return default
+    if name.startswith("#"):
+        return name
+    try:
+        return COLORS[name]
+    except KeyError:
+        raise ValueError(f"Unknown color {name!r}; expected #RRGGBB or one of {sorted(COLORS)}")
+
+
+def font_name(c, bold=False):
+    """The scene's regular or bold font (``Scene.font``)."""
+    return f"{c.font}-Bold" if bold else c.font
+
+
+def bg(c, color=DARK_BG):
+    c.add(Background(color))
+
+
+def accent_strip(c, color=ACCENT_ORANGE):
+    c.add(Rect(0, 0, c.width, 2 * mm, color))
+
+
+def card(c, x, y, w, h, color=CARD_BG):
+    """Draw a card. y is from TOP of page."""
+    c.add(Rect(x, y, w, h, color, radius=3 * mm))
+
+
+def card_flat(c, x, y, w, h, color=CARD_BG):
+    c.add(Rect(x, y, w, h, color))
+
+
+def txt(c, x, y, text, size=14, color=WHITE_HEX, bold=False, align="left", max_w=None):
+    """Draw text. y is from TOP of page."""
+    if max_w is None:
+        align = "left"
+    c.add(Text(x, y + size * 0.35, text, font_name(c, bold), size, color, align, max_w))
+
+
+@traced("txt_wrap")
+def txt_wrap(c, x, y, text, size=11, color=WHITE_HEX, bold=False, line_h=None, max_w=None):
+    """Draw wrapped text. Returns y after last line."""
+    if line_h is None:
+        line_h = size * 1.4
+    if max_w is None:
+        max_w = c.width - 2 * M
+    font = font_name(c, bold)
+    lines = wrap(text, font, size, max_w)
+    c.add(TextBlock(x, y + size * 0.35, max_w, lines, font, size, color, line_h))
+    return y + line_h * len(lines)
+
+
+def warn(c, message):
+    """Print a layout warning for the page being drawn on ``c``."""
+    print(f"Warning: page {len(c.pages) + 1}: {message}", file=sys.stderr)
+
+
+@traced("txt_fit")
+def txt_fit(c, x, y, text, max_h, size=11, color=WHITE_HEX, bold=False, line_h=None,
+            max_w=None, min_size=MIN_TEXT_SIZE):
+    """Draw wrapped text no taller than ``max_h``, shrunk if need be. Returns y after last line."""
+    if max_w is None:
+        max_w = c.width - 2 * M
+    font = font_name(c, bold)
+    f = fit(text, font, size, max_w, max_h, line_h, min(min_size, size))
+    if f.overflow:
+        snippet = text if len(text) <= 40 else text[:37] + "..."
+        warn(c, f"text overflows its box by {f.overflow / mm:.1f} mm at {f.size:g} pt: "
+                f"{snippet!r}")
+    c.add(TextBlock(x, y + f.size * 0.35, max_w, f.lines, font, f.size, color, f.line_h))
+    return y + f.line_h * len(f.lines)
+
+
+def bar(c, x, y, w, h, color):
+    c.add(Rect(x, y, w, h, color))
+
+
+def circle_num(c, x, y, num, color):
+    r = 4 * mm
+    c.add(Circle(x + r, y + r, r, color))
+    c.add(Text(x, y + r + 4, str(num), font_name(c, True), 12, WHITE_HEX, "center", 2 * r))
+
+
+def footer(c, page, total):
+    box_w = 20 * mm
+    c.add(Text(c.width - M - box_w, c.height - 4 * mm, f"{page}/{total}", font_name(c), 8,
+               LIGHT_GRAY, "right", box_w))
+
+
+def image(c, path, x, y, w, h):
+    """Fit an image inside the box, preserving aspect ratio, anchored bottom-left.
+
+    Matches reportlab's ``drawImage(..., preserveAspectRatio=True, anchor='sw')``.
+    A PDF saved beside the image from the same pixels (``images.vector_of``)
+    is its vector version, used by the PDF backend.
+    """
+    from PIL import Image as PILImage
+
+    with PILImage.open(path) as im:
+        iw, ih = im.size
+    scale = min(w / iw, h / ih)
+    dw, dh = iw * scale, ih * scale
+    c.add(Image(path, x, y + h - dh, dw, dh, vector_of(path)))
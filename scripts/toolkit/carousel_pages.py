@@ -0,0 +1,546 @@
+"""Carousel page layouts, filled in from a product's content.
+
+Every page of ``carousel.yaml`` (see ``toolkit.content``) names a ``type``;
+``PAGE_TYPES`` maps it to the function below that lays the page out with
+the theme helpers of ``toolkit.carousel``. Positions follow the
+hand-written carousels these layouts replaced; the number of items and the
+length of wrapped text set the spacing instead of per-product offsets.
+
+Colors are theme names (``orange``, ``green``, ``red``, ``blue``,
+``purple``, ``yellow``) or ``#RRGGBB``. Page keys, by type:
+
+``title``
+    ``title`` (string or list of lines), ``title_size``, ``tagline``,
+    ``summary``, ``image`` (relative to the product folder), ``banner``.
+``problem``
+    ``cards`` [{title, text, color}], ``title_size``,
+    ``audience`` {label, color, lines}.
+``steps``
+    ``steps`` [{title, subtitle, text, color}].
+``architecture``
+    ``chains`` [{title, color, flow, legend, size, bold}],
+    ``subsystems`` {label, items [{name, text, color}]},
+    ``note`` {title, color, text | image}.
+``feature``
+    ``intro``, ``cards`` [{title, color, lines, detail, pulses, text,
+    text_color, outcomes [{label, text, color}]}],
+    ``list`` {title, color, numbered, items [{title, text}]}.
+``constraints_bom``
+    ``constraints`` [{name, value, note}],
+    ``bom`` {label, items [[item, cost]], total [label, value], footnote}.
+``hardest_problems``
+    ``problems`` [{title, text}], ``note``.
+``gate``
+    ``badge`` {label, detail, color}, ``status`` [line, highlighted line],
+    ``facts`` [{label, color, lines}],
+    ``lists`` [{label, color, rows [[tag, text]] | bullets [text]}], ``cta``.
+
+Every page also takes ``heading`` and ``accent``. A top-level ``font``
+sets the whole carousel in a TrueType family instead of Helvetica.
+
+Layouts reflow to the page frame (``c.width`` x ``c.height``, any entry of
+``carousel.ASPECTS``): widths span the frame between the margins, elements
+near the foot of the page are placed from the bottom edge, and stacked
+cards share the height between. The offsets are the ones of the original
+4:5 page, which therefore comes out as before; on shorter frames the card
+text shrinks to fit (``txt_fit``), and on landscape ones the title page puts
+its image beside the text.
+"""
+
+import os
+
+from .carousel import (ACCENT_BLUE, ACCENT_GREEN, ACCENT_ORANGE, ACCENT_PURPLE, ACCENT_RED,
+                       ASPECTS, CARD_BG, CARD_BG_ALT, DEFAULT_ASPECT, LIGHT_GRAY, M, SOFT_WHITE,
+                       WHITE_HEX, accent_strip, bar, bg, card, card_flat, circle_num, color,
+                       font_name, footer, image, txt, txt_fit, txt_wrap, warn)
+from .content import font_files
+from .fonts import register_family
+from .profiling import span
+from .scene import Scene, mm
+from .textlayout import text_width, wrap
+
+
+def _inner_w(c):
+    """Width between the side margins."""
+    return c.width - 2 * M
+
+
+def _columns(c):
+    """``[(x, w)]`` of the page's columns: two side by side on landscape frames."""
+    inner = _inner_w(c)
+    if c.width <= c.height:
+        return [(M, inner)]
+    w = (inner - 6 * mm) / 2
+    return [(M, w), (M + w + 6 * mm, w)]
+
+
+def _row(c, x, y, h, name, text, size, name_color, top=4 * mm, foot=3 * mm):
+    """A list row: bold ``name`` over ``text``, or both on one line if ``h`` is short.
+
+    ``top`` and ``foot`` place the two lines from the row's top and bottom.
+    """
+    if h >= 10 * mm:
+        txt(c, x, y + top, name, size=size, color=name_color, bold=True)
+        txt(c, x, y + h - foot, text, size=8, color=LIGHT_GRAY)
+        return
+    mid = y + h / 2 - 1 * mm
+    txt(c, x, mid, name, size=size, color=name_color, bold=True)
+    txt(c, x + text_width(name, font_name(c, True), size) + 3 * mm, mid + 0.3 * mm, text,
+        size=min(8, size), color=LIGHT_GRAY)
+
+
+def _scratch(c):
+    """An empty scene like ``c`` to measure a layout on without drawing it."""
+    return Scene(c.width, c.height, font=c.font, fonts=c.fonts)
+
+
+def _lines_h(c, text, size, max_w, line_h, bold=False):
+    """Height ``txt_wrap`` will take for ``text``."""
+    return line_h * len(wrap(text, font_name(c, bold), size, max_w))
+
+
+def _alt(i):
+    return CARD_BG if i % 2 == 0 else CARD_BG_ALT
+
+
+def _heading(c, p, default_heading, default_accent):
+    """Background, accent strip and page heading; returns the accent color."""
+    accent = color(p.get("accent"), default_accent)
+    bg(c)
+    accent_strip(c, accent)
+    txt(c, M, 12 * mm, p.get("heading", default_heading), size=28, color=WHITE_HEX, bold=True)
+    bar(c, M, 22 * mm, 30 * mm, 0.8 * mm, accent)
+    return accent
+
+
+# ================================================================
+# Title
+# ================================================================
+def title_page(c, p, folder):
+    inner = _inner_w(c)
+    # Landscape: the text takes the left half and the image the right.
+    landscape = c.width > c.height
+    text_w = (inner - 6 * mm) / 2 if landscape else inner
+    accent = color(p.get("accent"), ACCENT_ORANGE)
+    bg(c)
+    accent_strip(c, accent)
+
+    lines = p["title"] if isinstance(p["title"], list) else [p["title"]]
+    size = p.get("title_size", 42 if len(lines) == 1 else 38)
+    y = 14 * mm
+    for line in lines:
+        txt(c, M, y, line, size=size, color=WHITE_HEX, bold=True)
+        y += 14 * mm
+    y -= 3 * mm
+    bar(c, M, y, 35 * mm, 1 * mm, accent)
+
+    y += 6 * mm
+    if p.get("tagline"):
+        y = txt_wrap(c, M, y, p["tagline"], size=18, color=ACCENT_GREEN, max_w=text_w) + 5 * mm
+    if p.get("summary"):
+        y = txt_wrap(c, M, y, p["summary"], size=11, color=LIGHT_GRAY, max_w=text_w) + 6 * mm
+
+    img_path = os.path.join(folder, p["image"]) if p.get("image") else None
+    if img_path and os.path.exists(img_path):
+        if landscape:
+            image(c, img_path, M + text_w + 6 * mm, 8 * mm, text_w, c.height - 35.5 * mm)
+        else:
+            image(c, img_path, M, y, inner, c.height - 27.5 * mm - y)
+
+    card_flat(c, 0, c.height - 8 * mm, c.width, 8 * mm, CARD_BG)
+    if p.get("banner"):
+        txt(c, M, c.height - 5 * mm, p["banner"], size=9, color=LIGHT_GRAY)
+
+
+# ================================================================
+# The Problem
+# ================================================================
+def problem_page(c, p, folder):
+    inner = _inner_w(c)
+    accent = _heading(c, p, "The Problem", ACCENT_RED)
+
+    cards = p.get("cards", [])
+    audience_top = c.height - 37.5 * mm
+    pitch = min(55 * mm, (audience_top - 30 * mm) / max(1, len(cards)))
+    for i, item in enumerate(cards):
+        y_top = 30 * mm + i * pitch
+        col = color(item.get("color"), accent)
+        card(c, M, y_top, inner, pitch - 6 * mm, CARD_BG)
+        bar(c, M, y_top, inner, 1.5 * mm, col)
+        txt(c, M + 5 * mm, y_top + 8 * mm, item["title"], size=p.get("title_size", 16),
+            color=col, bold=True)
+        txt_fit(c, M + 5 * mm, y_top + 20 * mm, item.get("text", ""), pitch - 26 * mm,
+                size=11, color=LIGHT_GRAY, max_w=inner - 10 * mm, line_h=14)
+
+    audience = p.get("audience")
+    if audience:
+        card_flat(c, M, audience_top, inner, 30 * mm, CARD_BG)
+        txt(c, M + 4 * mm, audience_top + 4 * mm, audience.get("label", "TARGET USERS"), size=10,
+            color=color(audience.get("color"), ACCENT_PURPLE), bold=True)
+        for i, line in enumerate(audience.get("lines", [])[:2]):
+            txt(c, M + 4 * mm, audience_top + 13 * mm + i * 9 * mm, line, size=12,
+                color=WHITE_HEX, bold=True)
+
+
+# ================================================================
+# How It Works
+# ================================================================
+def steps_page(c, p, folder):
+    inner = _inner_w(c)
+    _heading(c, p, "How It Works", ACCENT_GREEN)
+
+    steps = p.get("steps", [])
+    pitch = min(50 * mm, (c.height - 33.5 * mm) / max(1, len(steps)))
+    for i, step in enumerate(steps):
+        y_top = 28 * mm + i * pitch
+        col = color(step.get("color"), ACCENT_BLUE)
+        card(c, M, y_top, inner, pitch - 6 * mm, CARD_BG)
+        circle_num(c, M + 4 * mm, y_top + 4 * mm, i + 1, col)
+        txt(c, M + 16 * mm, y_top + 6 * mm, step["title"], size=18, color=col, bold=True)
+        if step.get("subtitle"):
+            txt(c, M + 16 * mm, y_top + 16 * mm, step["subtitle"], size=11, color=WHITE_HEX,
+                bold=True)
+        txt_fit(c, M + 6 * mm, y_top + 26 * mm, step.get("text", ""), pitch - 32 * mm,
+                size=10, color=LIGHT_GRAY, max_w=inner - 12 * mm, line_h=13)
+
+
+# ================================================================
+# Architecture
+# ================================================================
+def architecture_page(c, p, folder):
+    accent = _heading(c, p, "Architecture", ACCENT_BLUE)
+    columns = _columns(c)
+    x, w = columns[0]
+
+    y = 28 * mm
+    for chain in p.get("chains", []):
+        legend = chain.get("legend")
+        h = 28 * mm if legend else 22 * mm
+        card(c, x, y, w, h, CARD_BG)
+        txt(c, x + 4 * mm, y + 4 * mm, chain["title"], size=11,
+            color=color(chain.get("color"), accent), bold=True)
+        txt(c, x + 4 * mm, y + (13 if legend else 12) * mm, chain.get("flow", ""),
+            size=chain.get("size", 12 if legend else 10), color=WHITE_HEX,
+            bold=chain.get("bold", True))
+        if legend:
+            txt(c, x + 4 * mm, y + 21 * mm, legend, size=8, color=LIGHT_GRAY)
+        y += h + 4 * mm
+
+    note = p.get("note")
+    note_top = c.height - (35.5 if note else 3.5) * mm
+
+    subsystems = p.get("subsystems")
+    if subsystems:
+        # Landscape: the subsystems get the right-hand column to themselves.
+        sx, sw = columns[-1]
+        if len(columns) > 1:
+            y, bottom = 26 * mm, c.height - 3.5 * mm
+        else:
+            bottom = note_top
+        y += 2 * mm
+        bar(c, sx, y, sw, 1 * mm, accent)
+        txt(c, sx, y + 4 * mm, subsystems.get("label", "SUBSYSTEMS"), size=11, color=accent,
+            bold=True)
+        items = subsystems.get("items", [])
+        y += 10 * mm
+        pitch = min(17 * mm, (bottom - 4 * mm - y) / max(1, len(items)))
+        h = pitch - 3 * mm
+        for i, item in enumerate(items):
+            y_top = y + i * pitch
+            card(c, sx, y_top, sw, h, _alt(i))
+            _row(c, sx + 4 * mm, y_top, h, item["name"], item.get("text", ""),
+                 11 if pitch >= 16 * mm else 10 if h >= 6 * mm else 8, WHITE_HEX)
+            bar(c, sx, y_top, 1.5 * mm, h, color(item.get("color"), accent))
+
+    if not note:
+        return
+    note_color = color(note.get("color"), ACCENT_PURPLE)
+    img_path = os.path.join(folder, note["image"]) if note.get("image") else None
+    if img_path:
+        if os.path.exists(img_path):
+            card(c, x, note_top, w, 30 * mm, CARD_BG_ALT)
+            txt(c, x + 4 * mm, note_top + 3 * mm, note.get("title", ""), size=10,
+                color=note_color, bold=True)
+            image(c, img_path, x + 4 * mm, note_top + 8 * mm, w - 8 * mm, 20 * mm)
+        return
+    card(c, x, note_top, w, 28 * mm, CARD_BG_ALT)
+    txt(c, x + 4 * mm, note_top + 4 * mm, note.get("title", ""), size=13, color=note_color,
+        bold=True)
+    txt_fit(c, x + 4 * mm, note_top + 14 * mm, note.get("text", ""), 14 * mm,
+            size=9, color=LIGHT_GRAY, max_w=w - 8 * mm, line_h=12)
+
+
+# ================================================================
+# Feature (the product's key idea, one page)
+# ================================================================
+def _feature_card_body(c, item, y, col):
+    """Draw a feature card's contents below its top edge ``y``; returns the bottom."""
+    inner = _inner_w(c)
+    cy = y + 18 * mm
+    end = y + 12 * mm
+    lines = item.get("lines", [])
+    for line in lines:
+        txt(c, M + 5 * mm, cy, line, size=13 if len(lines) < 3 else 12, color=WHITE_HEX)
+        end = cy + 4 * mm
+        cy += 10 * mm
+    if lines:
+        cy += 1 * mm
+    if item.get("detail"):
+        txt(c, M + 5 * mm, cy, item["detail"], size=11, color=LIGHT_GRAY)
+        end = cy + 4 * mm
+        cy += 7 * mm
+    if item.get("pulses"):
+        for offset in item["pulses"]:
+            bar(c, M + 5 * mm + offset * mm, cy, 15 * mm, 3 * mm, col)
+        cy += 3 * mm
+        end = cy
+    if item.get("text"):
+        size = 10 if lines else 11
+        cy = end = txt_wrap(c, M + 5 * mm, cy, item["text"], size=size,
+                            color=color(item.get("text_color"), LIGHT_GRAY),
+                            max_w=inner - 10 * mm, line_h=size + 3)
+    for outcome in item.get("outcomes", []):
+        txt(c, M + 5 * mm, cy, f"{outcome['label']}:", size=10,
+            color=color(outcome.get("color"), col), bold=True)
+        end = txt_wrap(c, M + 25 * mm, cy, outcome["text"], size=9, color=LIGHT_GRAY,
+                       max_w=inner - 30 * mm, line_h=12)
+        cy = end + 2 * mm
+    return end + 6 * mm
+
+
+def feature_page(c, p, folder):
+    inner = _inner_w(c)
+    accent = _heading(c, p, "Key Innovation", ACCENT_PURPLE)
+
+    y = 28 * mm
+    if p.get("intro"):
+        y = txt_wrap(c, M, y, p["intro"], size=13, color=LIGHT_GRAY, max_w=inner)
+    y = max(42 * mm, y + 4 * mm)
+
+    for item in p.get("cards", []):
+        col = color(item.get("color"), accent)
+        # Lay the contents out once off-page to size the card drawn beneath them.
+        h = _feature_card_body(_scratch(c), item, y, col) - y
+        card(c, M, y, inner, h, CARD_BG)
+        bar(c, M, y, inner, 1.5 * mm, col)
+        txt(c, M + 5 * mm, y + 6 * mm, item.get("title", ""), size=16, color=col, bold=True)
+        _feature_card_body(c, item, y, col)
+        y += h + 7 * mm
+
+    lst = p.get("list")
+    if not lst:
+        return
+    card(c, M, y, inner, max(c.height - 9.5 * mm - y, 20 * mm), CARD_BG_ALT)
+    txt(c, M + 5 * mm, y + 5 * mm, lst.get("title", ""), size=13,
+        color=color(lst.get("color"), ACCENT_ORANGE), bold=True)
+    ry = y + 17 * mm
+    for i, item in enumerate(lst.get("items", []), 1):
+        label = f"{i}. {item['title']}" if lst.get("numbered") else f"- {item['title']}:"
+        txt(c, M + 5 * mm, ry, label, size=10, color=WHITE_HEX, bold=True)
+        ry = txt_wrap(c, M + 8 * mm, ry + 12, item.get("text", ""),
+                      size=9, color=LIGHT_GRAY, max_w=inner - 16 * mm, line_h=12)
+        ry += 3 * mm
+
+
+# ================================================================
+# Constraints & BOM
+# ================================================================
+def constraints_bom_page(c, p, folder):
+    accent = _heading(c, p, "Constraints & BOM", ACCENT_ORANGE)
+    columns = _columns(c)
+    x, w = columns[0]
+
+    constraints = p.get("constraints", [])
+    bom = p.get("bom")
+    # The constraints get about half the height above the BOM's floor, or
+    # all of it when the BOM has a column of its own.
+    share = 0.51 if bom and len(columns) == 1 else 1.0
+    pitch = min(17 * mm, (c.height - 37.5 * mm) * share / max(1, len(constraints)))
+    h = pitch - 3 * mm
+    for i, item in enumerate(constraints):
+        y_top = 28 * mm + i * pitch
+        card(c, x, y_top, w, h, _alt(i))
+        _row(c, x + 4 * mm, y_top, h, item["name"], item.get("note", ""),
+             11 if h >= 6 * mm else 9, accent, top=3.5 * mm, foot=4 * mm)
+        txt(c, x + 4 * mm, y_top + (3.5 * mm if h >= 10 * mm else h / 2 - 1.5 * mm),
+            item.get("value", ""), size=11 if h >= 6 * mm else 9, color=WHITE_HEX,
+            bold=True, align="right", max_w=w - 8 * mm)
+
+    if not bom:
+        return
+    y = 28 * mm + len(constraints) * pitch + 3 * mm
+    if len(columns) > 1:
+        x, w = columns[1]
+        y = 28 * mm
+    bar(c, x, y, w, 1 * mm, ACCENT_GREEN)
+    txt(c, x, y + 4 * mm, bom.get("label", "BOM ESTIMATE"), size=11, color=ACCENT_GREEN,
+        bold=True)
+
+    items = bom.get("items", [])
+    y += 11 * mm
+    limit = c.height - (30.5 if bom.get("footnote") else 9.5) * mm
+    pitch = min(9 * mm, (limit - y) / max(1, len(items)))
+    h = pitch - 1 * mm
+    size = 9 if pitch >= 8.5 * mm else 8 if pitch >= 6.5 * mm else 7.5
+    for i, (item, cost) in enumerate(items):
+        y_top = y + i * pitch
+        card_flat(c, x + 2 * mm, y_top, w - 4 * mm, h, _alt(i))
+        txt(c, x + 6 * mm, y_top + (h - 3 * mm) / 2, item, size=size, color=SOFT_WHITE)
+        txt(c, x + 6 * mm, y_top + (h - 3 * mm) / 2, cost, size=size, color=WHITE_HEX,
+            bold=True, align="right", max_w=w - 16 * mm)
+    y += len(items) * pitch
+
+    if bom.get("total"):
+        label, value = bom["total"]
+        card_flat(c, x + 2 * mm, y, w - 4 * mm, 7 * mm, ACCENT_ORANGE)
+        txt(c, x + 6 * mm, y + 2 * mm, label, size=10, color=WHITE_HEX, bold=True)
+        txt(c, x + 6 * mm, y + 2 * mm, value, size=10, color=WHITE_HEX, bold=True,
+            align="right", max_w=w - 16 * mm)
+    if bom.get("footnote"):
+        txt_wrap(c, x, y + 12 * mm, bom["footnote"], size=9, color=LIGHT_GRAY, max_w=w)
+
+
+# ================================================================
+# Hardest Problems
+# ================================================================
+def hardest_problems_page(c, p, folder):
+    inner = _inner_w(c)
+    accent = _heading(c, p, "Hardest Problems", ACCENT_RED)
+
+    problems = p.get("problems", [])
+    pitch = min(62 * mm, (c.height - 51.5 * mm) / max(1, len(problems)))
+    for i, item in enumerate(problems):
+        y_top = 30 * mm + i * pitch
+        card(c, M, y_top, inner, pitch - 6 * mm, CARD_BG)
+        circle_num(c, M + 4 * mm, y_top + 4 * mm, i + 1, accent)
+        txt(c, M + 16 * mm, y_top + 6 * mm, item["title"], size=13, color=WHITE_HEX, bold=True)
+        txt_fit(c, M + 6 * mm, y_top + 18 * mm, item.get("text", ""), pitch - 24 * mm,
+                size=10, color=LIGHT_GRAY, max_w=inner - 12 * mm, line_h=13)
+
+    if p.get("note"):
+        h = 8 * mm + _lines_h(c, p["note"], 11, inner - 8 * mm, 14)
+        card_flat(c, M, c.height - 3.5 * mm - h, inner, h, CARD_BG)
+        txt_wrap(c, M + 4 * mm, c.height + 0.5 * mm - h, p["note"],
+                 size=11, color=ACCENT_ORANGE, max_w=inner - 8 * mm, line_h=14)
+
+
+# ================================================================
+# Gate Result & Next
+# ================================================================
+def _gate_lists(c, lists, x, w, y, row):
+    """Draw the gate page's lists from ``y``, ``row`` apart; returns the bottom."""
+    for lst in lists:
+        col = color(lst.get("color"), ACCENT_ORANGE)
+        y += 2 * mm
+        bar(c, x, y, w, 1 * mm, col)
+        txt(c, x, y + 4 * mm, lst["label"], size=11, color=col, bold=True)
+        y += 10 * mm
+        rows = lst.get("rows", [])
+        if rows:
+            tag_w = max(text_width(tag, font_name(c, True), 9) for tag, _ in rows)
+            text_x = x + 4 * mm + max(14 * mm, tag_w + 6 * mm)
+        for i, (tag, text) in enumerate(rows):
+            card(c, x, y, w, row - 2 * mm, _alt(i))
+            txt(c, x + 4 * mm, y + (row - 2 * mm) * 0.3, tag, size=9, color=col, bold=True)
+            txt(c, text_x, y + (row - 2 * mm) * 0.3, text, size=9, color=SOFT_WHITE)
+            y += row
+        if lst.get("bullets"):
+            y += 2 * mm
+        for item in lst.get("bullets", []):
+            y = txt_wrap(c, x + 4 * mm, y, f"- {item}", size=9, color=LIGHT_GRAY,
+                         max_w=w - 8 * mm, line_h=12) + 1 * mm
+        y += 2 * mm
+    return y
+
+
+def gate_page(c, p, folder):
+    inner = _inner_w(c)
+    _heading(c, p, "Gate Result & Next", ACCENT_GREEN)
+    columns = _columns(c)
+    x, w = columns[0]
+
+    y = 28 * mm
+    badge = p.get("badge")
+    if badge:
+        badge_color = color(badge.get("color"), ACCENT_GREEN)
+        card(c, x, y, w, 22 * mm, CARD_BG)
+        card(c, x + 4 * mm, y + 3 * mm, 50 * mm, 16 * mm, badge_color)
+        txt(c, x + 8 * mm, y + 7 * mm, badge["label"], size=16, color=WHITE_HEX, bold=True)
+        txt(c, x + 8 * mm, y + 15 * mm, badge.get("detail", ""), size=9, color=WHITE_HEX)
+        for i, line in enumerate(p.get("status", [])[:2]):
+            txt(c, x + 60 * mm, y + (8 + 8 * i) * mm, line, size=11,
+                color=badge_color if i else WHITE_HEX, bold=bool(i))
+        y += 26 * mm
+
+    for i, fact in enumerate(p.get("facts", [])):
+        lines = fact.get("lines", [])
+        h = 8 * mm + 7 * mm * len(lines)
+        card(c, x, y, w, h, _alt(i))
+        txt(c, x + 4 * mm, y + 4 * mm, fact["label"], size=10,
+            color=color(fact.get("color"), ACCENT_BLUE), bold=True)
+        for j, line in enumerate(lines):
+            txt(c, x + 4 * mm, y + (12 + 7 * j) * mm, line, size=10,
+                color=LIGHT_GRAY if j else WHITE_HEX)
+        y += h + 4 * mm
+
+    cta = p.get("cta")
+    cta_h = 8 * mm + _lines_h(c, cta, 10, inner - 8 * mm, 13) if cta else 0
+
+    # Landscape: the lists take the right-hand column. Rows close up (to
+    # 8 mm apart) when the lists would otherwise run into the call to action.
+    lists = p.get("lists", [])
+    x, w = columns[-1]
+    if len(columns) > 1:
+        y = 28 * mm - 2 * mm
+    row = 12 * mm
+    # The lists end in 4 mm of spacing, which may overlap the call to action.
+    overrun = _gate_lists(_scratch(c), lists, x, w, y, row) - 4 * mm \
+        - (c.height - 3.5 * mm - cta_h)
+    n_rows = sum(len(lst.get("rows", [])) for lst in lists)
+    if overrun > 0 and n_rows:
+        row = max(8 * mm, row - overrun / n_rows)
+        if row == 8 * mm and overrun > 4 * mm * n_rows:
+            warn(c, f"the lists run {(overrun - 4 * mm * n_rows) / mm:.1f} mm into the "
+                 "call to action")
+    _gate_lists(c, lists, x, w, y, row)
+
+    if cta:
+        card(c, M, c.height - 3.5 * mm - cta_h, inner, cta_h, CARD_BG)
+        txt_wrap(c, M + 4 * mm, c.height + 0.5 * mm - cta_h, cta,
+                 size=10, color=WHITE_HEX, max_w=inner - 8 * mm, line_h=13)
+
+
+PAGE_TYPES = {
+    "title": title_page,
+    "problem": problem_page,
+    "steps": steps_page,
+    "architecture": architecture_page,
+    "feature": feature_page,
+    "constraints_bom": constraints_bom_page,
+    "hardest_problems": hardest_problems_page,
+    "gate": gate_page,
+}
+
+
+def build_scene(content, folder, aspect=DEFAULT_ASPECT):
+    """Lay out every page of ``content`` (from ``toolkit.content.load``).
+
+    ``aspect`` is a key of ``carousel.ASPECTS`` and sets the page size.
+    """
+    pages = content["pages"]
+    c = Scene(*ASPECTS[aspect])
+    files = font_files(content, folder)
+    if files:
+        with span("register fonts"):
+            c.font, c.fonts = register_family(files["regular"], files.get("bold"))
+    for i, page in enumerate(pages, 1):
+        try:
+            layout = PAGE_TYPES[page["type"]]
+        except KeyError:
+            raise ValueError(f"Page {i}: unknown type {page['type']!r}; "
+                             f"expected one of {sorted(PAGE_TYPES)}") from None
+        with span("layout page", page=i, type=page["type"]):
+            layout(c, page, folder)
+        footer(c, i, len(pages))
+        c.show_page()
+    return c
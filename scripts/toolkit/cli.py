@@ -0,0 +1,193 @@
+"""Command line shared by the carousel scripts.
+
+A carousel script ends in ``carousel_main(__file__, build_scene, pdf=...,
+pptx=...)``, which handles the flags below, the build manifest and the
+summary lines. ``build_scene(aspect)`` lays the carousel out for one key of
+``carousel.ASPECTS``; every aspect asked for with ``--aspect`` is built and
+rendered in one batch. Scripts with arguments of their own add them to
+``make_parser()`` and pass the parsed ``args`` in.
+"""
+
+import argparse
+import os
+from dataclasses import replace
+
+from . import manifest
+from .carousel import ASPECTS, DEFAULT_ASPECT
+from .profiling import span
+from .render import render_batch
+from .scene import mm
+
+RASTER_WIDTH = 1080  # raster_backend.WIDTH, without importing the backend
+
+
+def page_range(value):
+    """``"5"`` -> (5, 5); ``"3-5"`` -> (3, 5)."""
+    first, _, last = value.partition("-")
+    try:
+        first, last = int(first), int(last or first)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected N or N-M, got {value!r}")
+    if not 1 <= first <= last:
+        raise argparse.ArgumentTypeError(f"invalid page range {value!r}")
+    return first, last
+
+
+def byte_size(value):
+    """``"2000000"``, ``"500K"``, ``"1.5M"`` or ``"2MB"`` -> bytes (K and M are 1024-based)."""
+    text = value.strip().upper().removesuffix("B")
+    scale = {"K": 1 << 10, "M": 1 << 20}.get(text[-1:], 1)
+    try:
+        n = float(text[:-1] if scale > 1 else text) * scale
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a size such as 2M or 500K, got {value!r}")
+    if n <= 0:
+        raise argparse.ArgumentTypeError(f"invalid size {value!r}")
+    return int(n)
+
+
+def aspect_list(value):
+    """``"4:5,9:16"`` -> ("4:5", "9:16"); ``"all"`` -> every key of ``ASPECTS``."""
+    if value == "all":
+        return tuple(ASPECTS)
+    aspects = tuple(dict.fromkeys(v.strip() for v in value.split(",")))
+    for a in aspects:
+        if a not in ASPECTS:
+            raise argparse.ArgumentTypeError(
+                f"unknown aspect ratio {a!r}; expected all or some of {', '.join(ASPECTS)}")
+    return aspects
+
+
+def aspect_path(path, aspect):
+    """``path`` for ``aspect``: unchanged for the default, else with ``_WxH`` added."""
+    if aspect == DEFAULT_ASPECT:
+        return path
+    stem, ext = os.path.splitext(path)
+    return f"{stem}_{aspect.replace(':', 'x')}{ext}"
+
+
+# --format value -> the outputs it builds.
+FORMATS = {
+    "pdf": ("pdf",),
+    "pptx": ("pptx",),
+    "png": ("png",),
+    "webp": ("webp",),
+    "both": ("pdf", "pptx"),
+    "all": ("pdf", "pptx", "png"),
+}
+
+
+def make_parser(description="Build the carousel PDF and/or PPTX."):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--format", choices=tuple(FORMATS), default="both",
+                        help="which output to build: both = pdf + pptx, all adds one PNG "
+                        "per page; png and webp write a folder of page images (default: both)")
+    parser.add_argument("--width", metavar="PX", type=int, default=RASTER_WIDTH,
+                        help="pixel width of PNG/WebP pages; other than the default the "
+                        f"folder name ends in _<PX>px (default: {RASTER_WIDTH}, 1080x1350 "
+                        "for 4:5)")
+    parser.add_argument("--aspect", metavar="RATIO[,RATIO...]", type=aspect_list,
+                        default=(DEFAULT_ASPECT,),
+                        help=f"page aspect ratios to build, {', '.join(ASPECTS)} or all; "
+                        f"all but {DEFAULT_ASPECT} are saved as <name>_WxH.<ext> "
+                        f"(default: {DEFAULT_ASPECT})")
+    parser.add_argument("--max-bytes", metavar="SIZE", type=byte_size,
+                        help="largest PDF to write, e.g. 2M: a bigger one is rebuilt with "
+                        "lower image quality, resolution and colours until it fits "
+                        "(see toolkit.budget)")
+    parser.add_argument("--force", action="store_true",
+                        help="rebuild even if the inputs are unchanged")
+    parser.add_argument("--pages", metavar="N[-M]", type=page_range,
+                        help="build only pages N..M, saved as <name>.pN-M.<ext>")
+    parser.add_argument("--profile", action="store_true",
+                        help="write a Chrome trace of per-page and per-helper timings "
+                        "(also ELECTRUM_PROFILE=1 or =<path>; see toolkit.profiling)")
+    return parser
+
+
+def parse_args(argv=None):
+    return make_parser().parse_args(argv)
+
+
+def _build_pages(build_scene, outputs, pages, raster_width, max_bytes=None):
+    first, last = pages
+    label = f"{first}-{last}" if first != last else str(first)
+    batch = []
+    for aspect, paths in outputs.items():
+        scene = build_scene(aspect)
+        if last > len(scene.pages):
+            raise SystemExit(f"--pages {first}-{last}: the carousel has {len(scene.pages)} pages")
+        part = replace(scene, pages=scene.pages[first - 1:last])
+        batch.append((part, {fmt: "{0}.p{2}{1}".format(*os.path.splitext(path), label)
+                             for fmt, path in paths.items()}))
+    render_batch(batch, raster_width=raster_width)
+    if max_bytes:
+        _fit(batch, max_bytes)
+    for _, paths in batch:
+        for path in paths.values():
+            print(f"Saved page{'s' if first != last else ''} {label} of {len(scene.pages)} "
+                  f"to {path}")
+
+
+def _fit(batch, max_bytes):
+    """Shrink each PDF of ``batch`` (scene, paths) to at most ``max_bytes``."""
+    from .budget import fit_pdf
+
+    for scene, paths in batch:
+        if "pdf" in paths:
+            fit_pdf(scene, paths["pdf"], max_bytes)
+
+
+def carousel_main(script, build_scene, pdf, pptx, png=None, webp=None, args=None,
+                  inputs=()):
+    """Build the requested outputs of one carousel script.
+
+    ``png`` and ``webp`` are the directories for the per-page images
+    (default: the PDF's name with ``_pages`` and ``_webp``). ``inputs`` are
+    data files the scene is built from (content YAML, Markdown); with the
+    script and the toolkit they decide whether the outputs are up to date.
+    A PDF over ``--max-bytes`` is shrunk by ``toolkit.budget``; the budget
+    is recorded with the build, so outputs built under another one (or
+    none) are not up to date. Only the backends of the requested formats are
+    imported.
+    """
+    if args is None:
+        args = parse_args()
+    outputs = {}
+    px = f"_{args.width}px" if args.width != RASTER_WIDTH else ""
+    for aspect in args.aspect:
+        stem = os.path.splitext(aspect_path(pdf, aspect))[0]
+        paths = {"pdf": aspect_path(pdf, aspect), "pptx": aspect_path(pptx, aspect),
+                 "png": (aspect_path(png, aspect) if png else stem + "_pages") + px,
+                 "webp": (aspect_path(webp, aspect) if webp else stem + "_webp") + px}
+        outputs[aspect] = {fmt: paths[fmt] for fmt in FORMATS[args.format]}
+    if args.pages:
+        _build_pages(build_scene, outputs, args.pages, args.width, args.max_bytes)
+        return
+    paths = [path for per_aspect in outputs.values() for path in per_aspect.values()]
+    inputs = [script, *manifest.toolkit_sources(), *inputs]
+    settings = {"max_bytes": args.max_bytes} if args.max_bytes else None
+    if not args.force and manifest.up_to_date(paths, inputs, settings):
+        return
+    batch = []
+    for aspect, per_aspect in outputs.items():
+        with span("build scene", aspect=aspect):
+            batch.append((build_scene(aspect), per_aspect))
+    render_batch(batch, raster_width=args.width)
+    if args.max_bytes:
+        _fit(batch, args.max_bytes)
+    manifest.record(paths, inputs + sorted({p for scene, _ in batch
+                                            for p in scene.image_paths()}), settings)
+
+    for aspect, (scene, per_aspect) in zip(outputs, batch):
+        pages = len(scene.pages)
+        if "pdf" in per_aspect:
+            print(f"Saved {pages}-page carousel PDF to {per_aspect['pdf']}")
+            print(f"Page size: {scene.width/mm:.0f} x {scene.height/mm:.0f} mm "
+                  f"({aspect} ratio)")
+        if "pptx" in per_aspect:
+            print(f"Saved {pages}-slide carousel PPTX to {per_aspect['pptx']}")
+        if "png" in per_aspect:
+            print(f"Saved {pages} page PNGs to {per_aspect['png']}")
+        if "webp" in per_aspect:
+            print(f"Saved {pages} page WebPs to {per_aspect['webp']}")
@@ -0,0 +1,307 @@
+"""Carousel content: what each page says, loaded from the product folder.
+
+A product's copy lives next to its documents instead of in a forked build
+script. ``load(folder)`` looks, in order, for:
+
+1. ``carousel.yaml`` in the folder;
+2. a YAML front-matter block (between ``---`` lines) at the top of
+   ``high_level_design.md``;
+3. nothing: a draft carousel is derived from the Markdown itself (the
+   "What It Is" paragraph, the Subsystems and Constraints tables, the
+   "Three Hardest Problems" list).
+
+Any value in the YAML may instead point into the Markdown, e.g.::
+
+    constraints: {md: "high_level_design.md#Constraints",
+                  columns: [name, value, note]}
+
+which becomes one ``{name, value, note}`` dict per table row (columns are
+taken in order, or by header when ``columns`` is a mapping). A section
+without a table gives its numbered/bulleted list as ``{title, text}``
+items, and otherwise its first paragraph as a string.
+
+The carousel is set in Helvetica unless ``font`` names TrueType files,
+relative to the folder, either one file or a family::
+
+    font: {regular: fonts/Brand-Regular.ttf, bold: fonts/Brand-Bold.ttf}
+
+(see ``font_files`` and ``toolkit.fonts``).
+
+Parsed content is cached under ``<cache>/content`` keyed by the hashes of
+the folder's YAML and Markdown, so a rebuild after an unrelated change
+does not even import the YAML parser.
+"""
+
+import hashlib
+import os
+import pickle
+import re
+from functools import lru_cache
+
+from .cache import cache_dir, file_hash
+
+CONTENT_FILE = "carousel.yaml"
+DESIGN_FILE = "high_level_design.md"
+DESCRIPTION_FILE = "system_description.md"
+
+_VERSION = 1
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_ITEM_RE = re.compile(r"^\s*(?:\d+[.)]|[-*+])\s+(.*)")
+_BOLD_LEAD_RE = re.compile(r"^\*\*(.+?)\*\*\s*(.*)")
+_FRONT_MATTER_RE = re.compile(r"\A---\s*\n(.*?)\n---\s*\n", re.S)
+
+# Glyphs the standard PDF fonts cannot draw.
+_PLAIN = str.maketrans({"→": "->", "←": "<-", "≤": "<=", "≥": ">=", "≈": "~"})
+
+
+class ContentError(ValueError):
+    """Raised for carousel content that cannot be used."""
+
+
+def sources(folder):
+    """The files ``load(folder)`` may read; the carousel's data inputs."""
+    names = sorted(n for n in os.listdir(folder) if n == CONTENT_FILE or n.endswith(".md"))
+    return [os.path.join(folder, n) for n in names]
+
+
+def font_files(data, folder):
+    """The TrueType files ``data["font"]`` names, as ``{"regular", "bold"}`` paths.
+
+    Empty when the content sets no font; ``bold`` is missing when only a
+    regular file is given.
+    """
+    font = data.get("font")
+    if not font:
+        return {}
+    if isinstance(font, str):
+        font = {"regular": font}
+    if not isinstance(font, dict) or not font.get("regular") \
+            or set(font) - {"regular", "bold"}:
+        raise ContentError(f"{folder}: 'font' must be a .ttf path or {{regular, bold}} paths")
+    files = {k: os.path.join(folder, v) for k, v in font.items()}
+    for path in files.values():
+        if not os.path.isfile(path):
+            raise ContentError(f"{folder}: font file {path} not found")
+    return files
+
+
+# -- Markdown --------------------------------------------------------------
+
+def _clean(text):
+    text = re.sub(r"\*\*(.+?)\*\*|__(.+?)__", lambda m: m.group(1) or m.group(2), text)
+    text = re.sub(r"`([^`]*)`", r"\1", text)
+    return text.translate(_PLAIN).strip()
+
+
+@lru_cache(maxsize=None)
+def parse_markdown(path):
+    """``(title, {heading: body})`` for a Markdown file.
+
+    ``title`` is the first heading; each body runs to the next heading of
+    any level. Fenced code blocks are skipped.
+    """
+    title, sections, current, fenced = None, {}, None, False
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.lstrip().startswith("```"):
+                fenced = not fenced
+                continue
+            m = None if fenced else _HEADING_RE.match(line)
+            if m:
+                current = m.group(2)
+                title = title or current
+                sections.setdefault(current, [])
+            elif current is not None and not fenced:
+                sections[current].append(line.rstrip("\n"))
+    return title, {k: "\n".join(v).strip() for k, v in sections.items()}
+
+
+def table(body):
+    """Rows of the first Markdown table in ``body`` as lists of cells."""
+    rows = []
+    for line in body.splitlines():
+        line = line.strip()
+        if not line.startswith("|"):
+            if rows:
+                break
+            continue
+        cells = [_clean(c) for c in line.strip("|").split("|")]
+        if not all(set(c) <= set("-: ") for c in cells):
+            rows.append(cells)
+    return rows
+
+
+def list_items(body):
+    """Numbered or bulleted items as ``{title, text}``.
+
+    A leading bold phrase becomes the title (a trailing colon dropped);
+    items without one have an empty title.
+    """
+    items = []
+    for line in body.splitlines():
+        m = _ITEM_RE.match(line)
+        if m:
+            items.append(m.group(1))
+        elif items and line.startswith((" ", "\t")) and line.strip():
+            items[-1] += " " + line.strip()
+    out = []
+    for item in items:
+        m = _BOLD_LEAD_RE.match(item)
+        title, text = (m.group(1), m.group(2)) if m else ("", item)
+        out.append({"title": _clean(title).rstrip(":"), "text": _clean(text.lstrip(":"))})
+    return out
+
+
+def paragraph(body):
+    """The first paragraph of ``body``, joined onto one line."""
+    lines = []
+    for line in body.splitlines():
+        if not line.strip():
+            if lines:
+                break
+            continue
+        lines.append(line.strip())
+    return _clean(" ".join(lines))
+
+
+def section(folder, ref):
+    """Body of ``"file.md#Heading"``; the heading matches case-insensitively."""
+    name, _, heading = ref.partition("#")
+    path = os.path.join(folder, name)
+    if not os.path.exists(path):
+        raise ContentError(f"{ref}: no such file in {folder}")
+    _, sections = parse_markdown(path)
+    for key, body in sections.items():
+        if key.lower() == heading.lower():
+            return body
+    raise ContentError(f"{ref}: no such heading")
+
+
+def product_name(folder):
+    """The product name from the design documents' titles, else the folder name."""
+    for name, pattern in ((DESIGN_FILE, r"^(.*?)\s+—\s+High-Level"),
+                          (DESCRIPTION_FILE, r"^System Description:\s*(.*)$")):
+        path = os.path.join(folder, name)
+        if os.path.exists(path):
+            m = re.match(pattern, parse_markdown(path)[0] or "")
+            if m:
+                return _clean(m.group(1))
+    return os.path.basename(os.path.abspath(folder)).replace("-", " ").replace("_", " ").title()
+
+
+# -- Resolution ------------------------------------------------------------
+
+def _from_markdown(folder, spec):
+    body = section(folder, spec["md"])
+    rows = table(body)
+    if rows:
+        header, rows = rows[0], rows[1:]
+        columns = spec.get("columns")
+        if isinstance(columns, dict):
+            index = {h.lower(): i for i, h in enumerate(header)}
+            try:
+                picks = [(k, index[h.lower()]) for k, h in columns.items()]
+            except KeyError as e:
+                raise ContentError(f"{spec['md']}: no column {e.args[0]!r}") from None
+            out = [{k: row[i] for k, i in picks} for row in rows]
+        elif columns:
+            out = [dict(zip(columns, row)) for row in rows]
+        else:
+            out = [dict(zip(header, row)) for row in rows]
+    else:
+        out = list_items(body) or paragraph(body)
+    limit = spec.get("limit")
+    return out[:limit] if limit and isinstance(out, list) else out
+
+
+def resolve(folder, value):
+    """Replace every ``{md: ...}`` mapping inside ``value`` with its Markdown."""
+    if isinstance(value, dict):
+        if "md" in value:
+            return _from_markdown(folder, value)
+        return {k: resolve(folder, v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [resolve(folder, v) for v in value]
+    return value
+
+
+def draft_pages(folder):
+    """Pages derived from a standard ``high_level_design.md`` alone."""
+    design = os.path.join(folder, DESIGN_FILE)
+    if not os.path.exists(design):
+        raise ContentError(f"{folder}: no {CONTENT_FILE} and no {DESIGN_FILE} to draft from")
+    _, sections = parse_markdown(design)
+    pages = [{"type": "title",
+              "summary": {"md": f"{DESIGN_FILE}#What It Is"},
+              "banner": "Product Overview  |  Concept Stage"}]
+    if "Subsystems" in sections:
+        pages.append({"type": "architecture", "subsystems": {
+            "items": {"md": f"{DESIGN_FILE}#Subsystems", "columns": ["name", "text"]}}})
+    if "Constraints" in sections:
+        pages.append({"type": "constraints_bom", "constraints": {
+            "md": f"{DESIGN_FILE}#Constraints", "columns": ["name", "value", "note"],
+            "limit": 6}})
+    if "Three Hardest Problems" in sections:
+        pages.append({"type": "hardest_problems",
+                      "problems": {"md": f"{DESIGN_FILE}#Three Hardest Problems"}})
+    return pages
+
+
+def _read(folder):
+    import yaml
+
+    path = os.path.join(folder, CONTENT_FILE)
+    data = None
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+    else:
+        design = os.path.join(folder, DESIGN_FILE)
+        if os.path.exists(design):
+            with open(design, encoding="utf-8") as f:
+                m = _FRONT_MATTER_RE.match(f.read())
+            if m:
+                data = yaml.safe_load(m.group(1)) or {}
+    data = dict(data or {})
+    if not isinstance(data.get("pages", []), list):
+        raise ContentError(f"{folder}: 'pages' must be a list")
+    if "font" in data:
+        font_files(data, folder)  # fail here rather than mid-layout
+    data.setdefault("product", product_name(folder))
+    data.setdefault("output", re.sub(r"\W+", "_", data["product"]).strip("_") + "_Carousel")
+    data.setdefault("pages", draft_pages(folder))
+    for page in data["pages"]:
+        if "type" not in page:
+            raise ContentError(f"{folder}: every page needs a 'type'")
+        if page["type"] == "title":
+            page.setdefault("title", data["product"])
+    return resolve(folder, data)
+
+
+@lru_cache(maxsize=None)
+def _load(folder):
+    h = hashlib.sha256(f"v{_VERSION}".encode())
+    for path in sources(folder):
+        h.update(f"{os.path.basename(path)}:{file_hash(path)}\n".encode())
+    cached = os.path.join(cache_dir("content"), h.hexdigest() + ".pickle")
+    try:
+        with open(cached, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    data = _read(folder)
+    tmp = f"{cached}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(data, f)
+    os.replace(tmp, cached)
+    return data
+
+
+def load(folder):
+    """The carousel content of a product folder (see the module docstring).
+
+    Returns a dict with ``product``, ``output`` (file name stem) and
+    ``pages``; each page is a dict with at least a ``type``.
+    """
+    return _load(os.path.abspath(folder))
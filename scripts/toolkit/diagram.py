@@ -0,0 +1,526 @@
+"""Block diagrams from a declarative spec, rendered once per distinct spec.
+
+A diagram is data: groups, blocks, edges, a legend, in a YAML (or JSON)
+file next to the product's documents, e.g. ``block_diagram.yaml``::
+
+    output: block_diagram.png        # relative to the spec; .png, .svg or .pdf
+    size: [14, 9]                    # inches, and the coordinate range
+    dpi: 180                         # PNG resolution (default DPI)
+    title: Bubbler -- System Block Diagram
+    style: {block: fill, edge_label: above}
+    colors: {mech: "#3a5ba0", signal: "#ffdd57"}
+    groups:
+      - {label: SENSOR NODE, box: [0.3, 0.5, 5.4, 8.0], color: teal}
+    blocks:
+      - {id: mcu, label: MCU + Firmware, sublabel: "control loop",
+         box: [4.5, 5.5, 3.5, 1.5], color: mech}
+      - {id: adc, label: HX711 ADC, box: [9.0, 5.5, 2.5, 1.0], color: sense}
+    edges:
+      - {from: mcu, to: adc, label: SPI, color: signal}
+      - {from: [8.5, 3.3], to: adc.bottom, label: analog mV, curve: -0.15}
+    legend: {at: [1.5, 0.15], step: 3.2, kind: line,
+             items: [{color: signal, label: Signal / Data}]}
+
+Boxes are ``[x, y, w, h]`` with y up, in the units of ``size``. An edge
+end is a point, a block id (the side facing the other end) or
+``id.top``/``bottom``/``left``/``right``. Colours are ``#RRGGBB`` or
+names from ``colors`` (or the built-in ones in ``COLORS``). Free
+``texts`` ({text, at, color, size, bold, italic, align}) and ``lines``
+({points, color, width, dashed}) cover separators and annotations.
+
+Leave out every block's ``box`` and the diagram is laid out for you
+(``toolkit.layout``): blocks go in ranks along the edges, a block's
+``group`` (a group ``id``) keeps it with its group, whose box is then
+drawn around its members, and edges are routed around the blocks.
+Edge ends are then block ids, and ``size`` fits the layout unless given.
+A top-level ``layout`` mapping tunes it::
+
+    layout: {direction: LR, routing: orthogonal, node: [2.2, 1.2], gap: [1.6, 0.5]}
+
+``direction`` is LR or TB, ``routing`` orthogonal or curved, ``node`` the
+default block size (a block's own ``width``/``height`` win), ``gap`` the
+space between ranks and between blocks of a rank, ``group_gap`` the
+space between groups.
+
+``style`` picks between the two looks the hand-written diagrams had:
+``block: strip`` (a dark card with a coloured border and title strip) or
+``fill`` (a block filled with its colour), and ``edge_label: boxed`` (on
+a background patch at the middle of the edge) or ``above``. See
+``STYLE`` for every key and its default. ``theme: light`` starts from
+the light keys of ``THEMES`` instead, for documents on white paper.
+
+A block's ``shape`` is ``rect`` (the default), ``round`` (a pill),
+``circle``, ``ring`` (a dot in a circle, a state machine's final state)
+or ``diamond``; shapes other than ``rect`` carry their label centred.
+``text_color`` overrides a block's label colour, and an edge with
+``dashed: true`` is drawn dashed.
+
+``render(spec, out)`` draws with matplotlib (no pyplot, the shapes
+batched into collections by ``toolkit.drawing``) and keeps the result
+under ``<cache>/diagrams`` keyed by a hash of the spec, this module, the
+drawing and layout modules and the matplotlib version, so an unchanged
+diagram is copied, not drawn.
+"""
+
+import copy
+import filecmp
+import hashlib
+import json
+import os
+import shutil
+
+from .cache import cache_dir, file_hash
+from .images import vector_metadata
+
+_VERSION = 1
+
+_DIR = os.path.dirname(os.path.abspath(__file__))
+# The modules a render depends on (the layout engine is imported only when used).
+SOURCES = tuple(os.path.join(_DIR, name) for name in ("diagram.py", "drawing.py", "layout.py"))
+
+DPI = 200
+
+# Style keys and their defaults (the dark theme of the carousel).
+STYLE = {
+    "background": "#0F172A",
+    "block": "strip",  # strip | fill
+    "card": "#18223A",  # block face with ``block: strip``
+    "border": "#555577",  # block border with ``block: fill``
+    "text": "#FFFFFF",
+    "label": None,  # text on a block's colour (strip or fill); None is ``text``
+    "sublabel": "#C8D0E0",
+    "muted": "#8899AA",  # legend text, default edge colour
+    "title": None,  # title colour; None is ``text``
+    "title_size": 16,
+    "label_size": 9,
+    "sublabel_size": 7,
+    "edge_label": "boxed",  # boxed | above
+    "edge_label_size": 7,
+    "arrow_size": 10,
+}
+
+THEMES = {
+    "dark": STYLE,
+    "light": dict(STYLE, background="#FFFFFF", card="#F4F6FB", border="#C3CAD9",
+                  text="#1A1A2E", label="#FFFFFF", sublabel="#4A5568", muted="#6B7280"),
+}
+
+COLORS = {
+    "teal": "#00BFA5",
+    "blue": "#009BF5",
+    "purple": "#9B6DFF",
+    "orange": "#FF8C00",
+    "red": "#FF4545",
+    "green": "#4EC978",
+    "yellow": "#FFD700",
+    "gray": "#8899AA",
+    "white": "#FFFFFF",
+}
+
+FORMATS = (".png", ".svg", ".pdf")
+# The metadata key matplotlib dates each format with.
+_DATE_KEYS = {".svg": "Date", ".pdf": "CreationDate"}
+SHAPES = ("rect", "round", "circle", "ring", "diamond")
+_SIDES = ("top", "bottom", "left", "right")
+
+# How far each block style's outline is drawn outside its box.
+_PAD = {"strip": 0.12, "fill": 0.08}
+_GROUP_PAD = 0.2
+
+# Automatic layout: room around a group's members (sides, label above)
+# and around the whole diagram.
+_GROUP_MARGIN = 0.3
+_GROUP_LABEL = 0.5
+_MARGIN = 0.4
+
+
+class DiagramError(ValueError):
+    """Raised for a diagram spec that cannot be drawn."""
+
+
+def load(path):
+    """The spec in the YAML or JSON file at ``path``, with ``output`` made absolute."""
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".json"):
+            spec = json.load(f)
+        else:
+            import yaml
+
+            spec = yaml.safe_load(f) or {}
+    if not isinstance(spec, dict):
+        raise DiagramError(f"{path}: a diagram spec is a mapping")
+    folder = os.path.dirname(os.path.abspath(path))
+    stem = os.path.splitext(os.path.basename(path))[0]
+    spec["output"] = os.path.join(folder, spec.get("output") or stem + ".png")
+    return spec
+
+
+class _Diagram:
+    """One spec being drawn: resolved style, colours, block boxes and routes."""
+
+    def __init__(self, spec):
+        self.spec = spec
+        theme = spec.get("theme", "dark")
+        if theme not in THEMES:
+            raise DiagramError(f"theme must be one of {', '.join(THEMES)}, not {theme!r}")
+        self.style = dict(THEMES[theme], **(spec.get("style") or {}))
+        self.colors = dict(COLORS, **(spec.get("colors") or {}))
+        for key in ("background", "card", "border", "text", "label", "sublabel", "muted",
+                    "title"):
+            if self.style[key]:
+                self.style[key] = self.colors.get(self.style[key], self.style[key])
+        self.boxes = {}
+        self.group_boxes = {}
+        self.routes = {}  # edge index -> layout.Route
+        self.size = spec.get("size", (16, 9))
+        blocks = spec.get("blocks") or []
+        placed = sum("box" in b for b in blocks)
+        if blocks and not placed:
+            self._layout(blocks)
+            return
+        if placed < len(blocks):
+            raise DiagramError("give every block a box, or none for an automatic layout")
+        for i, b in enumerate(blocks):
+            self.boxes[_block_id(b)] = _box(b["box"], f"block {i}")
+
+    def _layout(self, blocks):
+        """Place ``blocks`` and route the edges with ``layout.layered``."""
+        from . import layout
+
+        spec = self.spec
+        opts = spec.get("layout") or {}
+        node = tuple(opts.get("node", (2.2, 1.2)))
+        ids = [_block_id(b) for b in blocks]
+        known = set(ids)
+        edges = []
+        for e in spec.get("edges") or []:
+            ends = []
+            for key in ("from", "to"):
+                end = str(e.get(key, ""))
+                name = end.rpartition(".")[0] if end.endswith(tuple("." + s for s in _SIDES)) \
+                    else end
+                if name not in known:
+                    raise DiagramError(f"edge end {e.get(key)!r}: an automatic layout joins "
+                                       f"blocks by id")
+                ends.append(name)
+            edges.append(tuple(ends))
+        try:
+            lay = layout.layered(
+                ids, edges, groups={i: b.get("group") for i, b in zip(ids, blocks)},
+                sizes={i: (b.get("width", node[0]), b.get("height", node[1]))
+                       for i, b in zip(ids, blocks)},
+                direction=opts.get("direction", "LR"),
+                routing=opts.get("routing", "orthogonal"), node_size=node,
+                gap=tuple(opts.get("gap", (1.6, 0.5))), group_gap=opts.get("group_gap", 2.0),
+                pad=_PAD.get(self.style["block"], 0.0),
+                labels=[_label_size(e.get("label"), self.style["edge_label_size"])
+                        for e in spec.get("edges") or []])
+        except ValueError as e:
+            raise DiagramError(f"layout: {e}") from None
+
+        boxes = dict(lay.boxes)
+        for g in spec.get("groups") or []:
+            members = [boxes[i] for i, b in zip(ids, blocks)
+                       if g.get("id") is not None and b.get("group") == g.get("id")]
+            if "box" in g or not members:
+                continue
+            x0 = min(x for x, _, _, _ in members) - _GROUP_MARGIN
+            y0 = min(y for _, y, _, _ in members) - _GROUP_MARGIN
+            x1 = max(x + w for x, _, w, _ in members) + _GROUP_MARGIN
+            y1 = max(y + h for _, y, _, h in members) + _GROUP_MARGIN + _GROUP_LABEL
+            self.group_boxes[g["id"]] = (x0, y0, x1 - x0, y1 - y0)
+
+        # Shift everything clear of the margins, the legend and the title.
+        extents = [(x - _GROUP_PAD, y - _GROUP_PAD, x + w + _GROUP_PAD, y + h + _GROUP_PAD)
+                   for x, y, w, h in list(boxes.values()) + list(self.group_boxes.values())]
+        extents += [(*r.points.min(axis=0), *r.points.max(axis=0)) for r in lay.routes]
+        x0 = min(e[0] for e in extents)
+        y0 = min(e[1] for e in extents)
+        x1 = max(e[2] for e in extents)
+        y1 = max(e[3] for e in extents)
+        dx = _MARGIN - x0
+        dy = _MARGIN + (0.4 if spec.get("legend") else 0) - y0
+        top = _MARGIN + (0.7 if spec.get("title") else 0) + (0.4 if spec.get("subtitle") else 0)
+        self.boxes = {k: (x + dx, y + dy, w, h) for k, (x, y, w, h) in boxes.items()}
+        self.group_boxes = {k: (x + dx, y + dy, w, h)
+                            for k, (x, y, w, h) in self.group_boxes.items()}
+        self.routes = {i: r._replace(points=r.points + (dx, dy),
+                                     label_at=(r.label_at[0] + dx, r.label_at[1] + dy))
+                       for i, r in enumerate(lay.routes)}
+        self.size = spec.get("size", (x1 + dx + _MARGIN, y1 + dy + top))
+
+    def color(self, value, default=None):
+        if not value:
+            return default or self.style["muted"]
+        return self.colors.get(value, value)
+
+    def anchor(self, end, other):
+        """Point for one edge end; ``other`` is the far end's block centre or point."""
+        if isinstance(end, (list, tuple)):
+            return float(end[0]), float(end[1])
+        name, side = self._split(end)
+        x, y, w, h = self.boxes[name]
+        if not side:
+            ox, oy = other
+            dx, dy = ox - (x + w / 2), oy - (y + h / 2)
+            if abs(dx) * h > abs(dy) * w:
+                side = "right" if dx > 0 else "left"
+            else:
+                side = "top" if dy > 0 else "bottom"
+        return {"top": (x + w / 2, y + h), "bottom": (x + w / 2, y),
+                "left": (x, y + h / 2), "right": (x + w, y + h / 2)}[side]
+
+    def centre(self, end):
+        if isinstance(end, (list, tuple)):
+            return float(end[0]), float(end[1])
+        x, y, w, h = self.boxes[self._split(end)[0]]
+        return x + w / 2, y + h / 2
+
+    def _split(self, end):
+        """``"id.side"`` as ``(id, side)``; side is "" for a bare id."""
+        name, dot, side = str(end).rpartition(".")
+        if not dot or side not in _SIDES or name not in self.boxes:
+            name, side = str(end), ""
+        if name not in self.boxes:
+            raise DiagramError(f"edge end {end!r}: no block with that id")
+        return name, side
+
+
+def _label_size(text, size):
+    """Rough ``(w, h)`` in inches of an edge label set at ``size`` points; None if no label."""
+    if not text:
+        return None
+    lines = str(text).splitlines()
+    return max(map(len, lines)) * size * 0.55 / 72 + 0.1, len(lines) * size * 1.4 / 72 + 0.05
+
+
+def _block_id(b):
+    return b.get("id", b.get("label"))
+
+
+def _box(value, what):
+    if not isinstance(value, (list, tuple)) or len(value) != 4:
+        raise DiagramError(f"{what}: box must be [x, y, w, h]")
+    return tuple(float(v) for v in value)
+
+
+def _group(batch, d, g):
+    from matplotlib.patches import FancyBboxPatch
+
+    box = g.get("box") or d.group_boxes.get(g.get("id"))
+    x, y, w, h = _box(box, f"group {g.get('label')!r}")
+    color = d.color(g.get("color"))
+    batch.add(FancyBboxPatch((x, y), w, h, boxstyle="round,pad=0.2", facecolor="none",
+                             edgecolor=color, linewidth=1.5, linestyle="--", alpha=0.5))
+    batch.text(x + 0.25, y + h - 0.2, g.get("label", ""), fontsize=g.get("size", 11),
+               fontweight="bold", color=color, alpha=0.8)
+
+
+def _outline(shape, box, **kw):
+    """Patches drawing a block of ``shape`` over ``box``."""
+    from matplotlib.patches import Circle, FancyBboxPatch, Polygon
+
+    x, y, w, h = box
+    cx, cy, r = x + w / 2, y + h / 2, min(w, h) / 2
+    if shape == "round":
+        return [FancyBboxPatch((x, y), w, h, boxstyle=f"round,pad=0.08,rounding_size={r + 0.08}",
+                               **kw)]
+    if shape == "circle":
+        return [Circle((cx, cy), r, **kw)]
+    if shape == "ring":
+        return [Circle((cx, cy), r, facecolor="none", edgecolor=kw["facecolor"],
+                       linewidth=kw["linewidth"]),
+                Circle((cx, cy), r * 0.6, facecolor=kw["facecolor"], edgecolor="none")]
+    return [Polygon([(cx, y), (x + w, cy), (cx, y + h), (x, cy)], **kw)]
+
+
+def _block(batch, d, b, box):
+    from matplotlib.patches import FancyBboxPatch
+
+    s = d.style
+    x, y, w, h = box
+    color = d.color(b.get("color"), COLORS["teal"])
+    text = d.color(b.get("text_color"), s["label"] or s["text"])
+    size = b.get("size", s["label_size"])
+    sub_size = b.get("sublabel_size", s["sublabel_size"])
+    label = b.get("label", _block_id(b))
+    sublabel = b.get("sublabel")
+    shape = b.get("shape", "rect")
+    if shape not in SHAPES:
+        raise DiagramError(f"block {label!r}: shape must be one of {', '.join(SHAPES)}")
+    fill = s["block"] == "fill"
+    if shape != "rect" or fill:
+        if shape == "rect":
+            patches = [FancyBboxPatch((x, y), w, h, boxstyle="round,pad=0.08", facecolor=color,
+                                      edgecolor=d.color(b.get("border"), s["border"]),
+                                      linewidth=1.5)]
+        elif fill:
+            patches = _outline(shape, box, facecolor=color,
+                               edgecolor=d.color(b.get("border"), s["border"]), linewidth=1.5)
+        else:
+            patches = _outline(shape, box, facecolor=s["card"],
+                               edgecolor=d.color(b.get("border"), color), linewidth=1.8)
+            text = d.color(b.get("text_color"), s["text"])
+        for patch in patches:
+            batch.add(patch)
+        if label:
+            batch.text(x + w / 2, y + h / 2 + (0.12 if sublabel else 0), label, color=text,
+                       fontsize=size, fontweight="bold", ha="center", va="center")
+        if sublabel:
+            batch.text(x + w / 2, y + h / 2 - 0.18, sublabel, color=s["sublabel"],
+                       fontsize=sub_size, ha="center", va="center", style="italic")
+        return
+    batch.add(FancyBboxPatch((x, y), w, h, boxstyle="round,pad=0.12", facecolor=s["card"],
+                             edgecolor=d.color(b.get("border"), color), linewidth=1.8))
+    batch.add(FancyBboxPatch((x + 0.05, y + h - 0.22), w - 0.1, 0.18,
+                             boxstyle="round,pad=0.04", facecolor=color, edgecolor="none",
+                             alpha=0.9))
+    batch.text(x + w / 2, y + h - 0.13, label, ha="center", va="center",
+               fontsize=size, fontweight="bold", color=text)
+    if sublabel:
+        batch.text(x + w / 2, y + h / 2 - 0.1, sublabel, ha="center", va="center",
+                   fontsize=sub_size, color=s["sublabel"], linespacing=1.5)
+
+
+def _edge(batch, d, e, route=None):
+    from matplotlib.path import Path
+
+    s = d.style
+    if "from" not in e or "to" not in e:
+        raise DiagramError(f"edge {e!r} needs 'from' and 'to'")
+    color = d.color(e.get("color"))
+    # zorder 1: edges are drawn with the blocks, after them.
+    arrow = dict(arrowstyle=e.get("style", "-|>"), color=color, lw=e.get("width", 1.5),
+                 mutation_scale=s["arrow_size"], linestyle="--" if e.get("dashed") else "-",
+                 zorder=1)
+    if route:
+        # Routed labels sit on the route, halfway along it.
+        batch.arrow(path=Path(route.points, route.codes), **arrow)
+        (mx, my), above, boxed = route.label_at, (0, 0.05), (0, 0)
+    else:
+        a = d.anchor(e["from"], d.centre(e["to"]))
+        b = d.anchor(e["to"], d.centre(e["from"]))
+        curve = float(e.get("curve", 0))
+        batch.arrow(a, b, connectionstyle=f"arc3,rad={curve}", **arrow)
+        (mx, my), above, boxed = ((a[0] + b[0]) / 2, (a[1] + b[1]) / 2), (0, 0.18), (0, 0.15)
+    label = e.get("label")
+    if not label:
+        return
+    if s["edge_label"] == "above":
+        dx, dy = e.get("label_offset", above)
+        batch.text(mx + dx, my + dy, label, color=color, fontsize=s["edge_label_size"],
+                   ha="center", va="bottom")
+    else:
+        dx, dy = e.get("label_offset", boxed)
+        batch.text(mx + dx, my + dy, label, ha="center", va="center",
+                   fontsize=s["edge_label_size"], color=color, fontstyle="italic",
+                   bbox=dict(boxstyle="round,pad=0.15", facecolor=s["background"],
+                             edgecolor="none", alpha=0.85))
+
+
+def _legend(batch, d, legend):
+    from matplotlib.patches import FancyBboxPatch
+
+    x0, y = legend.get("at", (0.5, 0.15))
+    step = legend.get("step", 1.7)
+    for i, item in enumerate(legend.get("items") or []):
+        x = x0 + i * step
+        color = d.color(item.get("color"))
+        if legend.get("kind", "swatch") == "line":
+            batch.line([x - 0.3, x + 0.3], [y, y], color=color, lw=2)
+            batch.text(x + 0.5, y, item.get("label", ""), color=color, fontsize=7, va="center")
+        else:
+            batch.add(FancyBboxPatch((x, y), 0.2, 0.15, boxstyle="round,pad=0.02",
+                                     facecolor=color, edgecolor="none"))
+            batch.text(x + 0.3, y + 0.07, item.get("label", ""), fontsize=7,
+                       color=d.style["muted"], va="center")
+
+
+def draw(spec):
+    """A matplotlib ``Figure`` of ``spec``."""
+    from .drawing import Batch, figure
+
+    d = _Diagram(spec)
+    s = d.style
+    width, height = d.size
+    fig = figure(figsize=(width, height))
+    fig.set_facecolor(s["background"])
+    ax = fig.add_subplot()
+    ax.set_facecolor(s["background"])
+    ax.set_xlim(0, width)
+    ax.set_ylim(0, height)
+    ax.axis("off")
+
+    batch = Batch()
+    for g in spec.get("groups") or []:
+        _group(batch, d, g)
+    for line in spec.get("lines") or []:
+        xs, ys = zip(*line["points"])
+        batch.line(xs, ys, color=d.color(line.get("color")), linewidth=line.get("width", 1),
+                   linestyle="--" if line.get("dashed") else "-")
+    for b in spec.get("blocks") or []:
+        _block(batch, d, b, d.boxes[_block_id(b)])
+    for i, e in enumerate(spec.get("edges") or []):
+        _edge(batch, d, e, d.routes.get(i))
+    for t in spec.get("texts") or []:
+        x, y = t["at"]
+        batch.text(x, y, t["text"], color=d.color(t.get("color")), fontsize=t.get("size", 7),
+                   fontweight="bold" if t.get("bold") else "normal",
+                   fontstyle="italic" if t.get("italic") else "normal",
+                   ha=t.get("align", "left"), va="center")
+    if spec.get("title"):
+        batch.text(width / 2, height - 0.35, spec["title"], ha="center", va="center",
+                   fontsize=s["title_size"], fontweight="bold", color=s["title"] or s["text"])
+    if spec.get("subtitle"):
+        batch.text(width / 2, height - 0.72, spec["subtitle"], ha="center", va="center",
+                   fontsize=9, color=s["sublabel"])
+    if spec.get("legend"):
+        _legend(batch, d, spec["legend"])
+    batch.draw(ax)
+    return fig
+
+
+def spec_key(spec, ext, metadata=None):
+    """Cache key of ``spec`` rendered as ``ext`` with ``metadata``: not where it is saved."""
+    import matplotlib
+
+    content = {k: v for k, v in spec.items() if k != "output"}
+    text = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    code = ":".join(file_hash(p) for p in SOURCES)
+    meta = json.dumps(metadata, sort_keys=True)
+    return hashlib.sha256(f"v{_VERSION}:{code}:{matplotlib.__version__}:{ext}:{meta}:"
+                          f"{text}".encode()).hexdigest()
+
+
+def render(spec, out=None, raster=None):
+    """Write ``spec`` to ``out`` (default: its ``output``) as PNG, SVG or PDF, by extension.
+
+    ``raster`` is the PNG already rendered from ``spec`` that a PDF ``out``
+    is the vector version of; its hash is stamped into the PDF
+    (``images.vector_metadata``). Drawn only when no earlier render of
+    the same spec is cached, and ``out`` is left untouched if it already
+    holds those bytes. Returns ``out``.
+    """
+    out = out or spec["output"]
+    ext = os.path.splitext(out)[1].lower()
+    if ext not in FORMATS:
+        raise DiagramError(f"{out}: expected one of {', '.join(FORMATS)}")
+    # No dates or random ids, so the same spec gives the same bytes.
+    metadata = {_DATE_KEYS[ext]: None} if ext in _DATE_KEYS else None
+    if raster and ext == ".pdf":
+        metadata = vector_metadata(raster)
+    cached = os.path.join(cache_dir("diagrams"), spec_key(spec, ext, metadata) + ext)
+    if not os.path.exists(cached):
+        import matplotlib
+
+        fig = draw(copy.deepcopy(spec))
+        tmp = f"{cached}.{os.getpid()}.tmp"
+        with matplotlib.rc_context({"svg.hashsalt": "electrum"}):
+            fig.savefig(tmp, format=ext[1:], dpi=spec.get("dpi", DPI), bbox_inches="tight",
+                        facecolor=fig.get_facecolor(), metadata=metadata)
+        os.replace(tmp, cached)
+    if not (os.path.exists(out) and filecmp.cmp(cached, out, shallow=False)):
+        tmp = f"{out}.{os.getpid()}.tmp"
+        shutil.copyfile(cached, tmp)
+        os.replace(tmp, out)
+    return out
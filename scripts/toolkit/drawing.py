@@ -0,0 +1,159 @@
+"""Batched matplotlib drawing for the diagram scripts.
+
+A cross-section or block diagram is hundreds of patches, lines and
+labels. Added one by one (``ax.add_patch``, ``ax.plot``) each becomes an
+artist of its own that matplotlib updates, sorts and draws separately.
+A ``Batch`` keeps them as data instead and ``draw`` adds them in bulk:
+one ``PatchCollection`` per z-order for the patches, one
+``LineCollection`` per z-order and cap style for the lines and arcs,
+then the arrows and texts, which have no collection and stay artists.
+
+The picture is the one the separate calls drew. Matplotlib draws patches
+(z-order 1) under lines (2) under texts and annotations (3) whatever
+order they are added in, and a collection draws its members in the
+order they were added, so the stacking is kept. Each patch keeps its
+face, edge, width, dash and alpha, each line its own.
+
+``figure`` makes a ``Figure`` on the Agg canvas without pyplot, so no
+global figure state is kept and nothing needs closing. A batch is only
+data until ``draw``: it can be drawn again on a fresh axes (a redraw
+after an edit) without rebuilding it. ``save`` writes the PNG and a
+vector PDF of the same figure beside it (``outputs`` names both), which
+the PDF carousel embeds instead of the pixels.
+
+matplotlib is imported on first use, so a script can name this module
+among its inputs before deciding whether to draw at all.
+"""
+
+import math
+
+from .images import vector_metadata, vector_name
+
+
+def figure(**kw):
+    """A ``Figure`` (``Figure``'s arguments) with an Agg canvas attached."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(**kw)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def outputs(path):
+    """The files ``save(fig, path)`` writes: ``path`` and its vector version."""
+    return [path, vector_name(path)]
+
+
+def save(fig, path, **kw):
+    """Save ``fig`` to ``path`` (a PNG) and as a PDF beside it; ``savefig`` arguments.
+
+    The PDF carries no creation date, so an unchanged figure gives the
+    same bytes, and is stamped with the PNG's hash
+    (``images.vector_metadata``). Returns ``outputs(path)``.
+    """
+    fig.savefig(path, **kw)
+    fig.savefig(vector_name(path), metadata=vector_metadata(path), **kw)
+    return outputs(path)
+
+
+def _line_props(kw):
+    from matplotlib import rcParams
+    from matplotlib.cbook import normalize_kwargs
+    from matplotlib.lines import Line2D
+
+    kw = normalize_kwargs(kw, Line2D)
+    props = {
+        "color": kw.pop("color", rcParams["lines.color"]),
+        "linewidth": kw.pop("linewidth", rcParams["lines.linewidth"]),
+        "linestyle": kw.pop("linestyle", "-"),
+        "alpha": kw.pop("alpha", None),
+        "zorder": kw.pop("zorder", 2),
+    }
+    caps = {"solid": kw.pop("solid_capstyle", None), "dash": kw.pop("dash_capstyle", None)}
+    kind = "solid" if props["linestyle"] in ("-", "solid") else "dash"
+    props["capstyle"] = caps[kind] or rcParams[f"lines.{kind}_capstyle"]
+    if kw:
+        raise TypeError(f"unsupported line properties: {', '.join(sorted(kw))}")
+    return props
+
+
+class Batch:
+    """Patches, lines, arrows and texts to be added to an axes together."""
+
+    def __init__(self):
+        self.patches = []
+        self.lines = []  # (points, props)
+        self.arrows = []  # FancyArrowPatch arguments
+        self.texts = []  # ax.text arguments
+
+    def add(self, patch):
+        """Queue a ``Patch`` (not yet added to any axes); returns it."""
+        self.patches.append(patch)
+        return patch
+
+    def polygon(self, xs, ys, **kw):
+        """A filled polygon, as ``ax.fill(xs, ys, **kw)`` draws it."""
+        from matplotlib.patches import Polygon
+
+        return self.add(Polygon(list(zip(xs, ys)), closed=True, **kw))
+
+    def line(self, xs, ys, **kw):
+        """A polyline, as ``ax.plot(xs, ys, **kw)`` draws it (no markers)."""
+        self.lines.append((list(zip(xs, ys)), _line_props(kw)))
+
+    def arc(self, centre, width, height, theta1, theta2, **kw):
+        """An elliptic arc (angles in degrees, counter-clockwise), as a line."""
+        cx, cy = centre
+        n = max(2, int(abs(theta2 - theta1) / 3) + 1)
+        ts = [math.radians(theta1 + (theta2 - theta1) * i / (n - 1)) for i in range(n)]
+        self.line([cx + width / 2 * math.cos(t) for t in ts],
+                  [cy + height / 2 * math.sin(t) for t in ts], **kw)
+
+    def arrow(self, start=None, end=None, **kw):
+        """An arrow from ``start`` to ``end`` (or along ``path=``).
+
+        ``FancyArrowPatch`` arguments; the defaults draw what
+        ``ax.annotate("", end, start, arrowprops=kw)`` did.
+        """
+        from matplotlib import rcParams
+
+        kw.setdefault("mutation_scale", rcParams["font.size"])
+        kw.setdefault("zorder", 3)
+        self.arrows.append(((start, end), kw))
+
+    def text(self, x, y, s, **kw):
+        """A text, as ``ax.text(x, y, s, **kw)`` draws it."""
+        self.texts.append((x, y, s, kw))
+
+    def draw(self, ax):
+        """Add everything queued to ``ax``; returns ``ax``."""
+        from matplotlib.collections import LineCollection, PatchCollection
+        from matplotlib.colors import to_rgba
+        from matplotlib.patches import FancyArrowPatch
+
+        by_z = {}
+        for p in self.patches:
+            by_z.setdefault(p.get_zorder(), []).append(p)
+        for z, group in by_z.items():
+            ax.add_collection(PatchCollection(
+                group, facecolors=[p.get_facecolor() for p in group],
+                edgecolors=[p.get_edgecolor() for p in group],
+                linewidths=[p.get_linewidth() for p in group],
+                linestyles=[p.get_linestyle() for p in group],
+                capstyle="butt", joinstyle="miter", zorder=z), autolim=False)
+        by_style = {}
+        for points, props in self.lines:
+            by_style.setdefault((props["zorder"], props["capstyle"]), []).append((points, props))
+        for (z, capstyle), group in by_style.items():
+            ax.add_collection(LineCollection(
+                [points for points, _ in group],
+                colors=[to_rgba(props["color"], props["alpha"]) for _, props in group],
+                linewidths=[props["linewidth"] for _, props in group],
+                linestyles=[props["linestyle"] for _, props in group],
+                capstyle=capstyle, joinstyle="round", zorder=z), autolim=False)
+        for (start, end), kw in self.arrows:
+            ax.add_artist(FancyArrowPatch(start, end, **kw))
+        for x, y, s, kw in self.texts:
+            ax.text(x, y, s, **kw)
+        return ax
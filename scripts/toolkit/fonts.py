@@ -0,0 +1,136 @@
+"""TrueType font registration, with parsed fonts cached between builds.
+
+The standard PDF fonts (Helvetica and friends) need no files. A branded
+TrueType family is registered with reportlab under ``<family>`` and
+``<family>-Bold``, the same naming as ``Helvetica``/``Helvetica-Bold``, so
+the layout code only swaps the family name.
+
+Parsing a TTF (cmap, metrics for every glyph) costs time proportional to
+the font, on every run and in every worker process. ``load`` parses each
+file once and pickles the result under ``<cache>/fonts`` keyed by the hash
+of the font file and the reportlab version; later runs unpickle it, and a
+process registers each font at most once.
+
+Embedding is reportlab's: a document gets only the glyphs its text uses,
+as subsets of at most 256 glyphs, never the whole font file.
+"""
+
+import hashlib
+import os
+import pickle
+from functools import lru_cache
+
+from .cache import cache_dir, file_hash
+
+_VERSION = 1
+
+_registered = {}  # registered name -> font file
+
+
+@lru_cache(maxsize=None)
+def font_hash(path):
+    """sha256 of the font file at ``path`` (hashed once per process)."""
+    return file_hash(path)
+
+
+def _parse(path):
+    from reportlab.pdfbase.ttfonts import TTFontFace
+
+    face = TTFontFace(path)
+    # The unit scaler is a lambda, which pickle refuses; it is only used
+    # while parsing.
+    face.__dict__.pop("_pdfScale", None)
+    return face
+
+
+@lru_cache(maxsize=None)
+def _face(path):
+    import reportlab
+
+    key = hashlib.sha256(f"v{_VERSION}:{font_hash(path)}:{reportlab.Version}".encode())
+    cached = os.path.join(cache_dir("fonts"), key.hexdigest() + ".pickle")
+    try:
+        with open(cached, "rb") as f:
+            face = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        face = _parse(path)
+        tmp = f"{cached}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(face, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cached)
+    return face
+
+
+# The reportlab release whose TTFont.__init__ ``load`` repeats; other
+# releases build the font with TTFont itself (parsing it every time).
+_TTFONT_INIT = "5.0."
+
+
+def load(name, path):
+    """A reportlab ``TTFont`` called ``name`` for the TTF at ``path``, parsed at most once."""
+    import reportlab
+    from reportlab.pdfbase.ttfonts import TTFont
+
+    if not reportlab.Version.startswith(_TTFONT_INIT):
+        return TTFont(name, path)
+    from fnmatch import fnmatch
+    from weakref import WeakKeyDictionary
+
+    from reportlab import rl_config
+    from reportlab.pdfbase.ttfonts import TTEncoding, unShapedFontGlob
+
+    # What TTFont(name, path).__init__ sets up, around the already parsed face.
+    font = TTFont.__new__(TTFont)
+    font.fontName = name
+    font.face = _face(path)
+    font.encoding = TTEncoding()
+    font.state = WeakKeyDictionary()
+    font._asciiReadable = rl_config.ttfAsciiReadable
+    font.shapable = not any(fnmatch(name, glob) for glob in unShapedFontGlob)
+    return font
+
+
+def register(name, path):
+    """Register the TTF at ``path`` with reportlab as ``name`` (once per process)."""
+    if _registered.get(name) == path:
+        return name
+    from reportlab.pdfbase import pdfmetrics
+
+    pdfmetrics.registerFont(load(name, path))
+    _registered[name] = path
+    return name
+
+
+def register_all(fonts):
+    """``register`` every ``{name: path}`` in ``fonts``."""
+    for name, path in fonts.items():
+        register(name, path)
+
+
+def ascent(name):
+    """Ascender of the TrueType font registered as ``name``, in em; None for other fonts."""
+    path = _registered.get(name)
+    return _face(path).ascent / 1000 if path else None
+
+
+def family_name(path):
+    """The family name a TTF file gives itself, e.g. ``"DejaVu Sans"``."""
+    return _face(path).familyName.decode("latin-1")
+
+
+def register_family(regular, bold=None, family=None):
+    """Register a regular/bold pair; returns ``(family, {name: path})``.
+
+    ``family`` defaults to the regular font's own family name; the bold
+    face is registered as ``<family>-Bold`` (the regular one when there is
+    no ``bold`` file).
+    """
+    family = family or family_name(regular)
+    fonts = {family: regular, f"{family}-Bold": bold or regular}
+    register_all(fonts)
+    return family, fonts
+
+
+def fonts_key(fonts):
+    """A string that changes whenever any font in ``{name: path}`` does."""
+    return ";".join(f"{name}={font_hash(path)}" for name, path in sorted(fonts.items()))
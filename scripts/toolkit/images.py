@@ -0,0 +1,172 @@
+"""Image preprocessing: resample embeds to their placed size.
+
+Source illustrations are often 1-2 MB PNGs drawn into a box a few inches
+wide. Before a scene is rendered, every ``Image`` node is replaced with a
+copy resampled to the placed size at a target DPI and re-encoded as PNG
+(flat diagrams, anything with transparency) or JPEG (photographic content).
+
+``quality`` and ``colors`` trade fidelity for bytes (``toolkit.budget``
+lowers them step by step to meet ``--max-bytes``): the JPEG quality, and a
+palette of at most ``colors`` colours for flat, opaque images. With either
+set, an image already small enough is still re-encoded.
+
+Results are cached under ``<cache>/images`` keyed by a hash of the source
+bytes and the output parameters, so repeat builds skip the resample.
+
+A diagram drawn with matplotlib is saved as a PDF too (``vector_name``);
+the PDF backend embeds that and only the other backends use the raster.
+The PDF carries the hash of the PNG it was saved with (``vector_metadata``)
+and ``vector_of`` only accepts it while the PNG still has that hash, so
+which one a build embeds depends on file contents, not on mtimes.
+"""
+
+import hashlib
+import os
+import re
+from dataclasses import replace
+
+from .cache import cache_dir, file_hash
+
+DEFAULT_DPI = 200
+JPEG_QUALITY = 85
+
+_STAMP = "png-sha256:"
+_STAMP_RE = re.compile(rb"/Keywords \(" + _STAMP.encode() + rb"([0-9a-f]{64})\)")
+
+
+def vector_name(path):
+    """Where a vector (PDF) version of the raster ``path`` is saved: beside it, as ``.pdf``."""
+    return os.path.splitext(path)[0] + ".pdf"
+
+
+def vector_metadata(path):
+    """PDF ``savefig`` metadata for the vector version of ``path``, already saved.
+
+    No creation date (the same figure gives the same bytes) and the hash
+    of ``path`` as the keywords.
+    """
+    return {"CreationDate": None, "Keywords": _STAMP + file_hash(path)}
+
+
+def vector_of(path):
+    """The vector version of the raster ``path``, or None if there is no current one.
+
+    A PDF at ``vector_name(path)`` counts only if it was saved with the
+    pixels ``path`` holds now (``vector_metadata``).
+    """
+    vector = vector_name(path)
+    try:
+        with open(vector, "rb") as f:
+            stamp = _STAMP_RE.search(f.read())
+    except OSError:
+        return None
+    return vector if stamp and stamp.group(1).decode() == file_hash(path) else None
+
+
+def target_dpi():
+    """Target DPI from ``ELECTRUM_IMAGE_DPI``, else ``DEFAULT_DPI``."""
+    return int(os.environ.get("ELECTRUM_IMAGE_DPI", DEFAULT_DPI))
+
+
+def _has_alpha(im):
+    if im.mode in ("RGBA", "LA", "PA"):
+        return im.getchannel("A").getextrema()[0] < 255
+    return im.mode == "P" and "transparency" in im.info
+
+
+def _is_flat(im, top=32, coverage=0.75):
+    """True for diagram-like content.
+
+    The dominant colour (usually the background) is set aside; in a diagram
+    a handful of other colours still cover most of what remains, while an
+    illustration on a plain background spreads over thousands of shades.
+    """
+    probe = im.convert("RGB")
+    probe.thumbnail((256, 256), resample=0)  # nearest: keep exact colours
+    colors = probe.getcolors(maxcolors=probe.width * probe.height)
+    colors.sort(reverse=True)
+    rest = probe.width * probe.height - colors[0][0]
+    if rest == 0:
+        return True
+    return sum(n for n, _ in colors[1:top + 1]) >= coverage * rest
+
+
+def choose_format(im):
+    """'PNG' for flat or transparent images, 'JPEG' for photographic ones."""
+    if _has_alpha(im) or _is_flat(im):
+        return "PNG"
+    return "JPEG"
+
+
+def prepare(path, w_pt, h_pt, dpi=None, quality=None, colors=0):
+    """Return a path to ``path`` resampled for a ``w_pt`` x ``h_pt`` placement.
+
+    Images already at or below the target resolution are returned
+    unchanged, unless ``quality`` or ``colors`` asks for a re-encode.
+    """
+    from PIL import Image as PILImage
+
+    dpi = dpi or target_dpi()
+    tw = max(1, round(w_pt / 72.0 * dpi))
+    th = max(1, round(h_pt / 72.0 * dpi))
+    squeeze = quality is not None or colors
+    quality = quality or JPEG_QUALITY
+
+    key = f"{file_hash(path)}:{tw}x{th}:q{quality}" + (f":c{colors}" if colors else "")
+    key = hashlib.sha256(key.encode()).hexdigest()
+    folder = cache_dir("images")
+    for ext in (".png", ".jpg"):
+        cached = os.path.join(folder, key + ext)
+        if os.path.exists(cached):
+            return cached
+
+    with PILImage.open(path) as im:
+        if im.width <= tw and im.height <= th:
+            if not squeeze:
+                return path
+            tw, th = im.size
+        im.load()
+        fmt = choose_format(im)
+        if fmt == "JPEG":
+            im = im.convert("RGB")
+        elif im.mode not in ("RGB", "RGBA", "L", "LA"):
+            im = im.convert("RGBA" if _has_alpha(im) else "RGB")
+        out = im.resize((tw, th), resample=PILImage.LANCZOS) if im.size != (tw, th) else im
+        if colors and fmt == "PNG" and out.mode == "RGB":
+            out = out.quantize(colors, dither=PILImage.Dither.NONE)
+
+    cached = os.path.join(folder, key + (".jpg" if fmt == "JPEG" else ".png"))
+    tmp = cached + f".{os.getpid()}.tmp"
+    if fmt == "JPEG":
+        out.save(tmp, "JPEG", quality=quality, optimize=True)
+    else:
+        out.save(tmp, "PNG", optimize=True)
+    os.replace(tmp, cached)
+    return cached
+
+
+def preprocess_scenes(scenes, dpi=None, quality=None, colors=0):
+    """Return copies of ``scenes`` whose images point at resampled files.
+
+    ``dpi``, ``quality`` and ``colors`` are passed to ``prepare``.
+
+    An image placed more than once, in any of the scenes, is resampled once
+    for its largest placement, so every use shares one file (and one PDF
+    XObject).
+    """
+    from .scene import Image
+
+    largest = {}
+    for scene in scenes:
+        for page in scene.pages:
+            for node in page:
+                if isinstance(node, Image):
+                    w, h = largest.get(node.path, (0, 0))
+                    largest[node.path] = (max(w, node.w), max(h, node.h))
+    prepared = {path: prepare(path, w, h, dpi, quality, colors)
+                for path, (w, h) in largest.items()}
+
+    return [replace(scene, pages=[[replace(node, path=prepared[node.path])
+                                   if isinstance(node, Image) else node for node in page]
+                                  for page in scene.pages])
+            for scene in scenes]
@@ -0,0 +1,522 @@
+"""Layered (Sugiyama) layout for block diagrams whose blocks have no ``box``.
+
+``layered`` places nodes in ranks along the flow (left to right, or top
+to bottom) so that edges point forward, orders each rank to cut edge
+crossings, and routes every edge orthogonally or as a smooth curve:
+
+1. cycles are broken by reversing the DFS back edges;
+2. each node gets the rank of its longest path from a source, each
+   group on ranks of its own (groups are ranked as one graph, as deep as
+   their contents), and edges spanning several ranks get a dummy node
+   per rank crossed;
+3. ranks are reordered by barycentre sweeps (keeping the ordering with
+   the fewest crossings) and then by swapping neighbours while that
+   removes crossings; nodes of one group stay contiguous in every rank;
+4. nodes move towards the mean of their neighbours, as close as the
+   ordering and spacing allow (isotonic regression per rank), and groups
+   sharing ranks are pushed apart;
+5. edges leave and enter blocks at ports spread along their sides and
+   follow their dummy chain: orthogonal routes turn in a channel of
+   their own in the gap between ranks, curved ones are cubic Beziers
+   leaving and entering their blocks square.
+
+Everything per rank or per edge is NumPy, so a 50-node diagram lays out
+in a few milliseconds. Coordinates are in the diagram's units (inches),
+y up, with the layout's lower-left corner at the origin.
+"""
+
+import math
+from collections import namedtuple
+
+import numpy as np
+
+# Path codes, as in matplotlib.path.Path (not imported here).
+MOVETO, LINETO, CURVE4 = 1, 2, 4
+
+Layout = namedtuple("Layout", "boxes routes width height")
+Layout.__doc__ = """``boxes`` maps node id to ``(x, y, w, h)``; ``routes`` has one
+``Route`` per edge, in order."""
+
+Route = namedtuple("Route", "points codes label_at")
+Route.__doc__ = """An edge's path: ``points`` is an (n, 2) array with the path
+``codes``; ``label_at`` is the point halfway along it, or as near as
+clears the other labels."""
+
+DIRECTIONS = ("LR", "TB")
+ROUTINGS = ("orthogonal", "curved")
+
+_SWEEPS = 8
+_ALIGN_SWEEPS = 4
+_DUMMY_SIZE = 0.15
+# Where along its route a label may sit, in order of preference.
+_LABEL_AT = (0.5, 0.35, 0.65, 0.25, 0.75, 0.15, 0.85)
+
+
+def _break_cycles(n, src, dst):
+    """Boolean mask of the edges to reverse so the graph is acyclic."""
+    out = [[] for _ in range(n)]
+    for i, u in enumerate(src):
+        out[u].append(i)
+    state = np.zeros(n, np.int8)  # 0 new, 1 on the DFS stack, 2 done
+    back = np.zeros(len(src), bool)
+    for root in range(n):
+        if state[root]:
+            continue
+        state[root] = 1
+        stack = [(root, iter(out[root]))]
+        while stack:
+            u, edges = stack[-1]
+            for i in edges:
+                v = dst[i]
+                if state[v] == 1:
+                    back[i] = True
+                elif state[v] == 0:
+                    state[v] = 1
+                    stack.append((v, iter(out[v])))
+                    break
+            else:
+                state[u] = 2
+                stack.pop()
+    return back
+
+
+def _longest(n, src, dst, weight):
+    """Longest-path rank of every node, an edge spanning its source's ``weight``.
+
+    Sources are then moved up to just before their nearest successor, so
+    they do not pull long edges back to rank 0.
+    """
+    out = [[] for _ in range(n)]
+    indegree = np.bincount(dst, minlength=n).tolist()
+    sources = [u for u in range(n) if not indegree[u]]
+    for u, v in zip(src.tolist(), dst.tolist()):
+        out[u].append(v)
+    weight = weight.tolist()
+    rank = [0] * n
+    ready = list(sources)
+    while ready:  # Kahn's topological order
+        u = ready.pop()
+        for v in out[u]:
+            rank[v] = max(rank[v], rank[u] + weight[u])
+            indegree[v] -= 1
+            if not indegree[v]:
+                ready.append(v)
+    for u in sources:
+        if out[u]:
+            rank[u] = min(rank[v] for v in out[u]) - weight[u]
+    return np.array(rank, int)
+
+
+def _ranks(n, src, dst, cluster):
+    """Rank of every node, each cluster (group) on consecutive ranks of its own.
+
+    Ranks inside a cluster come from its internal edges; the clusters are
+    then ranked as one graph whose nodes are as deep as their contents.
+    Returns the ranks and the mask of edges that point backwards.
+    """
+    inside = cluster[src] == cluster[dst]
+    s, d = src[inside], dst[inside]
+    back = _break_cycles(n, s, d)
+    s, d = np.where(back, d, s), np.where(back, s, d)
+    local = _longest(n, s, d, np.ones(n, int))
+    ids, of = np.unique(cluster, return_inverse=True)
+    low = np.full(len(ids), n)
+    np.minimum.at(low, of, local)
+    local -= low[of]
+
+    depth = np.zeros(len(ids), int)
+    np.maximum.at(depth, of, local)
+    cs, cd = of[src[~inside]], of[dst[~inside]]
+    keep = cs != cd
+    cs, cd = cs[keep], cd[keep]
+    # Break cluster cycles in the order the clusters first appear.
+    order = np.argsort([np.flatnonzero(of == c)[0] for c in range(len(ids))], kind="stable")
+    pos = np.empty(len(ids), int)
+    pos[order] = np.arange(len(ids))
+    cback = _break_cycles(len(ids), pos[cs], pos[cd])
+    cs, cd = np.where(cback, cd, cs), np.where(cback, cs, cd)
+    start = _longest(len(ids), cs, cd, depth + 1)
+    rank = start[of] + local
+    return rank, rank[src] > rank[dst]
+
+
+def _crossings(upos, vpos):
+    """Crossings among edges between two ranks, given each end's position."""
+    if len(upos) < 2:
+        return 0
+    du = upos[:, None] - upos[None, :]
+    dv = vpos[:, None] - vpos[None, :]
+    return int(np.count_nonzero(du * dv < 0)) // 2
+
+
+class _Graph:
+    """Ranked graph with dummies; every edge joins consecutive ranks."""
+
+    def __init__(self, rank, group, src, dst):
+        self.n_real = len(rank)
+        self.rank = list(rank)
+        self.group = list(group)
+        self.src, self.dst, self.chains = [], [], []
+        for u, v in zip(src, dst):
+            chain = [u]
+            for r in range(self.rank[u] + 1, self.rank[v]):
+                self.rank.append(r)
+                self.group.append(-1 - len(self.rank))  # a group of its own
+                chain.append(len(self.rank) - 1)
+            chain.append(v)
+            for a, b in zip(chain, chain[1:]):
+                self.src.append(a)
+                self.dst.append(b)
+            self.chains.append(chain)
+        self.rank = np.array(self.rank)
+        self.group = np.array(self.group)
+        self.src = np.array(self.src, int)
+        self.dst = np.array(self.dst, int)
+        self.n = len(self.rank)
+        self.layers = [np.flatnonzero(self.rank == r) for r in range(self.rank.max() + 1)]
+        _, self.group_index = np.unique(self.group, return_inverse=True)
+        self.groups = self.group_index.max() + 1
+        neighbours = [[] for _ in range(self.n)]
+        for u, v in zip(self.src.tolist(), self.dst.tolist()):
+            neighbours[u].append(v)
+            neighbours[v].append(u)
+        self.neighbours = [np.array(ns, int) for ns in neighbours]
+
+    def positions(self):
+        pos = np.zeros(self.n)
+        for layer in self.layers:
+            pos[layer] = np.arange(len(layer))
+        return pos
+
+    def crossings(self, pos):
+        total = 0
+        for r in range(len(self.layers) - 1):
+            between = self.rank[self.src] == r
+            total += _crossings(pos[self.src[between]], pos[self.dst[between]])
+        return total
+
+    def _reorder(self, r, pos, down):
+        """Sort rank ``r`` by barycentre of its neighbours in the previous (or next) rank."""
+        layer = self.layers[r]
+        if down:
+            mask = self.rank[self.dst] == r
+            mine, other = self.dst[mask], self.src[mask]
+        else:
+            mask = self.rank[self.src] == r
+            mine, other = self.src[mask], self.dst[mask]
+        weight = np.bincount(mine, pos[other], self.n)[layer]
+        count = np.bincount(mine, minlength=self.n)[layer]
+        bary = np.where(count > 0, weight / np.maximum(count, 1), pos[layer])
+        # Groups move as one, by the mean barycentre of their members here.
+        index = self.group_index[layer]
+        group_bary = (np.bincount(index, bary, self.groups)
+                      / np.maximum(np.bincount(index, minlength=self.groups), 1))
+        order = np.lexsort((pos[layer], bary, group_bary[index]))
+        self.layers[r] = layer[order]
+        pos[self.layers[r]] = np.arange(len(layer))
+
+    def _transpose(self, pos):
+        """Swap neighbours of a group wherever that removes crossings."""
+        improved = True
+        while improved:
+            improved = False
+            for r, layer in enumerate(self.layers):
+                for i in range(len(layer) - 1):
+                    a, b = layer[i], layer[i + 1]
+                    if self.group[a] != self.group[b]:
+                        continue
+                    if self._pair_crossings(b, a, pos) < self._pair_crossings(a, b, pos):
+                        layer[i], layer[i + 1] = b, a
+                        pos[a], pos[b] = pos[b], pos[a]
+                        improved = True
+
+    def _pair_crossings(self, a, b, pos):
+        """Crossings between the edges of ``a`` and ``b`` with ``a`` placed first."""
+        na, nb = self.neighbours[a], self.neighbours[b]
+        # Only neighbours on the same side (rank) can cross.
+        same = self.rank[na][:, None] == self.rank[nb][None, :]
+        return int(np.count_nonzero(same & (pos[na][:, None] > pos[nb][None, :])))
+
+    def order(self):
+        """Reorder every rank to cut crossings; returns each node's position in its rank."""
+        # Start from the input order with groups together.
+        for r, layer in enumerate(self.layers):
+            first = {}
+            for g in self.group[layer]:
+                first.setdefault(g, len(first))
+            key = np.array([first[g] for g in self.group[layer]])
+            self.layers[r] = layer[np.argsort(key, kind="stable")]
+        pos = self.positions()
+        best, best_layers = self.crossings(pos), [layer.copy() for layer in self.layers]
+        stale = 0
+        for sweep in range(_SWEEPS):
+            if best == 0 or stale == 2:
+                break
+            down = sweep % 2 == 0
+            for r in (range(1, len(self.layers)) if down else range(len(self.layers) - 2, -1, -1)):
+                self._reorder(r, pos, down)
+            crossings = self.crossings(pos)
+            stale += 1
+            if crossings < best:
+                best, best_layers, stale = crossings, [layer.copy() for layer in self.layers], 0
+        self.layers = best_layers
+        pos = self.positions()
+        self._transpose(pos)
+        return pos
+
+
+def _isotonic(z):
+    """Nondecreasing least-squares fit of ``z`` (pool adjacent violators)."""
+    blocks = []  # [mean, count]
+    for value in z:
+        blocks.append([value, 1])
+        while len(blocks) > 1 and blocks[-2][0] > blocks[-1][0]:
+            v2, c2 = blocks.pop()
+            v1, c1 = blocks.pop()
+            blocks.append([(v1 * c1 + v2 * c2) / (c1 + c2), c1 + c2])
+    return np.repeat([b[0] for b in blocks], [b[1] for b in blocks])
+
+
+def _across(g, size, gap, group_gap):
+    """Centre of every node across the flow, pulled towards its neighbours."""
+    centre = np.zeros(g.n)
+    seps = []
+    for layer in g.layers:
+        half = size[layer] / 2
+        sep = half[:-1] + half[1:] + np.where(g.group[layer][:-1] == g.group[layer][1:],
+                                              gap, group_gap)
+        offsets = np.concatenate(([0.0], np.cumsum(sep)))
+        centre[layer] = offsets
+        seps.append(offsets)
+    for sweep in range(_ALIGN_SWEEPS):
+        down = sweep % 2 == 0
+        for r in (range(1, len(g.layers)) if down else range(len(g.layers) - 2, -1, -1)):
+            layer = g.layers[r]
+            mine, other = (g.dst, g.src) if down else (g.src, g.dst)
+            mask = g.rank[mine] == r
+            weight = np.bincount(mine[mask], centre[other[mask]], g.n)[layer]
+            count = np.bincount(mine[mask], minlength=g.n)[layer]
+            want = np.where(count > 0, weight / np.maximum(count, 1), centre[layer])
+            centre[layer] = _isotonic(want - seps[r]) + seps[r]
+    return centre - min(centre[layer][0] - size[layer][0] / 2 for layer in g.layers)
+
+
+def _separate(g, centre, size, gap, group_gap):
+    """Push apart groups that share ranks, so their boxes never overlap.
+
+    An ungrouped node counts as a group of its own; dummies are lanes
+    that may cross a group, so they only keep their place in their rank.
+    Groups are visited top to bottom; each moves down as far as needed to
+    clear the groups already placed on any of its ranks.
+    """
+    dummy = np.arange(g.n) >= g.n_real
+    ids, of = np.unique(np.where(dummy, -g.n - 1, g.group), return_inverse=True)
+    k = len(ids)
+    lo_c, hi_c = np.full(k, np.inf), np.full(k, -np.inf)
+    np.minimum.at(lo_c, of, centre - size / 2)
+    np.maximum.at(hi_c, of, centre + size / 2)
+    r_lo, r_hi = np.full(k, g.n), np.full(k, -1)
+    np.minimum.at(r_lo, of, g.rank)
+    np.maximum.at(r_hi, of, g.rank)
+    real = ids >= 0
+    shift = np.zeros(k)
+    placed = np.zeros(k, bool)
+    lanes = ids == -g.n - 1
+    placed[lanes] = False
+    for c in np.argsort(lo_c, kind="stable"):
+        if lanes[c]:
+            continue
+        share = placed & (r_lo <= r_hi[c]) & (r_lo[c] <= r_hi)
+        if share.any():
+            space = np.where(real | real[c], group_gap, gap)
+            push = max(0.0, (hi_c + space - lo_c[c])[share].max())
+            lo_c[c] += push
+            hi_c[c] += push
+            shift[c] = push
+        placed[c] = True
+    centre = centre + shift[of]
+    for layer in g.layers:
+        # Keep each rank in order and spaced, moving only down.
+        half = size[layer] / 2
+        sep = np.concatenate(([0.0], half[:-1] + half[1:] + gap))
+        c = centre[layer] - np.cumsum(sep)
+        centre[layer] = np.maximum.accumulate(c) + np.cumsum(sep)
+    return centre
+
+
+def _label_point(points, at=0.5):
+    """Point ``at`` of the way along the polyline ``points`` (plain Python: few points)."""
+    points = points.tolist()
+    seg = [math.hypot(x1 - x0, y1 - y0) for (x0, y0), (x1, y1) in zip(points, points[1:])]
+    half = sum(seg) * at
+    for (x0, y0), (x1, y1), length in zip(points, points[1:], seg):
+        if length and half <= length:
+            t = half / length
+            return x0 + t * (x1 - x0), y0 + t * (y1 - y0)
+        half -= length
+    return tuple(points[-1])
+
+
+_T = np.linspace(0, 1, 16)[:, None]
+_BERNSTEIN = np.hstack(((1 - _T) ** 3, 3 * (1 - _T) ** 2 * _T, 3 * (1 - _T) * _T ** 2, _T ** 3))
+
+
+def _bezier_samples(points):
+    """Points along the cubic Bezier path ``points`` (MOVETO then CURVE4 triples)."""
+    ctrl = np.stack((points[0:-1:3], points[1::3], points[2::3], points[3::3]), axis=1)
+    return np.einsum("tj,kjd->ktd", _BERNSTEIN, ctrl).reshape(-1, 2)
+
+
+def layered(nodes, edges, groups=None, sizes=None, direction="LR", routing="orthogonal",
+            node_size=(2.2, 1.2), gap=(1.6, 0.5), group_gap=2.0, pad=0.0, labels=None):
+    """Lay out ``nodes`` (ids) joined by ``edges`` (``(from, to)`` id pairs).
+
+    ``groups`` maps a node id to its group (nodes of a group stay together
+    across the flow), ``sizes`` a node id to its ``(w, h)`` (default
+    ``node_size``). ``gap`` is the space between ranks and between nodes of
+    one rank, ``group_gap`` the space between groups (across the flow, and
+    between ranks holding different groups); ``pad`` is how far
+    a block's outline is drawn outside its box, so routes stop there.
+    ``labels`` gives each edge's label ``(w, h)`` (None for no label); a
+    label that would overlap an earlier one moves along its route.
+    """
+    if direction not in DIRECTIONS:
+        raise ValueError(f"direction must be one of {', '.join(DIRECTIONS)}")
+    if routing not in ROUTINGS:
+        raise ValueError(f"routing must be one of {', '.join(ROUTINGS)}")
+    groups = groups or {}
+    sizes = sizes or {}
+    index = {node: i for i, node in enumerate(nodes)}
+    n = len(nodes)
+    src = np.array([index[a] for a, _ in edges], int)
+    dst = np.array([index[b] for _, b in edges], int)
+    group_ids = {}
+    group = np.array([group_ids.setdefault(groups[node], len(group_ids))
+                      if groups.get(node) is not None else -1 - i
+                      for i, node in enumerate(nodes)], int)
+    keep = src != dst  # self-loops are drawn, not ranked
+    rank, back = _ranks(n, src[keep], dst[keep], group)
+    reverse = np.zeros(len(edges), bool)
+    reverse[keep] = back
+    fsrc, fdst = np.where(reverse, dst, src), np.where(reverse, src, dst)
+    g = _Graph(rank, group, fsrc[keep], fdst[keep])
+    g.order()
+
+    # Sizes along and across the flow; dummies are thin lanes.
+    wh = np.array([sizes.get(node, node_size) for node in nodes], float).reshape(n, 2)
+    along = np.zeros(g.n)
+    across = np.full(g.n, _DUMMY_SIZE)
+    lr = direction == "LR"
+    along[:n], across[:n] = (wh[:, 0], wh[:, 1]) if lr else (wh[:, 1], wh[:, 0])
+    width = np.array([along[layer].max() for layer in g.layers])
+    # Ranks where the groups change are group_gap apart, for the group boxes.
+    real = [set(group[layer[layer < n]]) for layer in g.layers]
+    space = np.array([gap[0] if a == b else max(gap[0], group_gap)
+                      for a, b in zip(real, real[1:])] + [0.0])
+    start = np.concatenate(([0.0], np.cumsum(width + space)))[:-1]
+    lo = start[g.rank] + (width[g.rank] - along) / 2  # node's near edge along the flow
+    centre = _separate(g, _across(g, across, gap[1], group_gap), across, gap[1], group_gap)
+    centre -= (centre - across / 2).min()
+    total_along = start[-1] + width[-1]
+    total_across = (centre + across / 2).max()
+
+    def to_xy(a, c):
+        """Flow coordinates (along, across) to diagram x, y (y up)."""
+        a, c = np.asarray(a, float), np.asarray(c, float)
+        return np.stack((a, total_across - c) if lr else (c, total_along - a), axis=-1)
+
+    boxes = {}
+    for i, node in enumerate(nodes):
+        x0, y0 = to_xy(lo[i], centre[i] - across[i] / 2)
+        x1, y1 = to_xy(lo[i] + along[i], centre[i] + across[i] / 2)
+        boxes[node] = (float(min(x0, x1)), float(min(y0, y1)),
+                       float(abs(x1 - x0)), float(abs(y1 - y0)))
+
+    # Each chain's across coordinate at every node: edges leave and enter a
+    # block at ports spread along its side, in the order of their far ends.
+    chains = iter(g.chains)
+    paths = [[int(src[i])] * 2 if not keep[i] else next(chains) for i in range(len(edges))]
+    cross = [centre[chain].copy() for chain in paths]
+    for end, near, far in ((0, 0, 1), (-1, -1, -2)):
+        ports = {}
+        for i, chain in enumerate(paths):
+            if keep[i]:
+                ports.setdefault(chain[near], []).append((centre[chain[far]], i))
+        for u, items in ports.items():
+            items.sort()
+            step = min(0.25, 0.6 * across[u] / max(len(items) - 1, 1))
+            for k, (_, i) in enumerate(items):
+                cross[i][end] += (k - (len(items) - 1) / 2) * step
+
+    # One channel per bend in each gap between ranks.
+    hops = [[] for _ in g.layers]
+    for i, (chain, cs) in enumerate(zip(paths, cross)):
+        for k in range(len(chain) - 1):
+            if keep[i] and abs(cs[k] - cs[k + 1]) > 1e-9:
+                hops[g.rank[chain[k]]].append((cs[k] + cs[k + 1], i, k))
+    channel = {}
+    for r, bends in enumerate(hops):
+        lo_gap = start[r] + width[r] + pad
+        span = space[r] - 2 * pad
+        for j, (_, i, k) in enumerate(sorted(bends)):
+            channel[i, k] = lo_gap + span * (j + 1) / (len(bends) + 1)
+
+    routes = []
+    for i, (chain, cs) in enumerate(zip(paths, cross)):
+        u = chain[0]
+        a0 = lo[u] + along[u] + pad
+        if not keep[i]:
+            # A self-loop leaves and re-enters the block's first side.
+            edge = centre[u] - across[u] / 2 - pad
+            out = edge - gap[1] * 0.6
+            a_out, a_in = lo[u] + 0.7 * along[u], lo[u] + 0.3 * along[u]
+            pts = np.array([(a_out, edge), (a_out, out), (a_in, out), (a_in, edge)])
+            codes = [MOVETO] + [LINETO] * 3
+        elif routing == "orthogonal":
+            pts = [(a0, cs[0])]
+            for k, b in enumerate(chain[1:]):
+                if (i, k) in channel:
+                    pts += [(channel[i, k], cs[k]), (channel[i, k], cs[k + 1])]
+                pts.append((lo[b] - pad if b < n else lo[b], cs[k + 1]))
+            pts = np.array(pts)
+            codes = [MOVETO] + [LINETO] * (len(pts) - 1)
+        else:
+            pts = [(a0, cs[0])]
+            for k, b in enumerate(chain[1:]):
+                a1 = lo[b] - pad if b < n else lo[b]
+                mid = (pts[-1][0] + a1) / 2
+                pts += [(mid, cs[k]), (mid, cs[k + 1]), (a1, cs[k + 1])]
+            pts = np.array(pts)
+            codes = [MOVETO] + [CURVE4] * (len(pts) - 1)
+        routes.append((pts[::-1] if reverse[i] else pts, codes))
+
+    width, height = (total_along, total_across) if lr else (total_across, total_along)
+    if not routes:
+        return Layout(boxes, [], float(width), float(height))
+    flat = np.concatenate([pts for pts, _ in routes])
+    xy = np.split(to_xy(flat[:, 0], flat[:, 1]), np.cumsum([len(p) for p, _ in routes])[:-1])
+    placed = []  # (x0, y0, x1, y1) of the labels so far
+    for i, (points, (_, codes)) in enumerate(zip(xy, routes)):
+        line = points if codes[-1] != CURVE4 else _bezier_samples(points)
+        size = labels[i] if labels else None
+        label = _label_point(line)
+        if size and not keep[i]:
+            # Outside a self-loop, next to its far side.
+            out = points[1] - points[0]
+            out /= np.abs(out).sum()
+            w, h = size[0] / 2 + 0.05, size[1] / 2 + 0.05
+            x, y = (points[1] + points[2]) / 2 + out * (w, h)
+            label = x, y
+            placed.append((x - w, y - h, x + w, y + h))
+        elif size:
+            # Slide a label along its route until it clears the ones placed before.
+            w, h = size[0] / 2 + 0.05, size[1] / 2 + 0.05
+            for at in _LABEL_AT:
+                x, y = _label_point(line, at)
+                if not any(x - w < x1 and x0 < x + w and y - h < y1 and y0 < y + h
+                           for x0, y0, x1, y1 in placed):
+                    label = x, y
+                    break
+            placed.append((label[0] - w, label[1] - h, label[0] + w, label[1] + h))
+        routes[i] = Route(points, codes, (float(label[0]), float(label[1])))
+    return Layout(boxes, routes, float(width), float(height))
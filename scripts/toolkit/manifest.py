@@ -0,0 +1,211 @@
+"""Incremental builds: skip an artifact when none of its inputs changed.
+
+``<cache>/manifest.json`` records, for every set of outputs a script
+produces, the content hash of each input it was built from (the script, the
+toolkit sources that carry the theme, referenced images and Markdown). A
+script asks ``up_to_date(outputs, inputs)`` before doing any work and calls
+``record(outputs, inputs)`` after writing its files. By convention the
+script itself is the first input.
+
+Inputs discovered during the build (images a scene references) are passed
+to ``record`` and checked on the next run even though the script does not
+list them up front, the way a compiler depfile works.
+
+Options that change the bytes without being files (the carousel's
+``--max-bytes`` budget) go in as ``settings``, a JSON-able dict stored
+with the entry: a build with other settings is not up to date.
+
+Hashes are cached per file against (size, mtime), so a no-op check reads
+only ``stat`` results and the manifest itself. Set ``ELECTRUM_FORCE=1`` or
+pass ``--force`` to rebuild regardless.
+"""
+
+import hashlib
+import json
+import os
+import sys
+
+from .cache import REPO_ROOT, cache_dir, file_hash
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-writer is good enough
+    fcntl = None
+
+_VERSION = 1
+_TOOLKIT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_state = None
+
+
+def _path():
+    return os.path.join(cache_dir(), "manifest.json")
+
+
+def _key(path):
+    path = os.path.abspath(path)
+    rel = os.path.relpath(path, REPO_ROOT)
+    return path if rel.startswith("..") else rel.replace(os.sep, "/")
+
+
+def _load():
+    global _state
+    if _state is None:
+        try:
+            with open(_path()) as f:
+                _state = json.load(f)
+            if _state.get("version") != _VERSION:
+                raise ValueError
+        except (OSError, ValueError):
+            _state = {"version": _VERSION, "artifacts": {}, "files": {}}
+    return _state
+
+
+def _hash(path, files):
+    """Content hash of ``path`` (None if missing), reusing the stat cache.
+
+    A directory (the per-page PNGs) hashes the names and hashes of its files.
+    """
+    if os.path.isdir(path):
+        h = hashlib.sha256()
+        for name in sorted(os.listdir(path)):
+            h.update(f"{name}:{_hash(os.path.join(path, name), files)}\n".encode())
+        return h.hexdigest()
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = _key(path)
+    cached = files.get(key)
+    if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+        return cached[2]
+    digest = file_hash(path)
+    files[key] = [st.st_size, st.st_mtime_ns, digest]
+    return digest
+
+
+def reload():
+    """Forget the manifest this process has read; the next call reads the file again.
+
+    For long-running callers (``build_all.py --watch``) whose builds record
+    in other processes.
+    """
+    global _state
+    _state = None
+
+
+def builds_using(paths):
+    """(script, outputs) of every recorded build that read one of ``paths``."""
+    keys = {_key(p) for p in paths}
+    return [(os.path.join(REPO_ROOT, e["script"]),
+             [os.path.join(REPO_ROOT, o) for o in e["outputs"]])
+            for e in _load()["artifacts"].values() if keys & e["inputs"].keys()]
+
+
+def recorded_files():
+    """(inputs, outputs): every file the recorded builds read and wrote, as paths."""
+    inputs, outputs = set(), set()
+    for e in _load()["artifacts"].values():
+        inputs.update(os.path.join(REPO_ROOT, k) for k in e["inputs"])
+        outputs.update(os.path.join(REPO_ROOT, k) for k in e["outputs"])
+    return inputs, outputs
+
+
+def forced():
+    return os.environ.get("ELECTRUM_FORCE") == "1" or "--force" in sys.argv[1:]
+
+
+def toolkit_sources():
+    """The toolkit's own modules; theme constants and layout live here."""
+    return sorted(os.path.join(_TOOLKIT_DIR, name) for name in os.listdir(_TOOLKIT_DIR)
+                  if name.endswith(".py"))
+
+
+def artifact_id(outputs):
+    return "|".join(sorted(_key(p) for p in outputs))
+
+
+def _entry_fresh(entry, files):
+    for group in (entry["inputs"], entry["outputs"]):
+        for key, digest in group.items():
+            if _hash(os.path.join(REPO_ROOT, key), files) != digest:
+                return False
+    return True
+
+
+def is_fresh(outputs, inputs, settings=None):
+    """True if ``outputs`` exist as recorded, with ``settings``, and no input hash has changed."""
+    state = _load()
+    entry = state["artifacts"].get(artifact_id(outputs))
+    if entry is None or entry.get("settings") != (settings or None):
+        return False
+    if any(_key(p) not in entry["inputs"] for p in inputs):
+        return False
+    return _entry_fresh(entry, state["files"])
+
+
+def script_is_fresh(script, suffix="", folder=None):
+    """True if some recorded build of ``script`` is still current.
+
+    Lets a runner skip launching a script without knowing its outputs; with
+    ``suffix`` (e.g. ``".pdf"``) only builds that produced such a file count,
+    and with ``folder`` only builds that wrote into it (for a shared script
+    such as ``build_carousel.py`` run once per product). Builds recorded
+    with ``settings`` do not count: the runner launches with the defaults.
+    """
+    state = _load()
+    key = _key(script)
+    prefix = _key(folder).rstrip("/") + "/" if folder else ""
+    for entry in state["artifacts"].values():
+        if entry.get("script") != key or entry.get("settings"):
+            continue
+        if not any(out.endswith(suffix) and out.startswith(prefix) for out in entry["outputs"]):
+            continue
+        if _entry_fresh(entry, state["files"]):
+            return True
+    return False
+
+
+def up_to_date(outputs, inputs, settings=None):
+    """``is_fresh`` unless forced; reports skipped outputs."""
+    if forced() or not is_fresh(outputs, inputs, settings):
+        return False
+    for p in outputs:
+        print(f"Up to date: {p}")
+    return True
+
+
+def record(outputs, inputs, settings=None):
+    """Store the input and output hashes (and ``settings``) of a finished build."""
+    state = _load()
+    files = state["files"]
+    entry = {
+        "script": _key(inputs[0]),
+        "inputs": {_key(p): _hash(p, files) for p in inputs},
+        "outputs": {_key(p): _hash(p, files) for p in outputs},
+    }
+    if settings:
+        entry["settings"] = settings
+    state["artifacts"][artifact_id(outputs)] = entry
+    _save(artifact_id(outputs), entry, files)
+
+
+def _save(aid, entry, files):
+    """Merge one entry into the on-disk manifest; safe with parallel builds."""
+    path = _path()
+    with open(path + ".lock", "w") as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            with open(path) as f:
+                disk = json.load(f)
+            if disk.get("version") != _VERSION:
+                raise ValueError
+        except (OSError, ValueError):
+            disk = {"version": _VERSION, "artifacts": {}, "files": {}}
+        disk["artifacts"][aid] = entry
+        disk["files"].update(files)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(disk, f, indent=1, sort_keys=True)
+        os.replace(tmp, path)
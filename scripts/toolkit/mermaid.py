@@ -0,0 +1,660 @@
+"""Mermaid diagrams drawn locally: the subset the product documents use.
+
+The ``system_description.md`` files sketch their architecture and power
+states as Mermaid blocks. ``to_spec`` turns one block into a
+``toolkit.diagram`` spec, so it is drawn by matplotlib like every other
+diagram, in the dark or light theme (``diagram.THEMES``), and cached by
+the spec's hash: an unchanged block is never drawn twice.
+
+Supported, per diagram type:
+
+- ``flowchart`` / ``graph`` (TB, TD, LR; BT and RL are drawn as TB and
+  LR): nodes ``A``, ``A[text]``, ``A(text)``, ``A([text])``,
+  ``A((text))``, ``A{text}`` (other shapes are drawn as rectangles);
+  links ``-->``, ``---``, ``-.->``, ``==>`` and ``<-->``, with labels as
+  ``-->|text|`` or ``-- text -->``; chains ``A --> B --> C`` and
+  ``A & B --> C``; ``subgraph`` ... ``end`` (nested subgraphs keep their
+  nodes in the innermost one).
+- ``stateDiagram`` / ``stateDiagram-v2``: transitions ``A --> B: label``
+  with ``[*]`` for start and end, ``state "text" as A``, ``A: text``,
+  ``<<choice>>``, ``<<fork>>``, ``<<join>>`` and composite states
+  ``state A { ... }`` (transitions go to their inner states).
+- ``sequenceDiagram``: ``participant``/``actor`` (with ``as``), messages
+  ``->>``, ``-->>``, ``->``, ``-->``, ``-x``, ``-)`` (and the ``--``
+  dashed forms), ``Note left of``/``right of``/``over``, ``loop``,
+  ``alt``/``else``, ``opt``, ``par``/``and``, ``critical``/``option``,
+  ``break`` and ``autonumber``.
+
+A ``title`` comes from the front matter or the ``title`` line. Styling
+(``classDef``, ``style``, ``linkStyle``), ``click`` and notes in state
+diagrams are skipped; colours come from the theme. Anything else raises
+``MermaidError`` naming the line.
+
+Flowcharts and state diagrams are placed by the layered layout
+(``toolkit.layout``); sequence diagrams are placed here, one row per
+message.
+"""
+
+import re
+
+from . import diagram
+
+KINDS = {"flowchart": "flowchart", "graph": "flowchart", "stateDiagram": "state",
+         "stateDiagram-v2": "state", "sequenceDiagram": "sequence"}
+
+# Colours of successive subgraphs and composite states (``diagram.COLORS``).
+_CYCLE = ("teal", "blue", "purple", "orange", "green", "red")
+
+_FENCE = re.compile(r"^```mermaid[ \t]*\n(.*?)^```[ \t]*$", re.M | re.S)
+_BREAK = re.compile(r"<br\s*/?>", re.I)
+_SKIP = ("classDef", "class", "style", "linkStyle", "click", "accTitle", "accDescr")
+
+
+class MermaidError(diagram.DiagramError):
+    """Raised for Mermaid source outside the supported subset."""
+
+
+def blocks(text):
+    """The source of every ```` ```mermaid ```` block in Markdown ``text``, in order."""
+    return [m.group(1) for m in _FENCE.finditer(text)]
+
+
+def kind(source):
+    """``flowchart``, ``state`` or ``sequence`` for Mermaid ``source``."""
+    return _parse_header(_lines(source)[1])[0]
+
+
+def to_spec(source, theme="dark"):
+    """A ``toolkit.diagram`` spec drawing Mermaid ``source`` in ``theme``."""
+    if theme not in diagram.THEMES:
+        raise MermaidError(f"theme must be one of {', '.join(diagram.THEMES)}, not {theme!r}")
+    title, lines = _lines(source)
+    name, args = _parse_header(lines)
+    build = {"flowchart": _flowchart, "state": _state, "sequence": _sequence}[name]
+    spec = build(args, lines[1:], diagram.THEMES[theme])
+    spec["theme"] = theme
+    title = spec.pop("title", None) or title
+    if title:
+        spec["title"] = title
+        spec["style"]["title_size"] = 13
+        if "size" in spec:  # placed here, not by the layout: make room for the title
+            spec["size"][1] += 0.7
+    return spec
+
+
+def _lines(source):
+    """(front matter title, statements) of ``source``: comments and blanks dropped."""
+    title = None
+    text = source.strip("\n")
+    if text.lstrip().startswith("---"):
+        head, sep, rest = text.lstrip()[3:].partition("\n---")
+        if sep:
+            for line in head.splitlines():
+                key, _, value = line.partition(":")
+                if key.strip() == "title":
+                    title = value.strip().strip("\"'")
+            text = rest
+    lines = []
+    for line in text.splitlines():
+        line = line.strip()
+        if line and not line.startswith("%%"):
+            lines.append(line)
+    if lines:  # ``graph TD; A-->B``: statements can follow the header on its line
+        head, _, rest = lines[0].partition(";")
+        lines[:1] = [head.strip()] + ([rest.strip()] if rest.strip() else [])
+    return title, lines
+
+
+def _parse_header(lines):
+    if not lines:
+        raise MermaidError("empty diagram")
+    word, _, rest = lines[0].partition(" ")
+    word = word.rstrip(";")
+    if word not in KINDS:
+        raise MermaidError(f"{word!r} diagrams are not supported; expected one of "
+                           f"{', '.join(KINDS)}")
+    return KINDS[word], rest.strip().rstrip(";")
+
+
+def _text(raw):
+    """Lines of a Mermaid label: quotes dropped, ``<br/>`` as line breaks."""
+    raw = raw.strip()
+    if len(raw) > 1 and raw[0] == raw[-1] == '"':
+        raw = raw[1:-1]
+    return [line.strip() for line in _BREAK.split(raw.replace("#quot;", '"'))]
+
+
+def _width(lines, size, bold=False):
+    """Rough width in inches of ``lines`` set at ``size`` points."""
+    return max((len(line) for line in lines), default=0) * size * (0.7 if bold else 0.55) / 72
+
+
+# -- Flowcharts --
+
+# Node shapes: opening and closing delimiters, longest first, and the block shape.
+_SHAPES = (("([", "])", "round"), ("((", "))", "circle"), ("[[", "]]", "rect"),
+           ("[(", ")]", "rect"), ("{{", "}}", "rect"), ("[/", "/]", "rect"),
+           ("[\\", "\\]", "rect"), ("[", "]", "rect"), ("(", ")", "round"),
+           ("{", "}", "diamond"), (">", "]", "rect"))
+_NODE = re.compile(r"\s*(\w+)")
+_CLASS = re.compile(r":::\w+")
+_AMP = re.compile(r"\s*&")
+# ``-- text -->`` (tried first) and ``-->|text|``.
+_LINK_TEXT = re.compile(r"\s*(<?)(--|==|-\.)\s+([^-=.|>\s][^|]*?)\s+(-{2,}|={2,}|\.+-)([>ox]?)")
+_LINK = re.compile(r"\s*(<?)(-{2,}|={2,}|-?\.+-)([>ox]?)(?:\s*\|([^|]*)\|)?")
+
+
+def _statements(line):
+    """``line`` split at the semicolons outside brackets, quotes and ``|labels|``."""
+    parts, depth, quoted, piped, start = [], 0, False, False, 0
+    for i, ch in enumerate(line):
+        if ch == '"':
+            quoted = not quoted
+        elif quoted:
+            continue
+        elif ch == "|":
+            piped = not piped
+        elif ch in "[({":
+            depth += 1
+        elif ch in "])}":
+            depth -= 1
+        elif ch == ";" and not depth and not piped:
+            parts.append(line[start:i])
+            start = i + 1
+    parts.append(line[start:])
+    return [p.strip() for p in parts if p.strip()]
+
+
+class _Flowchart:
+    def __init__(self):
+        self.nodes = {}  # id -> block
+        self.groups = {}  # id -> group
+        self.stack = []  # open subgraph ids
+        self.edges = []
+
+    def node(self, line, pos):
+        """The node at ``line[pos:]``, declared (with its text) if new; (id, end)."""
+        m = _NODE.match(line, pos)
+        if not m:
+            raise MermaidError(f"expected a node at {line[pos:]!r} in {line!r}")
+        nid, pos = m.group(1), m.end()
+        block = self.nodes.setdefault(nid, {"id": nid, "label": nid})
+        if self.stack and "group" not in block:
+            block["group"] = self.stack[-1]
+        for opener, closer, shape in _SHAPES:
+            if not line.startswith(opener, pos):
+                continue
+            start = pos + len(opener)
+            after = line.find('"', start + 1) + 1 if line.startswith('"', start) else start
+            end = line.find(closer, after) if after else -1
+            if end < 0:
+                raise MermaidError(f"unclosed {opener!r} in {line!r}")
+            lines = _text(line[start:end])
+            block["label"] = lines[0]
+            if len(lines) > 1:
+                block["sublabel"] = "\n".join(lines[1:])
+            if shape != "rect":
+                block["shape"] = shape
+            pos = end + len(closer)
+            break
+        m = _CLASS.match(line, pos)
+        return nid, m.end() if m else pos
+
+    def nodes_at(self, line, pos):
+        """The ``A & B`` group of nodes at ``line[pos:]``; (ids, end)."""
+        ids = []
+        while True:
+            nid, pos = self.node(line, pos)
+            ids.append(nid)
+            m = _AMP.match(line, pos)
+            if not m:
+                return ids, pos
+            pos = m.end()
+
+    def link(self, line, pos):
+        """The link at ``line[pos:]`` as edge keys, or None; (edge, end)."""
+        m = _LINK_TEXT.match(line, pos)
+        if m:
+            back, body, label, close, head = m.groups()
+            body += close
+        else:
+            m = _LINK.match(line, pos)
+            if not m:
+                return None, pos
+            back, body, head, label = m.groups()
+        edge = {}
+        if head and back:
+            edge["style"] = "<|-|>"
+        elif back:
+            edge["style"] = "<|-"
+        elif not head:
+            edge["style"] = "-"
+        if "." in body:
+            edge["dashed"] = True
+        if "=" in body:
+            edge["width"] = 2.5
+        if label and label.strip():
+            edge["label"] = "\n".join(_text(label))
+        return edge, m.end()
+
+    def statement(self, line):
+        word = line.split(None, 1)[0]
+        if word == "subgraph":
+            self.subgraph(line[len(word):].strip())
+        elif word == "end":
+            if not self.stack:
+                raise MermaidError("'end' without a subgraph")
+            self.stack.pop()
+        elif word in _SKIP or word == "direction":
+            return
+        else:
+            ids, pos = self.nodes_at(line, 0)
+            while pos < len(line):
+                edge, pos = self.link(line, pos)
+                if edge is None:
+                    raise MermaidError(f"cannot read {line[pos:].strip()!r} in {line!r}")
+                targets, pos = self.nodes_at(line, pos)
+                self.edges += [dict(edge, **{"from": a, "to": b}) for a in ids for b in targets]
+                ids = targets
+                pos = len(line) if not line[pos:].strip() else pos
+
+    def subgraph(self, rest):
+        m = re.match(r"(\w+)\s*\[(.*)\]$", rest)
+        if m:
+            gid, label = m.group(1), " ".join(_text(m.group(2)))
+        elif rest.startswith('"') or " " in rest or not rest:
+            gid, label = f"subgraph {len(self.groups) + 1}", " ".join(_text(rest))
+        else:
+            gid = label = rest
+        self.groups[gid] = {"id": gid, "label": label}
+        self.stack.append(gid)
+
+
+def _flowchart(direction, lines, style):
+    chart = _Flowchart()
+    for line in lines:
+        for statement in _statements(line):
+            chart.statement(statement)
+    if chart.stack:
+        raise MermaidError(f"subgraph {chart.stack[-1]!r} is missing its 'end'")
+    if not chart.nodes:
+        raise MermaidError("a flowchart needs a node")
+    for e in chart.edges:
+        for end in (e["from"], e["to"]):
+            if end in chart.groups:
+                raise MermaidError(f"links to subgraph {end!r} are not supported; "
+                                   f"link its nodes")
+    # Subgraphs holding only other subgraphs have no box of their own.
+    used = {b.get("group") for b in chart.nodes.values()}
+    groups = [g for gid, g in chart.groups.items() if gid in used]
+    colors = {g["id"]: _CYCLE[i % len(_CYCLE)] for i, g in enumerate(groups)}
+    for g in groups:
+        g["color"] = colors[g["id"]]
+        g["size"] = 10
+    blocks = list(chart.nodes.values())
+    for b in blocks:
+        b["color"] = colors.get(b.get("group"), "gray" if groups else "blue")
+        label, sub = [b["label"]], b.get("sublabel", "").splitlines()
+        w = max(_width(label, 9, bold=True), _width(sub, 7)) + 0.5
+        if b.get("shape") in ("circle", "diamond"):
+            w = max(w * (1.4 if b["shape"] == "diamond" else 1.0), 1.0)
+            b["width"] = b["height"] = round(w, 2)
+        else:
+            b["width"] = round(max(1.4, w), 2)
+            b["height"] = round(0.4 + 0.16 * len(sub), 2) if sub else 0.45
+    _fit_labels(groups, blocks)
+    by_id = {b["id"]: b for b in blocks}
+    for e in chart.edges:
+        e["color"] = by_id[e["from"]]["color"]
+    return {"style": {"block": "strip"}, "groups": groups, "blocks": blocks,
+            "edges": chart.edges,
+            "layout": {"direction": "LR" if direction.split()[:1] in (["LR"], ["RL"]) else "TB",
+                       "gap": [1.4, 0.6]}}
+
+
+def _fit_labels(groups, blocks):
+    """Widen the widest block of each group so the group's label fits over it."""
+    for g in groups:
+        members = [b for b in blocks if b.get("group") == g["id"]
+                   and b.get("shape", "rect") in ("rect", "round")]
+        if members:
+            widest = max(members, key=lambda b: b["width"])
+            need = _width([g["label"]], g["size"], bold=True) - 0.2
+            widest["width"] = round(max(widest["width"], need), 2)
+
+
+# -- State diagrams --
+
+_TRANSITION = re.compile(r"(\S+)\s*-->\s*([^:\s]+)\s*(?::\s*(.*))?$")
+_STATE_AS = re.compile(r'state\s+"([^"]*)"\s+as\s+(\w+)\s*(\{)?$')
+_STATE = re.compile(r"state\s+(\w+)\s*(<<\w+>>)?\s*(\{)?$")
+_DESCRIPTION = re.compile(r"(\w+)\s*:\s*(.*)$")
+
+
+def _state(args, lines, style):
+    states = {}  # id -> block
+    groups = {}  # composite id -> group
+    stack = []
+    edges = []
+    in_note = False
+
+    def declare(sid, label=None):
+        if sid in groups:
+            return sid
+        block = states.setdefault(sid, {"id": sid, "label": sid, "shape": "round"})
+        if label is not None:
+            block["label"] = label
+        if stack and "group" not in block:
+            block["group"] = stack[-1]
+        return sid
+
+    def pseudo(final):
+        """The start (or final) state of the innermost composite."""
+        scope = stack[-1] if stack else ""
+        sid = f"{scope}[*]{'end' if final else 'start'}"
+        if sid not in states:
+            states[sid] = {"id": sid, "label": "", "shape": "ring" if final else "circle",
+                           "width": 0.32, "height": 0.32, "color": style["text"]}
+            if stack:
+                states[sid]["group"] = scope
+        return sid
+
+    direction = "TB"
+    for line in lines:
+        if in_note:
+            in_note = line != "end note"
+            continue
+        line = re.sub(r":::\w+", "", line).rstrip(";").strip()
+        word = line.split(None, 1)[0]
+        if word == "note":
+            in_note = ":" not in line
+        elif word == "direction":
+            direction = line.split()[-1]
+        elif word in _SKIP or word in ("hide", "scale") or line == "--":
+            continue
+        elif line == "}":
+            if not stack:
+                raise MermaidError("'}' without a composite state")
+            stack.pop()
+        elif _STATE_AS.match(line):
+            label, sid, opens = _STATE_AS.match(line).groups()
+            _state_open(declare, groups, stack, sid, label, opens)
+        elif word == "state":
+            m = _STATE.match(line)
+            if not m:
+                raise MermaidError(f"cannot read {line!r}")
+            sid, marker, opens = m.groups()
+            _state_open(declare, groups, stack, sid, None, opens)
+            if marker in ("<<choice>>",):
+                states[sid].update(label="", shape="diamond", width=0.5, height=0.5)
+            elif marker in ("<<fork>>", "<<join>>"):
+                states[sid].update(label="", shape="rect", width=1.4, height=0.12)
+        elif _TRANSITION.match(line):
+            a, b, label = _TRANSITION.match(line).groups()
+            ends = [pseudo(final=i == 1) if end == "[*]" else declare(end)
+                    for i, end in enumerate((a, b))]
+            for end in ends:
+                if end in groups:
+                    raise MermaidError(f"transitions to composite state {end!r} are not "
+                                       f"supported; use the states inside it")
+            edge = {"from": ends[0], "to": ends[1]}
+            if label:
+                edge["label"] = "\n".join(_text(label))
+            edges.append(edge)
+        elif _DESCRIPTION.match(line):
+            sid, text = _DESCRIPTION.match(line).groups()
+            declare(sid)
+            states[sid]["sublabel"] = "\n".join(_text(text))
+        elif re.fullmatch(r"\w+", line):
+            declare(line)
+        else:
+            raise MermaidError(f"cannot read {line!r}")
+    if stack:
+        raise MermaidError(f"composite state {stack[-1]!r} is missing its '}}'")
+
+    used = {b.get("group") for b in states.values()}
+    group_list = [g for gid, g in groups.items() if gid in used]
+    for i, g in enumerate(group_list):
+        g.update(color=_CYCLE[(i + 1) % len(_CYCLE)], size=10)
+    colors = {g["id"]: g["color"] for g in group_list}
+    blocks = list(states.values())
+    for b in blocks:
+        b.setdefault("color", colors.get(b.get("group"), _CYCLE[0]))
+        if b["shape"] == "round":
+            sub = b.get("sublabel", "").splitlines()
+            b["width"] = round(max(1.2, _width([b["label"]], 9, bold=True) + 0.6,
+                                   _width(sub, 7) + 0.6), 2)
+            b["height"] = round(0.75 + 0.14 * len(sub), 2) if sub else 0.5
+    _fit_labels(group_list, blocks)
+    return {"style": {"block": "fill", "border": style["background"]},
+            "groups": group_list, "blocks": blocks, "edges": edges,
+            "layout": {"direction": "LR" if direction in ("LR", "RL") else "TB",
+                       "routing": "curved", "gap": [1.1, 0.7]}}
+
+
+def _state_open(declare, groups, stack, sid, label, opens):
+    """Declare state ``sid``; with ``{`` it is a composite holding what follows."""
+    if not opens:
+        declare(sid, label)
+        return
+    groups[sid] = {"id": sid, "label": label or sid}
+    stack.append(sid)
+
+
+# -- Sequence diagrams --
+
+_PARTICIPANT = re.compile(r"(?:create\s+)?(participant|actor)\s+(\S+?)(?:\s+as\s+(.+))?$")
+_MESSAGE = re.compile(r"(\w+)\s*(-->>|->>|--x|-x|--\)|-\)|-->|->)\s*([+-]?)\s*(\w+)\s*"
+                      r"(?::\s*(.*))?$")
+_NOTE = re.compile(r"note\s+(left of|right of|over)\s+([\w\s,]+?)\s*:\s*(.*)$", re.I)
+_FRAMES = ("loop", "alt", "opt", "par", "critical", "break", "rect", "box")
+_SEPARATORS = ("else", "and", "option")
+# Arrow style and dash of each message arrow.
+_ARROWS = {"->>": ("-|>", False), "-->>": ("-|>", True), "->": ("-", False),
+           "-->": ("-", True), "-x": ("-|>", False), "--x": ("-|>", True),
+           "-)": ("->", False), "--)": ("->", True)}
+
+_ROW = 0.16  # inches per line of 7-8 pt text
+_HEAD = 0.55  # participant box height for one line
+
+
+def _sequence(args, lines, style):
+    parts = {}  # id -> (label lines, actor)
+    events = []
+    title = None
+    number = 0
+    for line in lines:
+        word = line.split(None, 1)[0]
+        m = _PARTICIPANT.match(line)
+        if m:
+            what, pid, alias = m.groups()
+            parts[pid] = (_text(alias or pid), what == "actor")
+            continue
+        if word == "autonumber":
+            number = 1
+            continue
+        if word == "title":
+            title = line[len(word):].strip().lstrip(":").strip()
+            continue
+        if word in ("activate", "deactivate", "destroy", "links", "link", "properties"):
+            continue
+        m = _MESSAGE.match(line)
+        if m:
+            a, arrow, _, b, text = m.groups()
+            for pid in (a, b):
+                parts.setdefault(pid, ([pid], False))
+            label = _text(text or "")
+            if number:
+                label[0] = f"{number}. {label[0]}"
+                number += 1
+            events.append(("message", a, b, label, arrow))
+            continue
+        m = _NOTE.match(line)
+        if m:
+            where, who, text = m.groups()
+            ids = [w.strip() for w in who.split(",")]
+            for pid in ids:
+                parts.setdefault(pid, ([pid], False))
+            events.append(("note", where.lower(), ids, _text(text)))
+            continue
+        if word in _FRAMES:
+            events.append(("open", word, line[len(word):].strip()))
+        elif word in _SEPARATORS:
+            events.append(("else", word, line[len(word):].strip()))
+        elif line == "end":
+            events.append(("end",))
+        else:
+            raise MermaidError(f"cannot read {line!r}")
+    if not parts:
+        raise MermaidError("a sequence diagram needs a participant")
+    spec = _place_sequence(parts, events, style)
+    if title:
+        spec["title"] = title
+    return spec
+
+
+def _place_sequence(parts, events, style):
+    ids = list(parts)
+    col = {pid: i for i, pid in enumerate(ids)}
+    widths = [max(1.3, _width(parts[p][0], 9, bold=True) + 0.4) for p in ids]
+    head = _HEAD + _ROW * (max(len(parts[p][0]) for p in ids) - 1)
+    # Columns: far enough apart for the boxes, then for every label between them.
+    x = [widths[0] / 2]
+    for i in range(1, len(ids)):
+        x.append(x[-1] + max(2.0, (widths[i - 1] + widths[i]) / 2 + 0.5))
+
+    def widen(i, j, need):
+        short = need - (x[j] - x[i])
+        if short > 0:
+            for k in range(j, len(x)):
+                x[k] += short
+
+    for ev in events:
+        if ev[0] == "message":
+            i, j = sorted((col[ev[1]], col[ev[2]]))
+            w = _width(ev[3], 7)
+            if i == j and i + 1 < len(x):
+                widen(i, i + 1, w + 0.8)
+            elif i != j:
+                widen(i, j, w + 0.5)
+        elif ev[0] == "note" and ev[1] != "over":
+            i = col[ev[2][0]]
+            w = _width(ev[3], 7) + 0.7
+            if ev[1] == "right of" and i + 1 < len(x):
+                widen(i, i + 1, w)
+            elif ev[1] == "left of" and i > 0:
+                widen(i - 1, i, w)
+
+    line_color, muted = style["sublabel"], style["muted"]
+    blocks, edges, lines, texts, groups = [], [], [], [], []
+    extent = []  # (x0, x1) of everything drawn, for the canvas
+    frames = []  # open frames: [kind, text, top, x0, x1, separators]
+    depth = head + 0.35  # below the top of the participant boxes
+
+    def touch(x0, x1):
+        extent.append((x0, x1))
+        for frame in frames:
+            frame[3], frame[4] = min(frame[3], x0), max(frame[4], x1)
+
+    for ev in events:
+        if ev[0] == "message":
+            _, a, b, label, arrow = ev
+            xa, xb = x[col[a]], x[col[b]]
+            arrowstyle, dashed = _ARROWS[arrow]
+            depth += 0.2 + _ROW * len(label)
+            edge = {"style": arrowstyle, "color": line_color, "width": 1.2}
+            if dashed:
+                edge["dashed"] = True
+            if a == b:
+                loop = xa + 0.45
+                lines.append({"points": [[xa, -depth], [loop, -depth], [loop, -depth - 0.3]],
+                              "color": line_color, "width": 1.2, "dashed": dashed})
+                edges.append(dict(edge, **{"from": [loop, -depth - 0.3], "to": [xa, -depth - 0.3]}))
+                texts.append({"text": "\n".join(label), "at": [loop + 0.1, -depth - 0.15],
+                              "color": line_color})
+                touch(xa, loop + 0.1 + _width(label, 7))
+                depth += 0.45
+            else:
+                edges.append(dict(edge, **{"from": [xa, -depth], "to": [xb, -depth],
+                                           "label": "\n".join(label)}))
+                touch(min(xa, xb), max(xa, xb))
+                depth += 0.15
+        elif ev[0] == "note":
+            _, where, who, label = ev
+            w = _width(label, 8) + 0.4
+            h = 0.2 + _ROW * len(label)
+            xs = [x[col[p]] for p in who]
+            if where == "over":
+                x0, x1 = min(xs), max(xs)
+                w = max(w, x1 - x0 + 0.8)
+                left = (x0 + x1) / 2 - w / 2
+            else:
+                left = xs[0] + 0.25 if where == "right of" else xs[0] - 0.25 - w
+            depth += 0.2
+            blocks.append({"id": f"note {len(blocks)}", "label": "\n".join(label),
+                           "box": [left, -depth - h, w, h], "color": style["card"],
+                           "border": muted, "text_color": style["text"], "size": 8})
+            touch(left, left + w)
+            depth += h + 0.1
+        elif ev[0] == "open":
+            depth += 0.25  # frames are drawn 0.2 outside their box
+            frames.append([ev[1], ev[2], depth, float("inf"), float("-inf"), []])
+            depth += 0.5
+        elif ev[0] == "else":
+            if not frames:
+                raise MermaidError(f"'{ev[1]}' outside alt, par or critical")
+            depth += 0.2
+            frames[-1][5].append((depth, ev[2]))
+            depth += 0.35
+        else:
+            if not frames:
+                raise MermaidError("'end' without loop, alt, opt, par, critical or break")
+            kind, text, top, x0, x1, separators = frames.pop()
+            depth += 0.2
+            if x0 > x1:
+                x0, x1 = x[0], x[-1]
+            x0, x1 = x0 - 0.6, x1 + 0.6
+            touch(x0, x1)
+            if kind not in ("rect", "box"):
+                groups.append({"label": f"{kind} [{text}]" if text else kind,
+                               "box": [x0, -depth, x1 - x0, depth - top], "color": muted,
+                               "size": 8})
+                for y, label in separators:
+                    lines.append({"points": [[x0 - 0.2, -y], [x1 + 0.2, -y]], "color": muted,
+                                  "dashed": True})
+                    if label:
+                        texts.append({"text": f"[{label}]", "at": [x0 + 0.05, -y - 0.18],
+                                      "color": muted, "italic": True})
+            depth += 0.35
+    if frames:
+        raise MermaidError(f"'{frames[-1][0]}' is missing its 'end'")
+
+    bottom = depth + 0.3
+    for pid, w, cx in zip(ids, widths, x):
+        label, actor = parts[pid]
+        color = "teal" if actor else "blue"
+        for y, suffix in ((0, ""), (-bottom, " (end)")):
+            blocks.append({"id": pid + suffix, "label": "\n".join(label),
+                           "box": [cx - w / 2, y - head, w, head], "color": color,
+                           "shape": "round" if actor else "rect"})
+        lines.insert(0, {"points": [[cx, -head - 0.1], [cx, -bottom + 0.1]], "color": muted,
+                         "dashed": True})
+        extent.append((cx - w / 2, cx + w / 2))
+
+    # Shift to the diagram's frame: x from the margin, y up from the bottom.
+    dx = 0.5 - min(e[0] for e in extent)
+    dy = bottom + head + 0.5
+    width = max(e[1] for e in extent) + dx + 0.5
+    for item in blocks + groups:
+        item["box"][0] += dx
+        item["box"][1] += dy
+    for e in edges:
+        e["from"] = [e["from"][0] + dx, e["from"][1] + dy]
+        e["to"] = [e["to"][0] + dx, e["to"][1] + dy]
+    for line in lines:
+        line["points"] = [[px + dx, py + dy] for px, py in line["points"]]
+    for t in texts:
+        t["at"] = [t["at"][0] + dx, t["at"][1] + dy]
+    return {"size": [round(width, 2), round(dy + 0.3, 2)],
+            "style": {"block": "fill", "border": style["background"], "edge_label": "above"},
+            "groups": groups, "blocks": blocks, "edges": edges, "lines": lines, "texts": texts}
@@ -0,0 +1,260 @@
+"""reportlab backend: render a ``Scene`` to a multi-page PDF.
+
+Each page is drawn on its own canvas into a single-page PDF, cached under
+``<cache>/pages`` by a hash of the page's nodes (and the bytes of any image
+it draws). Only pages without a cached file are drawn, one per worker
+process when there is more than one; ``pdfmerge`` then streams the pages
+into the final document, writing shared fonts and images once.
+
+TrueType fonts named in ``scene.fonts`` are registered in each process
+before drawing (``toolkit.fonts``, which caches the parsed files) and are
+embedded by reportlab as subsets holding only the glyphs a page uses; the
+font files' hashes are part of the page key.
+
+Images go through an XObject registry keyed by content hash: each distinct
+image is encoded once, pickled under ``<cache>/xobjects``, and every page
+that draws it references that one object by name. An image with a
+``vector`` PDF (a diagram saved as both, see ``toolkit.drawing.save``) is
+drawn from that instead: its page is copied in as a form XObject
+(``pdfmerge.page_form``), so the diagram stays sharp at any zoom and
+costs its vectors rather than a few hundred kilobytes of pixels.
+
+Pages are drawn in reportlab's invariant mode, dated by
+``reproducible.source_date_epoch()``, so the same scene always gives the
+same bytes.
+"""
+
+import copy
+import hashlib
+import os
+import pickle
+
+import reportlab
+from reportlab import rl_config
+from reportlab.lib.colors import HexColor
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase.pdfdoc import PDFImageXObject, PDFObject, PDFObjectReference
+from reportlab.pdfgen import canvas
+
+from .cache import cache_dir, file_hash
+from .fonts import fonts_key, register_all
+from .pdfmerge import merge, page_form, rename_refs
+from .profiling import span, traced
+from .reproducible import source_date_epoch
+from .scene import Background, Circle, Image, Rect, Text, TextBlock
+
+# Plain Flate streams; ASCII85 on top adds a quarter to every image.
+rl_config.useA85 = 0
+
+_xobjects = {}  # content key -> encoded PDFImageXObject
+_forms = {}  # content key -> page_form() of a vector image
+
+
+def _draw_text_line(c, x, ry, text, align, w):
+    if align == "center" and w:
+        c.drawCentredString(x + w / 2, ry, text)
+    elif align == "right" and w:
+        c.drawRightString(x + w, ry, text)
+    else:
+        c.drawString(x, ry, text)
+
+
+def image_xobject(path, mask="auto"):
+    """(name, encoded XObject) for the image at ``path``, encoded at most once."""
+    key = hashlib.sha256(f"{file_hash(path)}:{mask}:{reportlab.Version}:"
+                         f"{rl_config.useA85}".encode()).hexdigest()
+    obj = _xobjects.get(key)
+    if obj is None:
+        cached = os.path.join(cache_dir("xobjects"), key + ".pickle")
+        try:
+            with open(cached, "rb") as f:
+                obj = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            obj = PDFImageXObject(key[:32], ImageReader(path), mask=mask)
+            tmp = f"{cached}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cached)
+        _xobjects[key] = obj
+    return key[:32], obj
+
+
+@traced("drawImage")
+def draw_image(c, path, x, y, w, h):
+    """``canvas.drawImage`` with the encoding taken from the registry.
+
+    Mirrors what drawImage does after it has built its XObject: register the
+    object (and its soft mask) with the document once, then paint it.
+    """
+    name, proto = image_xobject(path)
+    doc = c._doc
+    reg_name = doc.getXObjectName(name)
+    if reg_name not in doc.idToObject:
+        obj = copy.copy(proto)
+        c._setXObjects(obj)
+        doc.Reference(obj, reg_name)
+        doc.addForm(name, obj)
+        smask = obj.__dict__.pop("_smask", None)
+        if smask:
+            mask_name = doc.getXObjectName(smask.name)
+            if mask_name in doc.idToObject:
+                obj.smask = PDFObjectReference(mask_name)
+            else:
+                smask = copy.copy(smask)
+                c._setXObjects(smask)
+                obj.smask = doc.Reference(smask, mask_name)
+    c._currentPageHasImages = 1
+    c.saveState()
+    c.translate(x, y)
+    c.scale(w, h)
+    c._code.append(f"/{reg_name} Do")
+    c.restoreState()
+    c._formsinuse.append(name)
+
+
+class _Copied(PDFObject):
+    """An object copied from another PDF; its references go through ``names``."""
+
+    __RefOnly__ = 1
+
+    def __init__(self, body, names):
+        self.body = body
+        self.names = names  # number in the source file -> registered name
+
+    def format(self, document):
+        return rename_refs(self.body,
+                           lambda num: PDFObjectReference(self.names[num]).format(document))
+
+
+@traced("drawVector")
+def draw_vector(c, path, x, y, w, h):
+    """Draw page 1 of the PDF at ``path`` scaled into the box, as a form XObject.
+
+    The form and the objects it uses are registered with the document
+    once; like ``draw_image``, every later use on the page paints it by name.
+    """
+    key = file_hash(path)
+    if key not in _forms:
+        with open(path, "rb") as f:
+            _forms[key] = page_form(f.read())
+    (x0, y0, x1, y1), form, objects = _forms[key]
+    name = "V" + key[:31]
+    doc = c._doc
+    reg_name = doc.getXObjectName(name)
+    if reg_name not in doc.idToObject:
+        names = {num: f"{reg_name}.{num}" for num in objects}
+        for num, body in objects.items():
+            doc.Reference(_Copied(body, names), names[num])
+        doc.Reference(_Copied(form, names), reg_name)
+    c.saveState()
+    c.translate(x, y)
+    c.scale(w / (x1 - x0), h / (y1 - y0))
+    c.translate(-x0, -y0)
+    c._code.append(f"/{reg_name} Do")
+    c.restoreState()
+    c._formsinuse.append(name)
+
+
+def draw_node(c, node, page_w, page_h):
+    """Draw one scene node onto a reportlab canvas (origin bottom-left)."""
+    if isinstance(node, Background):
+        c.setFillColor(HexColor(node.color))
+        c.rect(0, 0, page_w, page_h, fill=1, stroke=0)
+    elif isinstance(node, Rect):
+        c.setFillColor(HexColor(node.color))
+        if node.radius:
+            c.roundRect(node.x, page_h - node.y - node.h, node.w, node.h, node.radius,
+                        fill=1, stroke=0)
+        else:
+            c.rect(node.x, page_h - node.y - node.h, node.w, node.h, fill=1, stroke=0)
+    elif isinstance(node, Circle):
+        c.setFillColor(HexColor(node.color))
+        c.circle(node.cx, page_h - node.cy, node.r, fill=1, stroke=0)
+    elif isinstance(node, Text):
+        c.setFillColor(HexColor(node.color))
+        c.setFont(node.font, node.size)
+        _draw_text_line(c, node.x, page_h - node.baseline, node.text, node.align, node.w)
+    elif isinstance(node, TextBlock):
+        c.setFillColor(HexColor(node.color))
+        c.setFont(node.font, node.size)
+        baseline = node.baseline
+        for line in node.lines:
+            c.drawString(node.x, page_h - baseline, line)
+            baseline += node.line_h
+    elif isinstance(node, Image):
+        draw = draw_vector if node.vector else draw_image
+        draw(c, node.vector or node.path, node.x, page_h - node.y - node.h, node.w, node.h)
+    else:
+        raise TypeError(f"Unknown scene node: {node!r}")
+
+
+def render_page(nodes, page_w, page_h, path, page=None):
+    """Draw one page of nodes into a single-page PDF at ``path``."""
+    with span("pdf page", page=page):
+        c = canvas.Canvas(path, pagesize=(page_w, page_h), invariant=1)
+        for node in nodes:
+            draw_node(c, node, page_w, page_h)
+        c.showPage()
+        c.save()
+    return path
+
+
+def page_key(nodes, page_w, page_h, fonts=None):
+    """Cache key for one rendered page; ``fonts`` is the scene's ``{name: TTF path}``."""
+    h = hashlib.sha256()
+    h.update(f"{reportlab.Version}:{file_hash(__file__)}:{page_w}x{page_h}:"
+             f"{source_date_epoch()}:{fonts_key(fonts or {})}".encode())
+    for node in nodes:
+        h.update(repr(node).encode())
+        if isinstance(node, Image):
+            # The raster, and the vector version if the page embeds that instead.
+            h.update(file_hash(node.path).encode())
+            if node.vector:
+                h.update(b"vector:" + file_hash(node.vector).encode())
+    return h.hexdigest()
+
+
+def _render_cached(nodes, page_w, page_h, path, page=None, fonts=None):
+    register_all(fonts or {})
+    tmp = f"{path}.{os.getpid()}.tmp"
+    render_page(nodes, page_w, page_h, tmp, page)
+    os.replace(tmp, path)
+    return path
+
+
+def render_pages(scene, workers=None):
+    """Single-page PDFs of every page of ``scene``, drawing only uncached ones.
+
+    ``workers`` caps the processes used for pages that need drawing
+    (default: CPU count). Returns the cached file of each page, in order.
+    """
+    folder = cache_dir("pages")
+    page_files = [os.path.join(folder, page_key(page, scene.width, scene.height, scene.fonts)
+                               + ".pdf") for page in scene.pages]
+    todo = [(page, f, i) for i, (page, f) in enumerate(zip(scene.pages, page_files), 1)
+            if not os.path.exists(f)]
+    workers = min(len(todo), workers or os.cpu_count() or 1)
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_render_cached, *zip(*[(page, scene.width, scene.height, f, i,
+                                                   scene.fonts) for page, f, i in todo])))
+    else:
+        for page, f, i in todo:
+            _render_cached(page, scene.width, scene.height, f, i, scene.fonts)
+    return page_files
+
+
+def render(scene, path, workers=None, level=None):
+    """Write every page of ``scene`` to ``path`` (see ``render_pages``).
+
+    ``level`` has the merge recompress every Flate stream at that zlib level.
+    """
+    page_files = render_pages(scene, workers)
+    with span("pdf merge"):
+        stats = merge(page_files, path, level)
+    if stats.image_uses > len(stats.images):
+        print(f"PDF images: {len(stats.images)} embedded for {stats.image_uses} uses, "
+              f"{stats.image_bytes_saved / 1024:.0f} KB saved by sharing")
+    return path
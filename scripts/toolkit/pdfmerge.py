@@ -0,0 +1,291 @@
+"""Concatenate single-page PDFs into one document, sharing identical objects.
+
+Written for the files reportlab produces (classic xref table, one page per
+file); it is not a general PDF parser. Pages are read one file at a time and
+their objects written straight to the output, so memory use is bounded by
+the largest single page rather than the whole document.
+
+Objects are renumbered and written depth-first, dependencies before the
+objects that refer to them. An object whose renumbered bytes match one
+already written (the standard font dictionaries, an image drawn on several
+pages) is not written again; later references point at the first copy.
+
+With a zlib ``level``, every Flate stream is recompressed at that level
+on the way through (kept as it was when that is not smaller).
+
+``page_form`` reads the one page of a vector figure (what matplotlib's PDF
+backend writes) as a form XObject, for the PDF backend to draw a diagram
+as vectors rather than as a PNG.
+"""
+
+import hashlib
+import os
+import re
+import zlib
+
+_XREF_RE = re.compile(rb"startxref\s+(\d+)\s+%%EOF\s*$")
+_OBJ_HEAD_RE = re.compile(rb"^\s*(\d+)\s+0\s+obj\s*")
+_OBJ_TAIL_RE = re.compile(rb"\s*endobj\s*$")
+_STREAM_RE = re.compile(rb">>\s*stream\r?\n")
+_REF_RE = re.compile(rb"(\d+) 0 R")
+_ROOT_RE = re.compile(rb"/Root (\d+) 0 R")
+_INFO_RE = re.compile(rb"/Info (\d+) 0 R")
+_PAGES_RE = re.compile(rb"/Pages (\d+) 0 R")
+_KIDS_RE = re.compile(rb"/Kids \[([^\]]*)\]")
+_FLATE_RE = re.compile(rb"/Filter \[ /FlateDecode \]")
+_LENGTH_RE = re.compile(rb"/Length (\d+)")
+_LENGTH_REF_RE = re.compile(rb"/Length (\d+) 0 R")
+_MEDIABOX_RE = re.compile(rb"/MediaBox\s*\[([^\]]*)\]")
+_RESOURCES_RE = re.compile(rb"/Resources\s*(\d+ 0 R|<<)")
+_CONTENTS_RE = re.compile(rb"/Contents\s*(\d+) 0 R")
+_FILTER_RE = re.compile(rb"/Filter\s*(/\w+|\[[^\]]*\])")
+
+
+class PDFMergeError(ValueError):
+    """Raised for input this merger does not understand."""
+
+
+def _split(body):
+    """(dictionary part, stream part or b'') of an object body."""
+    m = _STREAM_RE.search(body)
+    if m is None:
+        return body, b""
+    return body[:m.end()], body[m.end():]
+
+
+def recompress(head, stream, level):
+    """``(head, stream)`` with a Flate stream recompressed at zlib ``level``."""
+    m = _LENGTH_RE.search(head)
+    if m is None or not _FLATE_RE.search(head) or b"/DecodeParms" in head:
+        return head, stream
+    length = int(m.group(1))
+    try:
+        packed = zlib.compress(zlib.decompress(stream[:length]), level)
+    except zlib.error:
+        return head, stream
+    if len(packed) >= length:
+        return head, stream
+    return (head[:m.start()] + b"/Length %d" % len(packed) + head[m.end():],
+            packed + stream[length:])
+
+
+def read_objects(data):
+    """Return ({number: body}, trailer) for a reportlab-style PDF."""
+    m = _XREF_RE.search(data[-64:])
+    if m is None:
+        raise PDFMergeError("no startxref")
+    xref_at = int(m.group(1))
+    lines = data[xref_at:].split(b"\n", 2)
+    if lines[0].strip() != b"xref":
+        raise PDFMergeError("cross-reference streams are not supported")
+    first, count = (int(v) for v in lines[1].split())
+    table = lines[2][:count * 20]
+    offsets = {}
+    for i in range(count):
+        entry = table[i * 20:(i + 1) * 20]
+        if entry[17:18] == b"n":
+            offsets[first + i] = int(entry[:10])
+    trailer = data[data.rindex(b"trailer"):]
+
+    ordered = sorted(offsets.items(), key=lambda kv: kv[1])
+    objects = {}
+    for idx, (num, start) in enumerate(ordered):
+        end = ordered[idx + 1][1] if idx + 1 < len(ordered) else xref_at
+        body = data[start:end]
+        body = body[_OBJ_HEAD_RE.match(body).end():]
+        objects[num] = _OBJ_TAIL_RE.sub(b"", body)
+    return objects, trailer
+
+
+def rename_refs(body, ref):
+    """``body`` with each ``N 0 R`` of its dictionary part replaced by ``ref(N)``."""
+    head, stream = _split(body)
+    return _REF_RE.sub(lambda m: ref(int(m.group(1))), head) + stream
+
+
+def _inline_dict(data, start):
+    """End of the ``<< ... >>`` dictionary that opens at ``data[start]``."""
+    depth, i = 0, start
+    while i < len(data):
+        if data.startswith(b"<<", i):
+            depth, i = depth + 1, i + 2
+        elif data.startswith(b">>", i):
+            depth, i = depth - 1, i + 2
+            if depth == 0:
+                return i
+        else:
+            i += 1
+    raise PDFMergeError("unterminated dictionary")
+
+
+def page_form(data):
+    """``(bbox, form, objects)``: the first page of a PDF as a form XObject.
+
+    ``form`` is the body of a form XObject drawing the page's content in
+    ``bbox`` (its MediaBox, a list of four numbers); it and ``objects``
+    ({number: body}, every object the form uses) refer to those objects
+    by their numbers in ``data``. Stream lengths are made direct, so no
+    length object is needed. Written for single-page files with one
+    content stream, as matplotlib saves them.
+    """
+    objects, trailer = read_objects(data)
+    root = int(_ROOT_RE.search(trailer).group(1))
+    pages = int(_PAGES_RE.search(objects[root]).group(1))
+    kids = _REF_RE.findall(_KIDS_RE.search(objects[pages]).group(1))
+    page = objects[int(kids[0])]
+    box = _MEDIABOX_RE.search(page)
+    contents = _CONTENTS_RE.search(page)
+    resources = _RESOURCES_RE.search(page)
+    if box is None or contents is None:
+        raise PDFMergeError("page without a MediaBox or a single content stream")
+    if resources is None:
+        resources = b"<< >>"
+    elif resources.group(1) == b"<<":
+        resources = page[resources.start(1):_inline_dict(page, resources.start(1))]
+    else:
+        resources = resources.group(1)
+
+    def direct(body):
+        head, stream = _split(body)
+        m = _LENGTH_REF_RE.search(head)
+        if m:
+            length = objects[int(m.group(1))].strip()
+            head = head[:m.start()] + b"/Length " + length + head[m.end():]
+        return head, stream
+
+    head, stream = direct(objects[int(contents.group(1))])
+    length = _LENGTH_RE.search(head).group(1)
+    filters = _FILTER_RE.search(head)
+    bbox = [float(v) for v in box.group(1).split()]
+    form = (b"<< /Type /XObject /Subtype /Form /FormType 1 /BBox [ %s ] /Resources %s "
+            b"/Length %s%s >>\nstream\n" % (box.group(1).strip(), resources, length,
+                                           b" /Filter " + filters.group(1) if filters else b"")
+            + stream[:int(length)] + b"\nendstream")
+
+    used, todo = {}, [int(r) for r in _REF_RE.findall(resources)]
+    while todo:
+        num = todo.pop()
+        if num in used or num not in objects:
+            continue
+        head, stream = direct(objects[num])
+        used[num] = head + stream
+        todo += [int(r) for r in _REF_RE.findall(head)]
+    return bbox, form, used
+
+
+class PDFMerger:
+    """Streaming writer: ``add_file`` per page, then ``close`` (or ``abort``)."""
+
+    def __init__(self, path, level=None):
+        self._path = path
+        self._f = open(path, "wb")
+        self._level = level
+        self._f.write(b"%PDF-1.4\n%\x93\x8c\x8b\x9e\n")
+        self._offsets = {}
+        self._next = 3  # 1 = Pages, 2 = Catalog
+        self._seen = {}  # sha256 of renumbered bytes -> object number
+        self._kids = []
+        self._info = None
+        self._id = hashlib.md5()
+        self.bytes_shared = 0
+        self.images = {}  # sha256 -> [object number, bytes]
+        self.image_uses = 0
+        self.image_bytes_saved = 0
+
+    def _write(self, num, body):
+        self._offsets[num] = self._f.tell()
+        self._f.write(b"%d 0 obj\n" % num + body + b"\nendobj\n")
+
+    def _copy(self, num, objects, mapping, share=True):
+        """Write object ``num`` and what it references; return its new number."""
+        if num in mapping:
+            if mapping[num] is None:
+                raise PDFMergeError(f"reference cycle through object {num}")
+            return mapping[num]
+        mapping[num] = None
+        head, stream = _split(objects[num])
+        for ref in sorted({int(r) for r in _REF_RE.findall(head)}):
+            if ref in objects:
+                self._copy(ref, objects, mapping)
+        head = _REF_RE.sub(lambda m: b"%d 0 R" % mapping[int(m.group(1))], head)
+        if stream and self._level is not None:
+            head, stream = recompress(head, stream, self._level)
+        body = head + stream
+
+        digest = hashlib.sha256(body).digest()
+        is_image = b"/Subtype /Image" in head
+        if is_image:
+            self.image_uses += 1
+        if share and digest in self._seen:
+            mapping[num] = self._seen[digest]
+            self.bytes_shared += len(body)
+            if is_image:
+                self.image_bytes_saved += len(body)
+            return mapping[num]
+        new = mapping[num] = self._next
+        self._next += 1
+        if share:
+            self._seen[digest] = new
+        if is_image:
+            self.images[digest] = [new, len(body)]
+        self._write(new, body)
+        return new
+
+    def add_file(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        objects, trailer = read_objects(data)
+        root = int(_ROOT_RE.search(trailer).group(1))
+        pages = int(_PAGES_RE.search(objects[root]).group(1))
+        kids = [int(k) for k in _REF_RE.findall(_KIDS_RE.search(objects[pages]).group(1))]
+        if self._info is None:
+            info = _INFO_RE.search(trailer)
+            if info:
+                self._info = self._copy(int(info.group(1)), objects, {})
+
+        mapping = {pages: 1}  # each page's /Parent becomes the merged page tree
+        for kid in kids:
+            self._kids.append(self._copy(kid, objects, mapping, share=False))
+        self._id.update(data)
+
+    def close(self):
+        kids = b" ".join(b"%d 0 R" % k for k in self._kids)
+        pages = b"<< /Count %d /Kids [ %s ] /Type /Pages >>" % (len(self._kids), kids)
+        self._write(1, pages)
+        self._write(2, b"<< /PageMode /UseNone /Pages 1 0 R /Type /Catalog >>")
+
+        size = self._next
+        xref_at = self._f.tell()
+        rows = [b"xref\n0 %d\n" % size, b"0000000000 65535 f \n"]
+        for num in range(1, size):
+            rows.append(b"%010d 00000 n \n" % self._offsets[num])
+        self._f.write(b"".join(rows))
+        digest = self._id.hexdigest().encode()
+        info = b"/Info %d 0 R " % self._info if self._info else b""
+        self._f.write(b"trailer\n<< /ID [<%s><%s>] %s/Root 2 0 R /Size %d >>\n"
+                      % (digest, digest, info, size))
+        self._f.write(b"startxref\n%d\n%%%%EOF\n" % xref_at)
+        self._f.close()
+
+    def abort(self):
+        """Close and delete the unfinished output."""
+        self._f.close()
+        os.remove(self._path)
+
+
+def merge(paths, out_path, level=None):
+    """Concatenate the pages of ``paths`` into ``out_path``; returns the merger.
+
+    The merger's ``bytes_shared``, ``images``, ``image_uses`` and
+    ``image_bytes_saved`` describe what sharing saved. ``level``
+    recompresses Flate streams (see the module docstring).
+    """
+    merger = PDFMerger(out_path, level)
+    try:
+        for p in paths:
+            merger.add_file(p)
+    except BaseException:
+        merger.abort()
+        raise
+    merger.close()
+    return merger
@@ -0,0 +1,197 @@
+"""python-pptx backend: render a ``Scene`` to a PPTX deck, one slide per page.
+
+Scene units are points, so the slide is sized to the scene exactly
+(1 pt = 12700 EMU) and every node lands where the PDF backend puts it.
+
+Slides are made from the carousel template (``toolkit.pptx_theme``), whose
+master already paints the background and whose theme supplies the font,
+white text and borderless shapes; only what differs is written per shape.
+
+Text in a TrueType family (``scene.fonts``) names that family's typeface;
+the font is not embedded, so the viewer needs it installed.
+
+Shapes are not added one ``slide.shapes.add_*`` call at a time. Each page's
+nodes are turned into ``<p:sp>``/``<p:pic>`` markup in one pass, with shape
+ids allocated as they go, parsed once and appended to the slide's shape
+tree. The markup is what python-pptx itself writes for those calls; only
+images go through python-pptx, to add their parts to the package.
+"""
+
+import os
+from xml.sax.saxutils import escape, quoteattr
+
+from pptx.dml.color import RGBColor
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+
+from .fonts import ascent, register_all
+from .profiling import span
+from .reproducible import save_presentation
+from .pptx_theme import THEMES, presentation
+from .scene import Background, Circle, Image, Rect, Text, TextBlock
+
+EMU_PER_PT = 12700
+
+# Distance from the top of a zero-inset text box to the first baseline,
+# as a fraction of the font size (Helvetica/Arial ascender; TrueType fonts
+# use their own).
+_ASCENT = 0.905
+
+_ALIGN = {"left": "l", "center": "ctr", "right": "r"}
+
+_FONT_NAME = {"Helvetica": "Helvetica", "Helvetica-Bold": "Helvetica"}
+
+THEME = THEMES["carousel"]
+
+_XFRM = '<a:xfrm><a:off x="{0}" y="{1}"/><a:ext cx="{2}" cy="{3}"/></a:xfrm>'
+
+# An autoshape as ``slide.shapes.add_shape`` writes it, filled.
+_SHAPE = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="{name} {n}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr>{xfrm}<a:prstGeom prst="{geom}"><a:avLst>{adj}</a:avLst></a:prstGeom>'
+    '<a:solidFill><a:srgbClr val="{color}"/></a:solidFill></p:spPr>'
+    '<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>'
+    '<p:txBody><a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/>'
+    '<a:p><a:pPr algn="ctr"/></a:p></p:txBody></p:sp>'
+)
+
+# A zero-inset, non-wrapping, top-anchored ``add_textbox``.
+_TEXTBOX = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="TextBox {n}"/><p:cNvSpPr txBox="1"/><p:nvPr/>'
+    '</p:nvSpPr><p:spPr>{xfrm}<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/>'
+    '</p:spPr><p:txBody><a:bodyPr wrap="none" lIns="0" rIns="0" tIns="0" bIns="0" anchor="t">'
+    '<a:spAutoFit/></a:bodyPr><a:lstStyle/><a:p><a:pPr{algn}>{spacing}{rpr}</a:pPr>{runs}</a:p>'
+    '</p:txBody></p:sp>'
+)
+
+_PICTURE = (
+    '<p:pic><p:nvPicPr><p:cNvPr id="{id}" name="Picture {n}" descr={descr}/>'
+    '<p:cNvPicPr><a:picLocks noChangeAspect="1"/></p:cNvPicPr><p:nvPr/></p:nvPicPr>'
+    '<p:blipFill><a:blip r:embed="{rid}"/><a:stretch><a:fillRect/></a:stretch></p:blipFill>'
+    '<p:spPr>{xfrm}<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr></p:pic>'
+)
+
+
+def _emu(v):
+    return int(round(v * EMU_PER_PT))
+
+
+def _xfrm(x, y, w, h):
+    return _XFRM.format(_emu(x), _emu(y), _emu(w), _emu(h))
+
+
+def _hex(color):
+    return color.lstrip("#").upper()
+
+
+def _shape(sid, name, geom, x, y, w, h, color, adj=""):
+    return _SHAPE.format(id=sid, n=sid - 1, name=name, geom=geom, adj=adj,
+                         xfrm=_xfrm(x, y, w, h), color=_hex(color))
+
+
+def _rpr(node):
+    """Paragraph run defaults: only what differs from the theme."""
+    attrs = f' sz="{int(round(node.size * 100))}"'
+    if node.font.endswith("-Bold"):
+        attrs += ' b="1"'
+    inner = ""
+    if node.color.upper() != THEME.text:
+        inner += f'<a:solidFill><a:srgbClr val="{_hex(node.color)}"/></a:solidFill>'
+    name = _FONT_NAME.get(node.font, node.font.removesuffix("-Bold"))
+    if name != THEME.font:
+        inner += f"<a:latin typeface={quoteattr(name)}/>"
+    return f"<a:defRPr{attrs}>{inner}</a:defRPr>" if inner else f"<a:defRPr{attrs}/>"
+
+
+def _runs(lines):
+    return "<a:br/>".join(f"<a:r><a:t>{escape(line)}</a:t></a:r>" if line else ""
+                          for line in lines)
+
+
+def _text(sid, node, page_w):
+    """Markup for a ``Text`` or ``TextBlock`` as a zero-inset text box."""
+    top = node.baseline - node.size * (ascent(node.font) or _ASCENT)
+    if isinstance(node, Text):
+        w = node.w if node.w is not None else page_w - node.x
+        return _TEXTBOX.format(id=sid, n=sid - 1, xfrm=_xfrm(node.x, top, w, node.size * 1.2),
+                               algn=f' algn="{_ALIGN[node.align]}"', spacing="",
+                               rpr=_rpr(node), runs=_runs([node.text]))
+    # Break where the layout broke (<a:br/>), so the slide wraps exactly like
+    # the PDF instead of re-flowing with its own metrics.
+    spacing = f'<a:lnSpc><a:spcPts val="{int(round(node.line_h * 100))}"/></a:lnSpc>'
+    return _TEXTBOX.format(id=sid, n=sid - 1,
+                           xfrm=_xfrm(node.x, top, node.w, node.line_h * len(node.lines)),
+                           algn="", spacing=spacing, rpr=_rpr(node), runs=_runs(node.lines))
+
+
+def _picture(sid, slide, node):
+    _, rid = slide.part.get_or_add_image_part(node.path)
+    return _PICTURE.format(id=sid, n=sid - 1, descr=quoteattr(os.path.basename(node.path)),
+                           rid=rid, xfrm=_xfrm(node.x, node.y, node.w, node.h))
+
+
+def slide_markup(slide, nodes, page_w, first_id):
+    """``<p:sp>``/``<p:pic>`` markup for ``nodes``, ids counting from ``first_id``.
+
+    A ``Background`` that is not the theme's is applied to the slide directly.
+    """
+    parts = []
+    sid = first_id
+    for node in nodes:
+        if isinstance(node, Background):
+            if node.color.upper() != THEME.background:
+                fill = slide.background.fill
+                fill.solid()
+                fill.fore_color.rgb = RGBColor.from_string(_hex(node.color))
+            continue
+        if isinstance(node, Rect):
+            if node.radius:
+                adj = min(0.5, node.radius / min(node.w, node.h))
+                parts.append(_shape(sid, "Rounded Rectangle", "roundRect", node.x, node.y,
+                                    node.w, node.h, node.color,
+                                    f'<a:gd name="adj" fmla="val {int(adj * 100000)}"/>'))
+            else:
+                parts.append(_shape(sid, "Rectangle", "rect", node.x, node.y, node.w, node.h,
+                                    node.color))
+        elif isinstance(node, Circle):
+            d = 2 * node.r
+            parts.append(_shape(sid, "Oval", "ellipse", node.cx - node.r, node.cy - node.r,
+                                d, d, node.color))
+        elif isinstance(node, (Text, TextBlock)):
+            with span("pptx_text"):
+                parts.append(_text(sid, node, page_w))
+        elif isinstance(node, Image):
+            with span("add_picture"):
+                parts.append(_picture(sid, slide, node))
+        else:
+            raise TypeError(f"Unknown scene node: {node!r}")
+        sid += 1
+    return "".join(parts)
+
+
+def add_nodes(slide, nodes, page_w):
+    """Append ``nodes`` to ``slide`` in one parse, after its existing shapes."""
+    tree = slide.shapes._spTree
+    first_id = max((int(i) for i in tree.xpath("//@id")), default=1) + 1
+    markup = slide_markup(slide, nodes, page_w, first_id)
+    if markup:
+        fragment = parse_xml(f'<p:spTree {nsdecls("p", "a", "r")}>{markup}</p:spTree>')
+        tree.extend(list(fragment))
+
+
+def render(scene, path):
+    """Write every page of ``scene`` to ``path`` as a slide."""
+    register_all(scene.fonts)
+    prs, blank_layout = presentation("carousel")
+    prs.slide_width = _emu(scene.width)
+    prs.slide_height = _emu(scene.height)
+    for i, page in enumerate(scene.pages, 1):
+        with span("pptx slide", page=i):
+            slide = prs.slides.add_slide(blank_layout)
+            add_nodes(slide, page, scene.width)
+    with span("pptx save"):
+        save_presentation(prs, path)
+    return path
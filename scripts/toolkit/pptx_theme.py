@@ -0,0 +1,136 @@
+"""Precompiled PPTX templates for the dark carousel and deck themes.
+
+Styling every shape property by property is most of the XML the PPTX
+builders write. A template moves the shared part into the slide master and
+theme once:
+
+- the master paints the background, so slides no longer fill their own;
+- the colour map is the dark-theme one (text on ``lt1``, background on
+  ``dk1``), so text, placeholders and shape labels default to white;
+- the theme fonts are the builder's font, so runs no longer name it;
+- the theme's first line style is "no line", which is what every shape
+  python-pptx adds refers to, so shapes no longer clear their outline;
+- the effect styles are empty, so shapes are flat like the PDF (the default
+  theme drops a shadow under every one).
+
+Each template keeps a single blank layout, named after the theme (see
+``THEMES``), and has the slide size of its format. Templates are generated
+from python-pptx's default on first use and cached under
+``<cache>/templates`` by a hash of the theme and this file.
+"""
+
+import hashlib
+import os
+from dataclasses import dataclass
+
+from .cache import cache_dir, file_hash
+
+_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+
+EMU_PER_INCH = 914400
+
+
+@dataclass(frozen=True)
+class Theme:
+    name: str
+    layout: str  # name of the template's only slide layout
+    width: int  # EMU
+    height: int  # EMU
+    background: str  # "#RRGGBB"
+    font: str
+    text: str = "#FFFFFF"
+    secondary_text: str = "#F0F0F5"
+
+
+THEMES = {
+    # 4:5 LinkedIn carousel (toolkit.carousel): 190 x 237.5 mm.
+    "carousel": Theme("Electrum Carousel", "Carousel", int(190 / 25.4 * EMU_PER_INCH),
+                      int(237.5 / 25.4 * EMU_PER_INCH), "#1A1A2E", "Helvetica"),
+    # 16:9 product overview deck (build_deck.py).
+    "deck": Theme("Electrum Deck", "Deck", int(13.333 * EMU_PER_INCH), int(7.5 * EMU_PER_INCH),
+                  "#1A1A2E", "Calibri"),
+    # 16:9 AirSense decks (build_high_level_deck.py, build_deck_sensor_hub.py).
+    "high_level": Theme("Electrum High-Level", "High-Level", int(13.333 * EMU_PER_INCH),
+                        int(7.5 * EMU_PER_INCH), "#0F172A", "Calibri"),
+}
+
+
+def _srgb(parent, hex_color):
+    for child in list(parent):
+        parent.remove(child)
+    el = parent.makeelement(f"{_A}srgbClr", {"val": hex_color.lstrip("#").upper()})
+    parent.append(el)
+
+
+def _theme_xml(blob, theme):
+    from lxml import etree
+
+    root = etree.fromstring(blob)
+    root.set("name", theme.name)
+    scheme = root.find(f"{_A}themeElements/{_A}clrScheme")
+    scheme.set("name", theme.name)
+    for slot, color in (("dk1", theme.background), ("lt1", theme.text),
+                        ("dk2", theme.background), ("lt2", theme.secondary_text)):
+        _srgb(scheme.find(f"{_A}{slot}"), color)
+    fonts = root.find(f"{_A}themeElements/{_A}fontScheme")
+    fonts.set("name", theme.name)
+    for kind in ("majorFont", "minorFont"):
+        fonts.find(f"{_A}{kind}/{_A}latin").set("typeface", theme.font)
+    line = root.find(f"{_A}themeElements/{_A}fmtScheme/{_A}lnStyleLst/{_A}ln")
+    for child in list(line):
+        line.remove(child)
+    line.append(line.makeelement(f"{_A}noFill", {}))
+    for effect in root.iterfind(f"{_A}themeElements/{_A}fmtScheme/{_A}effectStyleLst/"
+                                f"{_A}effectStyle"):
+        for child in list(effect):
+            effect.remove(child)
+        effect.append(effect.makeelement(f"{_A}effectLst", {}))
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def _build(theme, path):
+    from pptx import Presentation
+    from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+    prs = Presentation()
+    prs.slide_width = theme.width
+    prs.slide_height = theme.height
+    master = prs.slide_master
+    theme_part = master.part.part_related_by(RT.THEME)
+    theme_part._blob = _theme_xml(theme_part.blob, theme)
+
+    clr_map = master._element.find(
+        "{http://schemas.openxmlformats.org/presentationml/2006/main}clrMap")
+    clr_map.set("bg1", "dk1")
+    clr_map.set("tx1", "lt1")
+    clr_map.set("bg2", "dk2")
+    clr_map.set("tx2", "lt2")
+
+    for layout in list(prs.slide_layouts):
+        if layout.name == "Blank":
+            layout._element.cSld.set("name", theme.layout)
+        else:
+            prs.slide_layouts.remove(layout)
+    prs.save(path)
+
+
+def template(name):
+    """Path to the template for theme ``name`` (a key of ``THEMES``), built once."""
+    import pptx
+
+    theme = THEMES[name]
+    key = hashlib.sha256(f"{theme!r}:{pptx.__version__}:{file_hash(__file__)}".encode())
+    path = os.path.join(cache_dir("templates"), f"{name}-{key.hexdigest()[:16]}.pptx")
+    if not os.path.exists(path):
+        tmp = f"{path}.{os.getpid()}.tmp"
+        _build(theme, tmp)
+        os.replace(tmp, path)
+    return path
+
+
+def presentation(name):
+    """``(Presentation, layout)``: a new deck on theme ``name`` and its blank layout."""
+    from pptx import Presentation
+
+    prs = Presentation(template(name))
+    return prs, prs.slide_layouts.get_by_name(THEMES[name].layout)
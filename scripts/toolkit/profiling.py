@@ -0,0 +1,249 @@
+"""Opt-in build profiling: per-page and per-helper timings as a Chrome trace.
+
+Off unless ``ELECTRUM_PROFILE`` is set or ``--profile`` is passed, and then
+free: ``span()`` hands back a shared no-op context and ``traced`` leaves
+functions undecorated. When on, every span records its wall time and the
+net change in allocated memory blocks (``sys.getallocatedblocks``), and
+each process its peak RSS.
+
+Spans nest. Worker processes (the PDF page renderers, the PPTX backend)
+append their finished top-level spans to a per-process file; when the
+build exits, the process that turned profiling on merges them into one
+Chrome trace JSON (load it in chrome://tracing, Perfetto or speedscope)
+and prints a per-name summary. The trace goes to the path given in
+``ELECTRUM_PROFILE`` (any value other than ``1``), else to
+``<cache>/profile/<script>.trace.json``.
+
+Deck scripts that drive python-pptx directly call ``instrument_pptx()``
+(one span per slide, per ``add_shape``/``add_textbox``/``add_picture`` and
+for the save) and ``instrument(globals(), ...)`` for their own helpers.
+"""
+
+import atexit
+import contextlib
+import functools
+import json
+import os
+import sys
+import threading
+import time
+
+from .cache import cache_dir
+
+try:
+    import resource
+except ImportError:  # Windows: no RSS figures
+    resource = None
+
+_ENV = "ELECTRUM_PROFILE"
+_OWNER_ENV = "ELECTRUM_PROFILE_OWNER"
+_EVENTS_ENV = "ELECTRUM_PROFILE_EVENTS"
+
+_NULL = contextlib.nullcontext()
+_enabled = None
+_stack = []
+_done = []  # finished events of this process not yet written
+
+
+def enabled():
+    """True if this build is being profiled (checked once per process)."""
+    global _enabled
+    if _enabled is None:
+        _enabled = bool(os.environ.get(_ENV)) or "--profile" in sys.argv[1:]
+        if _enabled and os.environ.get(_OWNER_ENV) is None:
+            _start()
+    return _enabled
+
+
+def _trace_path():
+    value = os.environ.get(_ENV, "1")
+    if value != "1":
+        return os.path.abspath(value)
+    stem = os.path.splitext(os.path.basename(sys.argv[0] or "python"))[0]
+    return os.path.join(cache_dir("profile"), stem + ".trace.json")
+
+
+def _start():
+    """Make this process the owner: workers inherit the environment below."""
+    path = _trace_path()
+    os.environ[_ENV] = path
+    os.environ[_OWNER_ENV] = str(os.getpid())
+    os.environ[_EVENTS_ENV] = os.path.join(cache_dir("profile"), f"events.{os.getpid()}")
+    os.makedirs(os.environ[_EVENTS_ENV], exist_ok=True)
+    atexit.register(_finish)
+
+
+def _now_us():
+    return time.perf_counter_ns() / 1000.0
+
+
+class _Span:
+    __slots__ = ("name", "args", "ts", "blocks")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        _stack.append(self)
+        self.blocks = sys.getallocatedblocks()
+        self.ts = _now_us()
+        return self
+
+    def __exit__(self, *exc):
+        dur = _now_us() - self.ts
+        _stack.remove(self)
+        args = dict(self.args, blocks=sys.getallocatedblocks() - self.blocks)
+        _done.append({"name": self.name, "ph": "X", "ts": self.ts, "dur": dur,
+                      "pid": os.getpid(), "tid": threading.get_native_id(), "args": args})
+        if not _stack:
+            flush()
+        return False
+
+
+def _forked():
+    # A forked worker starts with none of its parent's spans.
+    _stack.clear()
+    _done.clear()
+
+
+os.register_at_fork(after_in_child=_forked)
+
+
+def span(name, **args):
+    """Context manager timing one named piece of work; a no-op when off.
+
+    Keyword arguments are stored with the event (page numbers, paths).
+    """
+    if not enabled():
+        return _NULL
+    return _Span(name, args)
+
+
+def traced(name=None):
+    """Decorator: run the function inside ``span(name)`` when profiling."""
+    def decorate(fn):
+        if not enabled():
+            return fn
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*a, **kw):
+            with _Span(label, {}):
+                return fn(*a, **kw)
+        return wrapper
+    return decorate
+
+
+def instrument(namespace, *names):
+    """Wrap the functions ``names`` of a module namespace (``globals()``) in spans."""
+    if enabled():
+        for n in names:
+            namespace[n] = traced(n)(namespace[n])
+
+
+def _peak_rss_kb():
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def flush():
+    """Append this process's finished events to its file under the events dir."""
+    if not _done:
+        return
+    rss = _peak_rss_kb()
+    if rss is not None:
+        _done.append({"name": "peak RSS", "ph": "C", "ts": _now_us(), "pid": os.getpid(),
+                      "args": {"MB": round(rss / 1024, 1)}})
+    path = os.path.join(os.environ[_EVENTS_ENV], f"{os.getpid()}.jsonl")
+    with open(path, "a") as f:
+        f.write("".join(json.dumps(e) + "\n" for e in _done))
+    _done.clear()
+
+
+def _finish():
+    if os.environ.get(_OWNER_ENV) != str(os.getpid()):
+        return
+    while _stack:  # spans left open by sys.exit()
+        _stack[-1].__exit__(None, None, None)
+    flush()
+    folder = os.environ[_EVENTS_ENV]
+    events, rss = [], {}
+    for name in sorted(os.listdir(folder)):
+        with open(os.path.join(folder, name)) as f:
+            for line in f:
+                e = json.loads(line)
+                if e["ph"] == "C":
+                    rss[e["pid"]] = max(rss.get(e["pid"], 0), e["args"]["MB"])
+                events.append(e)
+        os.remove(os.path.join(folder, name))
+    os.rmdir(folder)
+
+    owner = os.getpid()
+    for pid in sorted({e["pid"] for e in events}):
+        label = "build" if pid == owner else f"worker {pid}"
+        events.append({"name": "process_name", "ph": "M", "pid": pid,
+                       "args": {"name": label}})
+    path = os.environ[_ENV]
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    print_summary(events, rss)
+    print(f"Profile trace written to {path}")
+
+
+def print_summary(events, rss):
+    """Per-name totals of the complete events, slowest first, and peak RSS."""
+    totals = {}
+    for e in events:
+        if e["ph"] == "X":
+            t = totals.setdefault(e["name"], [0, 0.0, 0])
+            t[0] += 1
+            t[1] += e["dur"] / 1000.0
+            t[2] += e["args"].get("blocks", 0)
+    if totals:
+        width = max(len(n) for n in totals)
+        print(f"\n{'Span':<{width}}  {'Calls':>6}  {'Total':>9}  {'Mean':>8}  {'Blocks':>8}")
+        for n, (calls, ms, blocks) in sorted(totals.items(), key=lambda kv: -kv[1][1]):
+            print(f"{n:<{width}}  {calls:>6}  {ms:>7.1f}ms  {ms / calls:>6.2f}ms  {blocks:>8}")
+    if rss:
+        line = f"Peak RSS: {_peak_rss_kb() / 1024:.1f} MB build"
+        workers = [mb for pid, mb in rss.items() if pid != os.getpid()]
+        if workers:
+            line += f", {max(workers):.1f} MB largest of {len(workers)} workers"
+        print(line)
+
+
+def instrument_pptx():
+    """Span every slide and shape python-pptx adds, for scripts without a scene.
+
+    A slide's span runs from its ``add_slide`` to the next one (or exit).
+    """
+    if not enabled():
+        return
+    from pptx.presentation import Presentation
+    from pptx.shapes.shapetree import SlideShapes
+    from pptx.slide import Slides
+
+    slide = []
+
+    def end_slide():
+        if slide:
+            slide.pop().__exit__(None, None, None)
+
+    add_slide = Slides.add_slide
+
+    @functools.wraps(add_slide)
+    def wrapped(self, layout):
+        end_slide()
+        s = _Span("slide", {"slide": len(self) + 1})
+        s.__enter__()
+        slide.append(s)
+        return add_slide(self, layout)
+
+    Slides.add_slide = wrapped
+    for n in ("add_shape", "add_textbox", "add_picture"):
+        setattr(SlideShapes, n, traced(f"SlideShapes.{n}")(getattr(SlideShapes, n)))
+    Presentation.save = traced("pptx save")(Presentation.save)
+    atexit.register(end_slide)  # registered after _finish, so runs before it
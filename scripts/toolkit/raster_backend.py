@@ -0,0 +1,99 @@
+"""Raster backend: one PNG or WebP image per page, from the PDF backend's pages.
+
+``path`` is a directory; page N is written to ``page-NN.png`` (or ``.webp``)
+inside it and any other ``page-*`` image of that format left from a longer
+carousel is removed. Pages are drawn by ``pdf_backend.render_pages`` (so
+they share its page cache) and rasterised with PyMuPDF at ``width`` pixels
+across, ``WIDTH`` (1080, LinkedIn's 1080x1350 for a 4:5 page) by default.
+No office suite is involved, so this runs on a headless build box.
+
+Rasters are cached under ``<cache>/raster`` by a hash of the page PDF's
+name (itself a content hash, see ``pdf_backend.page_key``), the width, the
+format and the PyMuPDF version. Only pages without a cached raster are
+rasterised, one per worker process when there is more than one, and an
+output file whose bytes already match is left untouched.
+"""
+
+import filecmp
+import glob
+import hashlib
+import os
+import shutil
+
+from . import pdf_backend
+from .cache import cache_dir
+from .profiling import span
+
+WIDTH = 1080
+WEBP_QUALITY = 90
+
+
+def _pymupdf():
+    try:
+        import pymupdf
+    except ImportError:
+        raise SystemExit("PNG and WebP output need PyMuPDF: pip install pymupdf") from None
+    return pymupdf
+
+
+def raster_key(page_pdf, width, fmt):
+    """Cache key for one page rasterised ``width`` pixels wide as ``fmt``."""
+    pymupdf = _pymupdf()
+    return hashlib.sha256(f"{os.path.basename(page_pdf)}:{width}:{fmt}:q{WEBP_QUALITY}:"
+                          f"{pymupdf.VersionBind}".encode()).hexdigest()
+
+
+def rasterise(page_pdf, out, width, fmt, page=None):
+    """Write the single-page PDF ``page_pdf`` to ``out`` as a ``width``-pixel ``fmt`` image."""
+    pymupdf = _pymupdf()
+    tmp = f"{out}.{os.getpid()}.tmp"
+    with span(f"{fmt} page", page=page), pymupdf.open(page_pdf) as doc:
+        pdf_page = doc[0]
+        zoom = width / pdf_page.rect.width
+        pix = pdf_page.get_pixmap(matrix=pymupdf.Matrix(zoom, zoom), alpha=False)
+        if fmt == "png":
+            pix.save(tmp, output="png")
+        else:
+            from PIL import Image
+
+            im = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+            im.save(tmp, "WEBP", quality=WEBP_QUALITY, method=4)
+    os.replace(tmp, out)
+    return out
+
+
+def render(scene, path, fmt="png", width=None, workers=None):
+    """Write every page of ``scene`` as a ``fmt`` image into the directory ``path``.
+
+    ``workers`` caps the processes used for pages that need rasterising
+    (default: CPU count).
+    """
+    width = width or WIDTH
+    os.makedirs(path, exist_ok=True)
+    page_files = pdf_backend.render_pages(scene, workers)
+    folder = cache_dir("raster")
+    cached = [os.path.join(folder, f"{raster_key(f, width, fmt)}.{fmt}") for f in page_files]
+    todo = [(f, c, width, fmt, i) for i, (f, c) in enumerate(zip(page_files, cached), 1)
+            if not os.path.exists(c)]
+    workers = min(len(todo), workers or os.cpu_count() or 1)
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(rasterise, *zip(*todo)))
+    else:
+        for job in todo:
+            rasterise(*job)
+
+    wanted = set()
+    for i, c in enumerate(cached, 1):
+        out = os.path.join(path, f"page-{i:02d}.{fmt}")
+        wanted.add(out)
+        if not (os.path.exists(out) and filecmp.cmp(c, out, shallow=False)):
+            tmp = f"{out}.{os.getpid()}.tmp"
+            shutil.copyfile(c, tmp)
+            os.replace(tmp, out)
+    for stale in glob.glob(os.path.join(path, f"page-*.{fmt}")):
+        if stale not in wanted:
+            os.remove(stale)
+    return path
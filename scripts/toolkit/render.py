@@ -0,0 +1,75 @@
+"""Send a laid-out ``Scene`` to one or more backends.
+
+Layout already happened when the scene was built, so the backends are
+independent and run in separate processes. ``render_batch`` does the same
+for several scenes at once (one per aspect ratio, say), sharing the image
+preprocessing and one process pool. Scripts that call ``render``
+must keep their build behind ``if __name__ == "__main__":`` so worker
+processes can import them safely.
+"""
+
+from importlib import import_module
+import os
+
+from .images import preprocess_scenes
+from .profiling import span
+
+# format -> (backend module, its render() options); a module is imported
+# only when one of its formats is rendered.
+BACKENDS = {
+    "pdf": (".pdf_backend", {}),
+    "pptx": (".pptx_backend", {}),
+    "png": (".raster_backend", {"fmt": "png"}),
+    "webp": (".raster_backend", {"fmt": "webp"}),
+}
+RASTER_FORMATS = ("png", "webp")
+
+
+def _render_one(fmt, scene, path, raster_width=None):
+    module, options = BACKENDS[fmt]
+    if raster_width and fmt in RASTER_FORMATS:
+        options = dict(options, width=raster_width)
+    with span(f"render {fmt}"):
+        return import_module(module, __package__).render(scene, path, **options)
+
+
+def render(scene, parallel=True, image_dpi=None, raster_width=None, **outputs):
+    """Render ``scene`` to each ``format=path`` given, e.g. ``pdf=..., pptx=...``.
+
+    Images are resampled once to ``image_dpi`` (see ``toolkit.images``) and
+    the result is shared by all backends; pass ``image_dpi=0`` to embed the
+    source files untouched. ``raster_width`` is the pixel width of PNG and
+    WebP pages (default: ``raster_backend.WIDTH``). Returns ``{format: path}``.
+    """
+    return render_batch([(scene, outputs)], parallel, image_dpi, raster_width)[0]
+
+
+def render_batch(batch, parallel=True, image_dpi=None, raster_width=None):
+    """Render each ``(scene, {format: path})`` of ``batch``; returns their ``{format: path}``.
+
+    Images are preprocessed across all the scenes together, so one placed
+    in several gets a single resampled file.
+    """
+    jobs = [(i, fmt, path) for i, (_, outputs) in enumerate(batch)
+            for fmt, path in outputs.items() if path]
+    for _, fmt, _ in jobs:
+        if fmt not in BACKENDS:
+            raise ValueError(f"Unknown output format {fmt!r}; expected one of {sorted(BACKENDS)}")
+    scenes = [scene for scene, _ in batch]
+    if image_dpi != 0:
+        with span("preprocess images"):
+            scenes = preprocess_scenes(scenes, image_dpi)
+    results = [{} for _ in batch]
+    if parallel and len(jobs) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = min(len(jobs), max(2, os.cpu_count() or 1))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [(i, fmt, pool.submit(_render_one, fmt, scenes[i], path, raster_width))
+                       for i, fmt, path in jobs]
+            for i, fmt, f in futures:
+                results[i][fmt] = f.result()
+        return results
+    for i, fmt, path in jobs:
+        results[i][fmt] = _render_one(fmt, scenes[i], path, raster_width)
+    return results
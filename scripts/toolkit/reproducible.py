@@ -0,0 +1,73 @@
+"""Byte-reproducible outputs: the same inputs always give the same file.
+
+Left to themselves, reportlab stamps every PDF with the time it was made
+(and derives the document ID from it), and python-pptx writes each zip entry
+with the current time. Rebuilding an unchanged carousel would then never
+give an identical file, which defeats the page cache, ``git diff`` and
+artifact dedup.
+
+Every timestamp is taken from ``SOURCE_DATE_EPOCH`` (the reproducible-builds
+convention) when it is set, and is otherwise fixed at 2000-01-01 00:00 UTC,
+the date reportlab's own invariant mode uses:
+
+- PDFs are drawn with reportlab's ``invariant`` flag, which fixes the
+  creation date and hence the ``/ID``; ``pdfmerge`` derives the merged
+  document's ID from the page bytes.
+- PPTX files go through ``save_presentation``: the core properties get the
+  fixed date, and the package is rewritten with its entries sorted
+  (``[Content_Types].xml`` first), the fixed timestamp and one compression
+  setting.
+"""
+
+import datetime
+import io
+import os
+import zipfile
+
+INVARIANT_EPOCH = 946684800  # 2000-01-01T00:00:00Z, as reportlab's invariant mode
+_ZIP_EPOCH = 315532800  # 1980-01-01, the earliest date a zip entry can hold
+COMPRESS_LEVEL = 6
+
+
+def source_date_epoch():
+    """Seconds since the epoch to stamp outputs with (``SOURCE_DATE_EPOCH``)."""
+    value = os.environ.get("SOURCE_DATE_EPOCH", "").strip()
+    return int(value) if value else INVARIANT_EPOCH
+
+
+def source_date():
+    """``source_date_epoch()`` as an aware UTC datetime."""
+    return datetime.datetime.fromtimestamp(source_date_epoch(), datetime.timezone.utc)
+
+
+def _entry_order(name):
+    return (name != "[Content_Types].xml", name)
+
+
+def normalize_zip(data):
+    """Zip bytes ``data`` rewritten with sorted entries and fixed metadata."""
+    stamp = datetime.datetime.fromtimestamp(max(source_date_epoch(), _ZIP_EPOCH),
+                                            datetime.timezone.utc).timetuple()[:6]
+    out = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(data)) as src, \
+            zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED, compresslevel=COMPRESS_LEVEL) as dst:
+        for name in sorted(src.namelist(), key=_entry_order):
+            info = zipfile.ZipInfo(name, date_time=stamp)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.create_system = 3  # the same on every platform
+            info.external_attr = 0o644 << 16
+            dst.writestr(info, src.read(name), compresslevel=COMPRESS_LEVEL)
+    return out.getvalue()
+
+
+def save_presentation(prs, path):
+    """``prs.save(path)``, with fixed dates and a normalized zip."""
+    props = prs.core_properties
+    props.created = props.modified = source_date().replace(tzinfo=None)
+    buf = io.BytesIO()
+    prs.save(buf)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(normalize_zip(buf.getvalue()))
+    os.replace(tmp, path)
+    return path
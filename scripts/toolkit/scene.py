@@ -0,0 +1,131 @@
+"""Backend-neutral page model.
+
+A ``Scene`` is a list of pages, each page a list of drawing nodes. All
+coordinates are in points with the origin at the TOP-LEFT of the page, which
+is what the carousel scripts already think in ("y is from TOP of page").
+Backends convert to their own coordinate systems.
+
+Layout (text measurement, image fitting) happens while the scene is built, so
+every backend receives the same resolved positions.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from .images import vector_name
+
+# -- Units (points) --
+mm = 72.0 / 25.4
+inch = 72.0
+
+
+@dataclass(frozen=True)
+class Background:
+    """Full-page fill."""
+    color: str
+
+
+@dataclass(frozen=True)
+class Rect:
+    """Filled rectangle. ``radius`` > 0 gives rounded corners."""
+    x: float
+    y: float
+    w: float
+    h: float
+    color: str
+    radius: float = 0.0
+
+
+@dataclass(frozen=True)
+class Circle:
+    """Filled circle centred on (cx, cy)."""
+    cx: float
+    cy: float
+    r: float
+    color: str
+
+
+@dataclass(frozen=True)
+class Text:
+    """Single line of text.
+
+    ``baseline`` is measured from the top of the page. The text is aligned
+    inside the box [x, x + w]; ``w`` is None for unbounded left-aligned text.
+    """
+    x: float
+    baseline: float
+    text: str
+    font: str
+    size: float
+    color: str
+    align: str = "left"
+    w: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class TextBlock:
+    """Pre-broken paragraph: one entry in ``lines`` per output line."""
+    x: float
+    baseline: float
+    w: float
+    lines: Tuple[str, ...]
+    font: str
+    size: float
+    color: str
+    line_h: float
+
+    @property
+    def text(self):
+        return " ".join(self.lines)
+
+
+@dataclass(frozen=True)
+class Image:
+    """Raster image placed exactly in (x, y, w, h); aspect already resolved.
+
+    ``vector`` is a PDF of the same picture (a diagram saved as both, see
+    ``images.vector_of``); the PDF backend draws that instead of the raster.
+    """
+    path: str
+    x: float
+    y: float
+    w: float
+    h: float
+    vector: Optional[str] = None
+
+
+@dataclass
+class Scene:
+    """Multi-page document recorded as nodes.
+
+    Mirrors the reportlab canvas workflow: draw onto the current page, then
+    ``show_page()`` to finish it.
+
+    ``font`` is the family text is set in (``<font>`` and ``<font>-Bold``);
+    ``fonts`` maps each TrueType font name the nodes use to its file, for
+    the backends to register (see ``toolkit.fonts``). The standard PDF
+    fonts need no entry.
+    """
+    width: float
+    height: float
+    pages: List[list] = field(default_factory=list)
+    font: str = "Helvetica"
+    fonts: Dict[str, str] = field(default_factory=dict)
+    _current: list = field(default_factory=list, repr=False)
+
+    def add(self, node):
+        self._current.append(node)
+        return node
+
+    def show_page(self):
+        self.pages.append(self._current)
+        self._current = []
+
+    def image_paths(self):
+        """Source files of every image in the scene, sorted.
+
+        Each raster's vector version is listed whether it exists and is
+        used or not, so one appearing, changing or going stale is noticed.
+        """
+        return sorted({p for page in self.pages for n in page if isinstance(n, Image)
+                       for p in (n.path, vector_name(n.path))})
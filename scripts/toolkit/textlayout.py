@@ -0,0 +1,138 @@
+"""Memoized text measurement and greedy line breaking.
+
+Widths are built up from per-glyph advance widths rather than by measuring
+growing prefixes, so wrapping a paragraph is linear in its length. Three
+levels of caching:
+
+* glyph advances, in 1/1000 em per (font, glyph) -- advances scale linearly
+  with size, so one entry serves every size;
+* word widths per (word, font), also in 1/1000 em;
+* finished line breaks per (text, font, size, max_w), in an LRU.
+
+Widths are summed as integers in 1/1000 em and scaled once, which is exactly
+how reportlab's ``stringWidth`` computes them for the standard fonts, so the
+breaks match what the old prefix-measuring ``txt_wrap`` produced.
+
+Both backends draw the lines returned by ``wrap``; PDF and PPTX therefore
+break at the same words.
+
+``fit`` shrinks a paragraph into a box: it binary-searches the largest size
+(in ``FIT_STEP`` steps, down to a floor) whose wrapped lines fit both the
+width and the height. Wrapped height only grows with the size, so the
+search needs a handful of ``wrap`` calls, all served from the caches above.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+FIT_STEP = 0.5  # pt; fitted sizes are multiples of this (or the requested size)
+
+Fit = namedtuple("Fit", "size lines line_h overflow")
+Fit.__doc__ = """Result of ``fit``; ``overflow`` is the height in points that still
+did not fit at the smallest size (0 when it fits)."""
+
+_glyph_units = {}
+
+
+def glyph_units(ch, font):
+    """Advance width of one glyph in 1/1000 em."""
+    key = (font, ch)
+    units = _glyph_units.get(key)
+    if units is None:
+        # Imported on first use so scripts that turn out to be up to date
+        # never pay for loading reportlab.
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+        units = _glyph_units[key] = round(stringWidth(ch, font, 1000), 3)
+    return units
+
+
+@lru_cache(maxsize=16384)
+def word_units(word, font):
+    """Advance width of ``word`` in 1/1000 em."""
+    return sum(glyph_units(ch, font) for ch in word)
+
+
+def text_width(text, font, size):
+    """Width of ``text`` in points."""
+    units = sum(word_units(w, font) for w in text.split(" "))
+    return (units + glyph_units(" ", font) * text.count(" ")) * 0.001 * size
+
+
+@lru_cache(maxsize=4096)
+def wrap(text, font, size, max_w):
+    """Greedy word wrap of ``text`` into lines no wider than ``max_w`` points.
+
+    Returns a tuple of lines. A single word wider than ``max_w`` gets a line
+    of its own rather than being split.
+    """
+    scale = 0.001 * size
+    space = glyph_units(" ", font)
+    lines = []
+    current = []
+    current_units = 0
+    for word in text.split():
+        units = word_units(word, font)
+        test_units = current_units + space + units if current else units
+        if test_units * scale > max_w:
+            if current:
+                lines.append(" ".join(current))
+            current = [word]
+            current_units = units
+        else:
+            current.append(word)
+            current_units = test_units
+    if current:
+        lines.append(" ".join(current))
+    return tuple(lines)
+
+
+def _block(text, font, size, max_w, line_h):
+    lines = wrap(text, font, size, max_w)
+    too_wide = any(text_width(line, font, size) > max_w for line in lines)
+    return lines, line_h * len(lines), too_wide
+
+
+@lru_cache(maxsize=1024)
+def fit(text, font, size, max_w, max_h, line_h=None, min_size=6.0):
+    """Wrap ``text`` at the largest size <= ``size`` that fits ``max_w`` x ``max_h``.
+
+    ``line_h`` is the line pitch at ``size`` (default 1.4 x size) and scales
+    with the fitted size. Returns a ``Fit``; if the text does not fit even at
+    ``min_size`` it is laid out at ``min_size`` and ``overflow`` says by how
+    much the block is too tall (or ``max_w`` too narrow for its longest word).
+    """
+    line_h = line_h or size * 1.4
+    ratio = line_h / size
+    lines, h, too_wide = _block(text, font, size, max_w, line_h)
+    if h <= max_h and not too_wide:
+        return Fit(size, lines, line_h, 0.0)
+    lo, hi = int(min_size / FIT_STEP), int(size / FIT_STEP)  # steps; hi does not fit
+    if hi * FIT_STEP >= size:
+        hi -= 1
+    best = None
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        s = mid * FIT_STEP
+        lines, h, too_wide = _block(text, font, s, max_w, ratio * s)
+        if h <= max_h and not too_wide:
+            best = Fit(s, lines, ratio * s, 0.0)
+            lo = mid + 1
+        else:
+            hi = mid - 1
+    if best is not None:
+        return best
+    lines, h, too_wide = _block(text, font, min_size, max_w, ratio * min_size)
+    overflow = max(h - max_h, 0.0)
+    if too_wide:
+        overflow = max(overflow, max(text_width(l, font, min_size) for l in lines) - max_w)
+    return Fit(min_size, lines, ratio * min_size, overflow)
+
+
+def cache_info():
+    """Hit/miss counters for the measurement caches."""
+    return {
+        "glyphs": len(_glyph_units),
+        "words": word_units.cache_info()._asdict(),
+        "wraps": wrap.cache_info()._asdict(),
+        "fits": fit.cache_info()._asdict(),
+    }
@@ -0,0 +1,173 @@
+"""File watching for ``build_all.py --watch``: which files changed, debounced.
+
+``watcher(dirs)`` watches every directory under ``dirs`` and returns an
+object whose ``changes()`` blocks until something changed, then keeps
+collecting until no event has arrived for ``DEBOUNCE_S`` (an editor's
+save is often a write, a rename and a delete in quick succession), and
+returns the set of changed file paths.
+
+On Linux the kernel's inotify is used directly through ``ctypes``, so
+nothing needs installing and a change is seen as soon as the file is
+closed. Elsewhere, or if inotify is unavailable (or ``poll=True``), the
+tree is re-scanned every ``POLL_S`` seconds and compared by size and
+mtime.
+
+Hidden files and directories, ``__pycache__``, editor backups and the
+``*.tmp`` files the builds write before renaming are never reported.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+
+DEBOUNCE_S = 0.1
+POLL_S = 0.5
+
+_SKIP_DIRS = ("__pycache__",)
+
+# inotify(7) event bits.
+_IN_CLOSE_WRITE = 0x8
+_IN_MOVED_FROM = 0x40
+_IN_MOVED_TO = 0x80
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_MASK = _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_EVENT = struct.Struct("iIII")
+
+
+def ignored(path):
+    """True for files no build reads: hidden, backups, partial writes."""
+    name = os.path.basename(path)
+    return (name.startswith((".", "#")) or name.endswith(("~", ".tmp", ".swp", ".pyc"))
+            or any(part in _SKIP_DIRS for part in path.split(os.sep)))
+
+
+def _walk(dirs):
+    """Every directory under ``dirs`` that may hold inputs."""
+    for root in dirs:
+        for folder, subdirs, _ in os.walk(root):
+            subdirs[:] = [d for d in subdirs if not d.startswith(".") and d not in _SKIP_DIRS]
+            yield folder
+
+
+class _Debouncer:
+    """Shared ``changes()`` loop: block for the first event, then drain until quiet."""
+
+    def changes(self, timeout=None):
+        """Changed paths, once no further event has arrived for ``DEBOUNCE_S``.
+
+        Returns an empty set if nothing changed within ``timeout`` seconds.
+        """
+        changed = set(self._read(timeout))
+        while changed:
+            more = self._read(DEBOUNCE_S)
+            if not more:
+                break
+            changed.update(more)
+        return {p for p in changed if not ignored(p)}
+
+
+class InotifyWatcher(_Debouncer):
+    """Linux inotify on every directory under ``dirs`` (new ones included)."""
+
+    def __init__(self, dirs):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._libc = libc
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs = {}  # watch descriptor -> directory
+        for folder in _walk(dirs):
+            self._add(folder)
+
+    def _add(self, folder):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(folder), _MASK)
+        if wd >= 0:
+            self._dirs[wd] = folder
+
+    def _read(self, timeout):
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self._fd, 1 << 16)
+        except BlockingIOError:
+            return []
+        paths = []
+        pos = 0
+        while pos < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, pos)
+            pos += _EVENT.size
+            name = os.fsdecode(data[pos:pos + length].rstrip(b"\0"))
+            pos += length
+            folder = self._dirs.get(wd)
+            if folder is None or not name:
+                continue
+            path = os.path.join(folder, name)
+            if mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO) and not ignored(path):
+                    for sub in _walk([path]):
+                        self._add(sub)
+                continue
+            paths.append(path)
+        return paths
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingWatcher(_Debouncer):
+    """Re-scan ``dirs`` every ``POLL_S`` seconds, comparing size and mtime."""
+
+    def __init__(self, dirs):
+        self._roots = list(dirs)
+        self._snapshot = self._scan()
+
+    def _scan(self):
+        files = {}
+        for folder in _walk(self._roots):
+            try:
+                entries = os.scandir(folder)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            st = entry.stat()
+                            files[entry.path] = (st.st_size, st.st_mtime_ns)
+                    except OSError:
+                        continue
+        return files
+
+    def _read(self, timeout):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = POLL_S if deadline is None else min(POLL_S, deadline - time.monotonic())
+            if wait > 0:
+                time.sleep(wait)
+            current = self._scan()
+            old, self._snapshot = self._snapshot, current
+            changed = [p for p in current.keys() | old.keys() if current.get(p) != old.get(p)]
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        pass
+
+
+def watcher(dirs, poll=False):
+    """An ``InotifyWatcher`` for ``dirs`` where the platform has one, else a ``PollingWatcher``."""
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(dirs)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(dirs)
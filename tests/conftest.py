@@ -0,0 +1,15 @@
+"""The scripts import ``toolkit`` from ``scripts/``; so do the tests."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "scripts"))
+
+
+@pytest.fixture(autouse=True)
+def cache(tmp_path, monkeypatch):
+    """A build cache of the test's own, so renders are not served from the repo's."""
+    monkeypatch.setenv("ELECTRUM_CACHE_DIR", str(tmp_path / "cache"))
@@ -0,0 +1,20 @@
+from toolkit import budget
+from toolkit.scene import Image, Scene
+
+
+def _scene(*images):
+    scene = Scene(100, 100)
+    for image in images:
+        scene.add(image)
+    scene.show_page()
+    return scene
+
+
+def test_vector_only_scene_tries_stream_steps():
+    scene = _scene(Image("d.png", 0, 0, 10, 10, vector="d.pdf"))
+    assert [budget.describe(s) for s in budget.steps(scene)] == ["zlib level 9"]
+
+
+def test_raster_scene_tries_every_step():
+    scene = _scene(Image("d.png", 0, 0, 10, 10, vector="d.pdf"), Image("p.png", 0, 0, 10, 10))
+    assert budget.steps(scene) is budget.STEPS
@@ -0,0 +1,18 @@
+import os
+
+import matplotlib
+import pytest
+from reportlab.pdfbase import ttfonts
+
+from toolkit import fonts
+
+FONT = os.path.join(matplotlib.get_data_path(), "fonts", "ttf", "DejaVuSans.ttf")
+
+
+@pytest.mark.parametrize("unshaped", [[], ["Brand*"]])
+def test_load_matches_ttfont(unshaped, monkeypatch):
+    monkeypatch.setattr(ttfonts, "unShapedFontGlob", unshaped)
+    cached, parsed = fonts.load("Brand", FONT), ttfonts.TTFont("Brand", FONT)
+    assert sorted(vars(cached)) == sorted(vars(parsed))
+    assert cached.shapable == parsed.shapable
+    assert cached.stringWidth("Hello", 10) == parsed.stringWidth("Hello", 10)
@@ -0,0 +1,27 @@
+import os
+
+from toolkit import drawing, images
+
+
+def _figure():
+    fig = drawing.figure(figsize=(2, 1))
+    fig.add_subplot().plot([0, 1], [0, 1])
+    return fig
+
+
+def test_vector_of_follows_content(tmp_path):
+    png = str(tmp_path / "diagram.png")
+    drawing.save(_figure(), png)
+    assert images.vector_of(png) == images.vector_name(png)
+
+    os.utime(images.vector_name(png), (0, 0))  # mtimes do not matter
+    assert images.vector_of(png) == images.vector_name(png)
+
+    _figure().savefig(png, dpi=50)  # other pixels: the PDF is stale
+    assert images.vector_of(png) is None
+
+
+def test_vector_of_without_twin(tmp_path):
+    png = str(tmp_path / "photo.png")
+    _figure().savefig(png)
+    assert images.vector_of(png) is None
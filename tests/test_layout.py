@@ -0,0 +1,23 @@
+import pytest
+
+from toolkit import diagram, layout
+
+
+@pytest.mark.parametrize("nodes", [["a"], ["a", "b"]])
+@pytest.mark.parametrize("direction", layout.DIRECTIONS)
+def test_layered_without_edges(nodes, direction):
+    result = layout.layered(nodes, [], direction=direction)
+    assert result.routes == []
+    assert set(result.boxes) == set(nodes)
+    assert result.width > 0 and result.height > 0
+
+
+def test_auto_layout_without_edges(tmp_path):
+    spec = tmp_path / "block_diagram.yaml"
+    spec.write_text("output: block_diagram.png\n"
+                    "blocks:\n"
+                    "  - {id: mcu, label: MCU}\n"
+                    "  - {id: adc, label: ADC}\n"
+                    "edges: []\n")
+    diagram.render(diagram.load(str(spec)))
+    assert (tmp_path / "block_diagram.png").read_bytes().startswith(b"\x89PNG")
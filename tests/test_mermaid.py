@@ -0,0 +1,26 @@
+import pytest
+
+from toolkit import diagram, mermaid
+
+
+@pytest.mark.parametrize("source", [
+    "flowchart LR\n  A[Only node]",
+    "stateDiagram-v2\n  Idle",
+])
+def test_diagram_without_links(source, tmp_path):
+    spec = mermaid.to_spec(source, "dark")
+    assert not spec.get("edges")
+    out = diagram.render(spec, str(tmp_path / "diagram.png"))
+    assert open(out, "rb").read().startswith(b"\x89PNG")
+
+
+def test_semicolon_separated_statements():
+    spec = mermaid.to_spec("graph TD; A-->B; B-->C;", "dark")
+    assert [b["id"] for b in spec["blocks"]] == ["A", "B", "C"]
+    assert [(e["from"], e["to"]) for e in spec["edges"]] == [("A", "B"), ("B", "C")]
+
+
+@pytest.mark.parametrize("source", ["flowchart LR", "graph TD;"])
+def test_flowchart_without_nodes(source):
+    with pytest.raises(mermaid.MermaidError, match="needs a node"):
+        mermaid.to_spec(source, "dark")
@@ -0,0 +1,19 @@
+import pytest
+
+from toolkit import pdfmerge
+
+
+def test_failed_merge_leaves_no_output(tmp_path):
+    bad = tmp_path / "bad.pdf"
+    bad.write_bytes(b"not a pdf")
+    out = tmp_path / "out.pdf"
+    with pytest.raises(pdfmerge.PDFMergeError):
+        pdfmerge.merge([str(bad)], str(out))
+    assert not out.exists()
+
+
+def test_missing_input_is_reported(tmp_path):
+    out = tmp_path / "out.pdf"
+    with pytest.raises(FileNotFoundError):
+        pdfmerge.merge([str(tmp_path / "missing.pdf")], str(out))
+    assert not out.exists()